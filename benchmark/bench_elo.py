@@ -0,0 +1,61 @@
+"""
+Benchmark du recalcul des classements Elo sur un historique de parties : lecture des matchs sauvegardés en périodes
+de classement, puis calcul en python pur et, si numpy est installé, en passes vectorisées.
+
+Exécution : python -m benchmark.bench_elo [nombre_de_partie]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Dict, Iterator, List
+
+from chess_manager.M import elo_rating
+
+NBR_OF_GAME = 1_000_000
+NBR_OF_PLAYER = 20_000
+NBR_OF_GAME_BY_PERIOD = 1000
+
+
+def _iter_match_data_periods(nbr_of_game: int) -> Iterator[List[Dict]]:
+    """Génère l'historique par période, les matchs sauvegardés n'étant jamais tous en mémoire"""
+    game_random = random.Random(0)
+    player_id_list = list(range(1, NBR_OF_PLAYER + 1))
+    for period_start in range(0, nbr_of_game, NBR_OF_GAME_BY_PERIOD):
+        match_data_list = list()
+        for _ in range(min(NBR_OF_GAME_BY_PERIOD, nbr_of_game - period_start)):
+            player_1, player_2 = game_random.sample(player_id_list, 2)
+            winner = game_random.choice([player_1, player_2, False])
+            match_data_list.append({'player_1': player_1, 'player_1_score': 0, 'player_2': player_2,
+                                    'player_2_score': 0, 'winner': winner, 'match_id': -1})
+        yield match_data_list
+
+
+def run(nbr_of_game: int = NBR_OF_GAME) -> None:
+    index_by_player_id = dict()
+    start = time.perf_counter()
+    rating_periods = elo_rating.get_rating_periods(_iter_match_data_periods(nbr_of_game), index_by_player_id)
+    print(f"{nbr_of_game} games, {len(index_by_player_id)} players : history generated and read in "
+          f"{len(rating_periods)} rating periods in {time.perf_counter() - start:.2f}s")
+
+    initial_ratings = len(index_by_player_id) * [elo_rating.DEFAULT_RATING]
+    start = time.perf_counter()
+    python_ratings = elo_rating.compute_ratings(rating_periods, initial_ratings, use_numpy=False)
+    python_time = time.perf_counter() - start
+    print(f"  pure python : {python_time:.2f}s ({python_time / nbr_of_game * 1e6:.2f}us/game)")
+
+    if elo_rating.numpy is None:
+        print("  numpy : not installed")
+        return
+    start = time.perf_counter()
+    numpy_ratings = elo_rating.compute_ratings(rating_periods, initial_ratings, use_numpy=True)
+    numpy_time = time.perf_counter() - start
+    max_diff = max(abs(python_rating - numpy_rating)
+                   for python_rating, numpy_rating in zip(python_ratings, numpy_ratings))
+    print(f"  numpy       : {numpy_time:.2f}s ({numpy_time / nbr_of_game * 1e6:.2f}us/game, "
+          f"x{python_time / numpy_time:.1f}), max rating difference {max_diff:.1e}")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,95 @@
+"""
+Benchmark de bout en bout d'un tournoi de 9 rondes rejoué sans terminal (voir chessmanager_headless.py) : création des
+joueurs et du tournoi par formulaires, inscription des joueurs, saisie de tous les résultats puis classement final,
+chaque action passant par le menu et le messenger comme dans l'application. Durée totale et écritures en base de
+donnée pour chaque module de sauvegarde.
+
+Exécution : python -m benchmark.bench_headless_tournament [nombre_de_joueur] [fichier_script]
+Si un fichier est précisé, le script généré y est enregistré en jsonl, rejouable avec
+python chessmanager_headless.py fichier_script
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import sys
+import tempfile
+from typing import Dict, List
+
+NBR_OF_PLAYER = 10
+NBR_OF_ROUND = 9
+BACKENDS = ('tinydb', 'sqlite', 'journal')
+
+
+def _get_player_form(player_nbr: int) -> Dict:
+    # Les noms de joueur ne peuvent pas contenir de chiffre
+    letters = f"{chr(97 + player_nbr // 26 % 26)}{chr(97 + player_nbr % 26)}"
+    return {'first_name': f'First{letters}', 'last_name': f'Last{letters}', 'birthday': '01/01/2000',
+            'ine': f'AB{player_nbr:05d}'}
+
+
+def _get_player_str(player_form: Dict) -> str:
+    return f"{player_form['last_name'].upper()} {player_form['first_name'].capitalize()} ({player_form['ine']})"
+
+
+def get_tournament_script(nbr_of_player: int = NBR_OF_PLAYER, nbr_of_round: int = NBR_OF_ROUND) -> List[Dict]:
+    """
+    Retourne le script d'un tournoi complet pour un nombre pair de joueurs : chaque match est gagné par le premier
+    joueur ou nul, tiré au hasard à graine fixe
+    """
+    from data.config import NBR_OF_PLAYER_TO_DISPLAY_BY_PAGE
+
+    result_random = random.Random(0)
+    player_forms = [_get_player_form(player_nbr) for player_nbr in range(nbr_of_player)]
+    script = list()
+    for player_form in player_forms:
+        script.extend([{'select': 'NEW_PLAYER'}, {'form': player_form}])
+
+    script.append({'select': 'NEW_TOURNAMENT'})
+    script.append({'form': {'name': 'Headless', 'place': 'Here', 'description': 'Headless benchmark',
+                            'turn_nbr': nbr_of_round, 'player_nbr': nbr_of_player, 'pairing_engine': 'dutch'}})
+    script.append({'select': 'ADD_PLAYER'})
+    for player_nbr, player_form in enumerate(player_forms):
+        # Les joueurs inscrits disparaissent de la page, une page entièrement inscrite laisse place à la suivante
+        if player_nbr and not player_nbr % NBR_OF_PLAYER_TO_DISPLAY_BY_PAGE:
+            script.append({'select': 'NEXT_PLAYER_PAGE'})
+        script.append({'select': _get_player_str(player_form)})
+
+    script.extend([{'select': 'RESUME_TOURNAMENT'}, {'expect': 'Round1'}, {'contains': '(on going)'}])
+    for _ in range(nbr_of_round):
+        for _ in range(nbr_of_player // 2):
+            script.append({'start': 'GOING'})
+            script.append(result_random.choice([{'start': 'Set', 'end': 'Winner'}, {'select': 'Set draw'}]))
+            script.append({'select': 'BACK_TO_MATCH_LIST'})
+        script.append({'select': 'NEXT_TURN'})
+
+    script.extend([{'expect': 'Ended'}, {'select': 'MAIN_MENU'}, {'select': 'VIEW_TOURNAMENT_LIST'},
+                   {'start': 'FINISHED'}, {'select': 'TOURNAMENT_RANKING'}, {'expect': '1 :'}])
+    return script
+
+
+def run(nbr_of_player: int = NBR_OF_PLAYER, script_path: str | None = None) -> None:
+    import chessmanager_headless
+    from data import config
+
+    script = get_tournament_script(nbr_of_player)
+    if script_path is not None:
+        with open(script_path, 'w', encoding='utf-8') as script_file:
+            script_file.writelines(f"{json.dumps(step)}\n" for step in script)
+
+    default_backend = config.DB_BACKEND
+    for backend in BACKENDS:
+        random.seed(0)
+        config.DB_BACKEND = backend
+        with tempfile.TemporaryDirectory() as working_dir:
+            os.chdir(working_dir)
+            result = chessmanager_headless.run_script(script)
+            os.chdir(os.path.dirname(working_dir))
+        print(f"{backend:<8}: {nbr_of_player} players, {NBR_OF_ROUND} rounds, {result['nbr_of_step']} steps in "
+              f"{result['time'] * 1000:.1f}ms, {result['nbr_of_write']} write(s)")
+    config.DB_BACKEND = default_backend
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]], *sys.argv[2:3])
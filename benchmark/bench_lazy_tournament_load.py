@@ -0,0 +1,92 @@
+"""
+Benchmark du chargement d'un tournoi archivé de 15 rondes : nombre de joueurs, tours et matchs lus depuis la base de
+donnée et temps d'ouverture, relations chargées avec le tournoi contre relations chargées à la demande.
+
+Deux écrans sont mesurés, chacun depuis un cache vide : l'en-tête du tournoi seul, puis l'écran du tournoi complet
+(en-tête et podium, classé par les scores cumulés du dernier tour : seule cette ronde est lue).
+
+Exécution : python -m benchmark.bench_lazy_tournament_load [nombre_de_joueur] [nombre_de_ronde]
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+from benchmark.bench_navigation_writes import _create_tournament, _is_event, _is_str_event, _play_turns, _select
+
+NBR_OF_PLAYER = 16
+NBR_OF_ROUND = 15
+LOADER_READS = ('load_players', 'load_turns', 'load_matches')
+
+
+def _count_loader_reads(loader, nbr_of_entry_by_read: Dict) -> None:
+    """Remplace les lectures par liste d'ids du loader par des lectures comptant les entrées demandées"""
+    for read_name in LOADER_READS:
+        loader_read = getattr(loader, read_name)
+
+        def counted_read(entry_id_list, read_name=read_name, loader_read=loader_read):
+            nbr_of_entry_by_read[read_name] += len(entry_id_list)
+            return loader_read(entry_id_list)
+        setattr(loader, read_name, counted_read)
+
+
+def _open_header(app, tournament_controller, tournament_id: int) -> None:
+    tournament = tournament_controller.load_tournament_by_tournament_id(tournament_id)
+    tournament_controller.display_tournament(tournament)
+
+
+def _open_screen(app, tournament_controller, tournament_id: int) -> None:
+    from data.config import AppInput
+
+    _select(app, _is_event(AppInput.VIEW_TOURNAMENT_LIST))
+    _select(app, _is_str_event(start='FINISHED'))
+
+
+def _measure(open_func: Callable, tournament_id: int) -> tuple:
+    import chessmanager_main
+    from data.config import AppInput
+
+    app = chessmanager_main.ChessManager()
+    tournament_controller = app.messenger.ori_event_dict[AppInput.SET_TOURNAMENT_ACTIV][0].__self__
+    nbr_of_entry_by_read = {read_name: 0 for read_name in LOADER_READS}
+    _count_loader_reads(app.loader, nbr_of_entry_by_read)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        open_func(app, tournament_controller, tournament_id)
+        app.main_v.flip_display()
+    return nbr_of_entry_by_read, time.perf_counter() - start
+
+
+def run(nbr_of_player: int = NBR_OF_PLAYER, nbr_of_round: int = NBR_OF_ROUND) -> None:
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as working_dir:
+        os.chdir(working_dir)
+        import chessmanager_main
+        from data import config
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = chessmanager_main.ChessManager()
+            _create_tournament(app, nbr_of_player, 'dutch', nbr_of_round)
+            _play_turns(app, nbr_of_round)
+        tournament_id = app.loader.load_tournament_summaries(None, 1)[0]['tournament_id']
+
+        lazy_relations = config.LAZY_TOURNAMENT_RELATIONS
+        for label, open_func in (("Tournament header", _open_header), ("Tournament screen", _open_screen)):
+            for loading, relations in (("eager", ()), ("lazy", lazy_relations)):
+                config.LAZY_TOURNAMENT_RELATIONS = relations
+                nbr_of_entry_by_read, elapsed = _measure(open_func, tournament_id)
+                print(f"{label:<18} {loading:<5}: {nbr_of_entry_by_read['load_players']:>4} player(s), "
+                      f"{nbr_of_entry_by_read['load_turns']:>3} turn(s), "
+                      f"{nbr_of_entry_by_read['load_matches']:>5} match(es) read in {elapsed * 1000:.2f}ms")
+        config.LAZY_TOURNAMENT_RELATIONS = lazy_relations
+        os.chdir(os.path.dirname(working_dir))
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:3]])
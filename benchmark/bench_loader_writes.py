@@ -0,0 +1,62 @@
+"""
+Benchmark du nombre d'écritures de fichier réalisées par le loader lors de la création de nouveaux matchs.
+
+Exécution : python -m benchmark.bench_loader_writes [nombre_de_match]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from typing import Dict
+
+NBR_OF_MATCH = 100
+
+
+def _new_match_data() -> Dict:
+    return {"player_1": 1, "player_1_score": 0, "player_2": 2, "player_2_score": 0, "winner": None, "match_id": -1}
+
+
+def _legacy_save_match(working_database, match_data: Dict) -> int:
+    """Ancien chemin de sauvegarde : insertion puis mise à jour immédiate pour inscrire l'id."""
+    if not working_database.contains(doc_id=match_data.get('match_id', -1)):
+        match_data['match_id'] = working_database.insert(match_data)
+    working_database.update(match_data, doc_ids=[match_data['match_id']])
+    return match_data['match_id']
+
+
+def _report(label: str, nbr_of_match: int, nbr_of_write: int, elapsed: float) -> None:
+    print(f"{label:<28}: {nbr_of_write / nbr_of_match:.2f} write(s) per new match, {elapsed:.3f}s")
+
+
+def run(nbr_of_match: int = NBR_OF_MATCH) -> None:
+    with tempfile.TemporaryDirectory() as working_dir:
+        os.chdir(working_dir)
+        from core import tinydb_loader
+        from data import config
+
+        loader = tinydb_loader.TinyDBLoader()
+        working_database = loader.get_db_handle(config.MATCH_DB_NAME)
+
+        write_before, start = loader.get_nbr_of_write(), time.perf_counter()
+        for _ in range(nbr_of_match):
+            _legacy_save_match(working_database, _new_match_data())
+        _report("insert + update", nbr_of_match, loader.get_nbr_of_write() - write_before,
+                time.perf_counter() - start)
+
+        write_before, start = loader.get_nbr_of_write(), time.perf_counter()
+        for _ in range(nbr_of_match):
+            loader.save_match(_new_match_data())
+        _report("upsert", nbr_of_match, loader.get_nbr_of_write() - write_before, time.perf_counter() - start)
+
+        write_before, start = loader.get_nbr_of_write(), time.perf_counter()
+        with loader.unit_of_work():
+            for _ in range(nbr_of_match):
+                loader.save_match(_new_match_data())
+        _report("upsert in a unit of work", nbr_of_match, loader.get_nbr_of_write() - write_before,
+                time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,106 @@
+"""
+Benchmark de 10 000 cycles de menu du messenger : à chaque cycle, les événements de l'écran précédent sont ignorés,
+les événements du menu et une liste de noms générés (joueurs, tournois, tours, matchs) sont acceptés, le menu est
+lu puis un événement est exécuté. Les noms changent à chaque cycle, comme ceux des matchs au fil des résultats.
+
+Ancien messenger (liste des événements disponibles, noms générés conservés indéfiniment) contre messenger actuel
+(ensemble des événements disponibles, noms générés propres à l'écran en cours).
+
+Exécution : python -m benchmark.bench_messenger [nombre_de_cycle]
+"""
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+from core import messenger
+from data.config import AppInput
+
+NBR_OF_CYCLE = 10_000
+# Le coût d'un cycle de l'ancien messenger croît avec le nombre de cycles, il n'est mesuré que sur les premiers
+LEGACY_NBR_OF_CYCLE = 2_000
+NBR_OF_LABEL_BY_SCREEN = 20
+NBR_OF_REPORT = 4
+MENU_EVENTS = (AppInput.VIEW_TOURNAMENT_LIST, AppInput.NEXT_TOURNAMENT_PAGE, AppInput.MAIN_MENU, AppInput.QUIT)
+
+
+class LegacyMessenger(messenger.Messenger):
+    """Messenger avant l'utilisation d'ensembles : événements disponibles en liste, noms générés jamais retirés"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.allowed_event = list()
+
+    def accept_event(self, event, event_arg: List | None = None, call_event=False) -> None:
+        self.allowed_event.append(event)
+        if not call_event:
+            call_event = self.ori_event_dict.get(event)
+        self.in_use_event_dict[event] = call_event
+        if event_arg is not None:
+            self.in_use_event_dict[event][2] = event_arg
+
+    def ignore_event(self, event) -> None:
+        if event not in self.allowed_event:
+            return
+        self.allowed_event.remove(event)
+
+    def ignore_all(self, keep: List | None = None) -> None:
+        self.allowed_event.clear()
+        self.in_use_event_dict.clear()
+
+    def get_allowed_event_and_str(self) -> Dict:
+        return {event_str: event for event_str, event in self.event_str_dict.items() if
+                (event in self.allowed_event or event_str in self.allowed_event)}
+
+    def update_event(self, event, new_func=None, new_func_arg=None, new_str=None, make_copy=False):
+        to_update_event = super().update_event(event, new_func, new_func_arg, None, make_copy)
+        if new_str is not None:
+            self.event_str_dict[new_str] = new_str
+        return to_update_event
+
+
+def _get_messenger(messenger_cls) -> messenger.Messenger:
+    app_messenger = messenger_cls()
+    for event in MENU_EVENTS:
+        app_messenger.register_call_event(event, lambda *args: None, event.name)
+    app_messenger.register_call_event(AppInput.SET_MATCH_ACTIV, lambda *args: None, "Match")
+    return app_messenger
+
+
+def _run_menu_cycle(app_messenger: messenger.Messenger, cycle_nbr: int) -> None:
+    app_messenger.ignore_all()
+    for event in MENU_EVENTS:
+        app_messenger.accept_event(event)
+    for label_nbr in range(NBR_OF_LABEL_BY_SCREEN):
+        label = f"GOING : Match {cycle_nbr}-{label_nbr}"
+        event_call = app_messenger.update_event(AppInput.SET_MATCH_ACTIV, new_str=label, make_copy=True)
+        app_messenger.accept_event(label, call_event=event_call, event_arg=[label_nbr])
+    allowed = app_messenger.get_allowed_event_and_str()
+    app_messenger.handle_event(allowed[f"GOING : Match {cycle_nbr}-0"])
+
+
+def run(nbr_of_cycle: int = NBR_OF_CYCLE) -> None:
+    for label, messenger_cls, messenger_nbr_of_cycle in (
+            ("list messenger", LegacyMessenger, min(nbr_of_cycle, LEGACY_NBR_OF_CYCLE)),
+            ("set messenger", messenger.Messenger, nbr_of_cycle)):
+        app_messenger = _get_messenger(messenger_cls)
+        report_every = max(1, messenger_nbr_of_cycle // NBR_OF_REPORT)
+        tracemalloc.start()
+        start = time.perf_counter()
+        for cycle_nbr in range(1, messenger_nbr_of_cycle + 1):
+            _run_menu_cycle(app_messenger, cycle_nbr)
+            if cycle_nbr % report_every:
+                continue
+            elapsed = time.perf_counter() - start
+            print(f"{label:<15} cycles {cycle_nbr - report_every + 1:>6}-{cycle_nbr:<6}: "
+                  f"{elapsed / report_every * 1e6:8.1f}us/cycle, "
+                  f"{len(app_messenger.event_str_dict) + len(getattr(app_messenger, 'temp_event_str_dict', ())):>6} "
+                  f"name(s), {tracemalloc.get_traced_memory()[0] / 1024:8.1f}KB allocated")
+            start = time.perf_counter()
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
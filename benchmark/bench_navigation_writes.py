@@ -0,0 +1,120 @@
+"""
+Benchmark du nombre d'écritures en base de donnée provoquées par la simple navigation dans un tournoi en cours
+(liste des tournois, tournoi, tours, matchs, détails et classement).
+
+Exécution : python -m benchmark.bench_navigation_writes [nombre_de_joueur]
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+from typing import Callable
+
+NBR_OF_PLAYER = 8
+NBR_OF_TURN = 4
+NBR_OF_PLAYED_TURN = 2
+
+
+def _get_allowed_event(app, predicate: Callable):
+    """Retourne le premier événement disponible et nommé respectant le prédicat, None s'il n'y en a pas"""
+    for event_str, event in app.messenger.get_allowed_event_and_str().items():
+        if predicate(event_str, event):
+            return event
+    return None
+
+
+def _select(app, predicate: Callable) -> int:
+    event = _get_allowed_event(app, predicate)
+    if event is None:
+        raise RuntimeError("Navigation event not available")
+    return app.handle_user_input(event)
+
+
+def _is_event(app_input) -> Callable:
+    return lambda event_str, event: event == app_input
+
+
+def _is_str_event(start: str = '', contains: str = '') -> Callable:
+    return lambda event_str, event: isinstance(event, str) and event.startswith(start) and contains in event
+
+
+def _create_tournament(app, nbr_of_player: int, pairing_engine: str = '', nbr_of_turn: int = NBR_OF_TURN) -> None:
+    """Crée les joueurs et le tournoi puis y inscrit les joueurs, le moteur d'appariement par défaut si non précisé"""
+    from data.config import AppInput
+
+    for player_nbr in range(nbr_of_player):
+        app.loader.save_player({'first_name': f'First{chr(97 + player_nbr % 26)}',
+                                'last_name': f'Last{chr(97 + player_nbr % 26)}',
+                                'birthday': '01/01/2000', 'ine': f'AB{player_nbr:05d}'})
+
+    app.main_v.get_form_answer = lambda form, validators=None: {
+        'name': 'Bench', 'place': 'Here', 'description': 'Navigation benchmark',
+        'turn_nbr': str(nbr_of_turn), 'player_nbr': str(nbr_of_player), 'pairing_engine': pairing_engine}
+    app.handle_user_input(AppInput.NEW_TOURNAMENT)
+    while _get_allowed_event(app, _is_event(AppInput.RESUME_TOURNAMENT)) is None:
+        if _get_allowed_event(app, _is_event(AppInput.ADD_PLAYER)) is not None:
+            _select(app, _is_event(AppInput.ADD_PLAYER))
+        # Les joueurs déjà inscrits n'apparaissent plus dans la page affichée
+        if _get_allowed_event(app, _is_str_event()) is None:
+            _select(app, _is_event(AppInput.NEXT_PLAYER_PAGE))
+            continue
+        _select(app, _is_str_event())
+
+
+def _play_turns(app, nbr_of_turn: int) -> None:
+    """Reprend le tournoi et joue tous les matchs des 'nbr_of_turn' premiers tours"""
+    from data.config import AppInput
+
+    _select(app, _is_event(AppInput.RESUME_TOURNAMENT))
+    _select(app, _is_str_event(contains='(on going)'))
+    played_turn = 0
+    while played_turn < nbr_of_turn:
+        if _get_allowed_event(app, _is_event(AppInput.NEXT_TURN)) is not None:
+            _select(app, _is_event(AppInput.NEXT_TURN))
+            played_turn += 1
+            continue
+        _select(app, _is_str_event(start='GOING'))
+        _select(app, lambda event_str, event: event_str.endswith('Winner') or event_str == 'Set draw')
+        _select(app, _is_event(AppInput.BACK_TO_MATCH_LIST))
+
+
+def run(nbr_of_player: int = NBR_OF_PLAYER) -> None:
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as working_dir:
+        os.chdir(working_dir)
+        import chessmanager_main
+        from data.config import AppInput
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = chessmanager_main.ChessManager()
+            _create_tournament(app, nbr_of_player)
+            _play_turns(app, NBR_OF_PLAYED_TURN)
+
+            app.set_to_main_menu()
+            navigation = [
+                ("Tournament list", _is_event(AppInput.VIEW_TOURNAMENT_LIST)),
+                ("Tournament", _is_str_event(start='ON GOING')),
+                ("Tournament details", _is_event(AppInput.TOURNAMENT_DETAILS)),
+                ("Tournament ranking", _is_event(AppInput.TOURNAMENT_RANKING)),
+                ("Turn list", _is_event(AppInput.RESUME_TOURNAMENT)),
+                ("Turn", _is_str_event(contains='(Finished)')),
+                ("Match", _is_str_event(start='FINISHED')),
+                ("Match list", _is_event(AppInput.BACK_TO_MATCH_LIST)),
+                ("Turn list", _is_event(AppInput.BACK_TO_TURN_LIST)),
+                ("Tournament", _is_event(AppInput.SET_TOURNAMENT_ACTIV)),
+            ]
+            nbr_of_write_by_step = [(label, _select(app, predicate)) for label, predicate in navigation]
+
+        for label, nbr_of_write in nbr_of_write_by_step:
+            print(f"{label:<20}: {nbr_of_write} write(s)")
+        total_nbr_of_write = sum(nbr_of_write for _, nbr_of_write in nbr_of_write_by_step)
+        print(f"{'Total':<20}: {total_nbr_of_write} write(s) for {len(nbr_of_write_by_step)} navigation(s)")
+        os.chdir(os.path.dirname(working_dir))
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,69 @@
+"""
+Benchmark de l'attente au passage au tour suivant (NEXT_TURN) sur un grand tournoi : appariement calculé à la
+demande contre appariement calculé en arrière-plan dès la saisie du dernier résultat du tour.
+
+Exécution : python -m benchmark.bench_next_turn [moteur] [nombre_de_joueur]
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+from core import messenger
+from chess_manager.C import tournament_controller
+from chess_manager.M import match_model, player_model, tournament_model, turn_model
+
+NBR_OF_PLAYER = 2000
+NBR_OF_ROUND = 5
+# Temps laissé à l'arbitre entre la saisie du dernier résultat et le passage au tour suivant
+OPERATOR_DELAY = 2.
+
+
+def _play_turn(tournament: tournament_model.TournamentM, player_pairs, round_nbr: int, result_random) -> None:
+    turn = turn_model.TurnM(f'Round{round_nbr + 1}')
+    for player_1_data, player_2_data in player_pairs:
+        turn.register_match(match_model.MatchM(player_1_data[0], player_1_data[1],
+                                               player_2_data[0], player_2_data[1]))
+    tournament.register_turn(turn)
+    for match in turn.match_list:
+        match.end_match(result_random.choice([match.player_1, match.player_2, None]))
+
+
+def _get_tournament(engine_name: str, nbr_of_player: int) -> tournament_model.TournamentM:
+    random.seed(0)
+    players = [player_model.PlayerM('First', f'Last{player_id}', '01/01/2000', f'AB{player_id % 100000:05d}',
+                                    player_id=player_id)
+               for player_id in range(1, nbr_of_player + 1)]
+    return tournament_model.TournamentM('Bench', 'Here', turn_nbr=NBR_OF_ROUND, player_nbr=nbr_of_player,
+                                        players=players, pairing_engine=engine_name)
+
+
+def run(engine_name: str = 'dutch', nbr_of_player: int = NBR_OF_PLAYER) -> None:
+    controller = tournament_controller.TournamentC(None, None, messenger.Messenger())
+    sync_times, precomputed_times = list(), list()
+
+    for use_precomputation, next_turn_times in ((False, sync_times), (True, precomputed_times)):
+        tournament = _get_tournament(engine_name, nbr_of_player)
+        result_random = random.Random(1)
+        for round_nbr in range(NBR_OF_ROUND):
+            if use_precomputation and tournament.turn_list:
+                # Le dernier résultat du tour vient d'être saisi
+                controller.watch_turn_results(tournament)
+                time.sleep(OPERATOR_DELAY)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                player_pairs = controller.get_next_turn_player_pair(tournament)
+            if round_nbr:
+                next_turn_times.append(time.perf_counter() - start)
+            _play_turn(tournament, player_pairs, round_nbr, result_random)
+
+    print(f"{engine_name} - {nbr_of_player} players, {NBR_OF_ROUND} rounds : next turn pairing wait "
+          f"{sum(sync_times) / len(sync_times) * 1000:.2f}ms computed on demand, "
+          f"{sum(precomputed_times) / len(precomputed_times) * 1000:.2f}ms precomputed in background")
+
+
+if __name__ == "__main__":
+    run(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,115 @@
+"""
+Benchmark du coût d'une ronde d'appariement glouton en fonction du nombre de joueurs : historique des adversaires en
+liste d'objets joueurs comparés champ par champ (ancienne représentation), en ensemble d'ids par joueur, puis en
+bits d'adversaires de TournamentState lus par tournament_model._make_player_pair.
+
+Exécution : python -m benchmark.bench_pairing [nombre_de_joueur_max]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List
+
+from chess_manager.M import player_model, tournament_model, tournament_state
+
+PLAYER_COUNTS = [16, 64, 256, 1024]
+NBR_OF_ROUND = 7
+FIRST_NAMES = ['Anna', 'Boris', 'Carla', 'David', 'Emma', 'Felix', 'Gina', 'Hugo']
+LAST_NAMES = ['Martin', 'Bernard', 'Dubois', 'Thomas', 'Robert', 'Richard', 'Petit', 'Durand']
+
+
+@dataclass
+class LegacyPlayerM:
+    """Ancienne représentation : égalité générée par dataclass et historique des adversaires en liste d'objets"""
+    first_name: str
+    last_name: str
+    birthday: str
+    ine: str
+    already_played_against: List = field(default_factory=list)
+    player_id: int = -1
+
+    def has_played_against(self, other_player: LegacyPlayerM) -> bool:
+        return other_player in self.already_played_against
+
+    def add_opponent(self, other_player: LegacyPlayerM) -> None:
+        self.already_played_against.append(other_player)
+
+    def clear_player_pairing(self) -> None:
+        self.already_played_against.clear()
+
+
+def _get_players(player_class: Callable, nbr_of_player: int) -> List:
+    # Un petit nombre de noms : comme dans un vrai tournoi, des joueurs partagent un prénom et un nom
+    name_random = random.Random(nbr_of_player)
+    return [player_class(first_name=name_random.choice(FIRST_NAMES), last_name=name_random.choice(LAST_NAMES),
+                         birthday='01/01/2000', ine=f'AB{player_id:05d}', player_id=player_id)
+            for player_id in range(1, nbr_of_player + 1)]
+
+
+def _make_player_object_pair(ordered_player_data: List) -> List:
+    """Appariement glouton lisant l'historique des adversaires dans les objets joueurs (ancienne version)"""
+    player_pairs = list()
+    working_list = ordered_player_data[:]
+
+    adversary_index = 0
+    current_pairing_player = working_list.pop(0)
+
+    while len(working_list) > 0:
+        if current_pairing_player[0].has_played_against(working_list[adversary_index][0]):
+            adversary_index += 1
+            if adversary_index >= len(working_list):
+                for player_data in ordered_player_data:
+                    player_data[0].clear_player_pairing()
+                return _make_player_object_pair(ordered_player_data)
+            continue
+        player_pairs.append((current_pairing_player, working_list.pop(adversary_index)))
+        adversary_index = 0
+
+        if len(working_list) < 1:
+            break
+        current_pairing_player = working_list.pop(0)
+    return player_pairs
+
+
+def _play_rounds(player_class: Callable, nbr_of_player: int, use_state: bool = False) -> float:
+    """
+    Joue NBR_OF_ROUND rondes aux résultats aléatoires et retourne le temps moyen d'appariement d'une ronde.
+    L'historique des adversaires est lu dans l'état du tournoi si 'use_state', sinon dans les objets joueurs.
+    """
+    result_random = random.Random(0)
+    player_data = [[player, 0] for player in _get_players(player_class, nbr_of_player)]
+    state = tournament_state.TournamentState([player_data[0].player_id for player_data in player_data])
+    pairing_time = 0
+    for _ in range(NBR_OF_ROUND):
+        ordered_player_data = tournament_model._order_player_by_score(player_data)
+        start = time.perf_counter()
+        if use_state:
+            player_pairs = tournament_model._make_player_pair(ordered_player_data, state)
+        else:
+            player_pairs = _make_player_object_pair(ordered_player_data)
+        pairing_time += time.perf_counter() - start
+
+        for player_1_data, player_2_data in player_pairs:
+            player_1_data[0].add_opponent(player_2_data[0])
+            player_2_data[0].add_opponent(player_1_data[0])
+            state.add_game(player_1_data[0].player_id, player_2_data[0].player_id)
+            player_1_data[1] += result_random.choice([0, .5, 1])
+            player_2_data[1] += result_random.choice([0, .5, 1])
+    return pairing_time / NBR_OF_ROUND
+
+
+def run(max_nbr_of_player: int = PLAYER_COUNTS[-1]) -> None:
+    for nbr_of_player in [count for count in PLAYER_COUNTS if count <= max_nbr_of_player]:
+        legacy_time = _play_rounds(LegacyPlayerM, nbr_of_player)
+        id_set_time = _play_rounds(player_model.PlayerM, nbr_of_player)
+        bits_time = _play_rounds(player_model.PlayerM, nbr_of_player, use_state=True)
+        print(f"{nbr_of_player:>5} players : list of players {legacy_time * 1000:9.2f}ms/round, "
+              f"set of ids {id_set_time * 1000:8.2f}ms/round (x{legacy_time / id_set_time:.1f}), "
+              f"state bits {bits_time * 1000:8.2f}ms/round (x{legacy_time / bits_time:.1f})")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
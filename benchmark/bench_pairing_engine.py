@@ -0,0 +1,65 @@
+"""
+Benchmark des moteurs d'appariement de tournament_model : temps par ronde, revanches et réinitialisations de
+l'historique des adversaires sur des rondes aux résultats aléatoires.
+
+Exécution : python -m benchmark.bench_pairing_engine [nombre_de_joueur_max] [nombre_de_ronde]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Tuple
+
+from chess_manager.M import player_model, tournament_model, tournament_state
+
+PLAYER_COUNTS = [16, 64, 256, 1000, 2000, 5000]
+NBR_OF_ROUND = 7
+
+
+def _play_rounds(engine_name: str, nbr_of_player: int, nbr_of_round: int) -> Tuple[float, float, int, int]:
+    """
+    Joue 'nbr_of_round' rondes aux résultats aléatoires avec le moteur d'appariement reçu, retourne le temps moyen et
+    le temps maximum d'appariement d'une ronde, le nombre de revanches et le nombre de réinitialisations de
+    l'historique des adversaires.
+    """
+    make_player_pair = tournament_model.PAIRING_ENGINES[engine_name]
+    result_random = random.Random(0)
+    player_data = [[player_model.PlayerM('First', f'Last{player_id}', '01/01/2000', f'AB{player_id:05d}',
+                                         player_id=player_id), 0]
+                   for player_id in range(1, nbr_of_player + 1)]
+    state = tournament_state.TournamentState(list(range(1, nbr_of_player + 1)))
+    played_pairs = set()
+    pairing_times = list()
+    nbr_of_rematch = 0
+
+    for _ in range(nbr_of_round):
+        ordered_player_data = tournament_model._order_player_by_score(player_data)
+        start = time.perf_counter()
+        player_pairs = make_player_pair(ordered_player_data, state)
+        pairing_times.append(time.perf_counter() - start)
+
+        for player_1_data, player_2_data in player_pairs:
+            player_1, player_2 = player_1_data[0], player_2_data[0]
+            pair_key = frozenset((player_1.player_id, player_2.player_id))
+            nbr_of_rematch += pair_key in played_pairs
+            played_pairs.add(pair_key)
+            state.add_game(player_1.player_id, player_2.player_id)
+            player_1_result = result_random.choice([0, .5, 1])
+            player_1_data[1] += player_1_result
+            player_2_data[1] += 1 - player_1_result
+    # L'appariement glouton efface les adversaires rencontrés de l'état reçu à chaque réinitialisation
+    return sum(pairing_times) / nbr_of_round, max(pairing_times), nbr_of_rematch, state.nbr_of_opponent_reset
+
+
+def run(max_nbr_of_player: int = PLAYER_COUNTS[-1], nbr_of_round: int = NBR_OF_ROUND) -> None:
+    for nbr_of_player in [count for count in PLAYER_COUNTS if count <= max_nbr_of_player]:
+        for engine_name in tournament_model.PAIRING_ENGINES:
+            mean_time, max_time, nbr_of_rematch, nbr_of_reset = _play_rounds(engine_name, nbr_of_player,
+                                                                             nbr_of_round)
+            print(f"{nbr_of_player:>5} players, {engine_name:<8}: {mean_time * 1000:9.2f}ms/round "
+                  f"(max {max_time * 1000:9.2f}ms), {nbr_of_rematch} rematch(es), {nbr_of_reset} history reset(s)")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:3]])
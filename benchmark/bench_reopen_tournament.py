@@ -0,0 +1,70 @@
+"""
+Benchmark de régression de la réouverture d'un tournoi en cours : le tournoi est rouvert 100 fois depuis la liste
+des tournois, un chargement sur deux repartant de la base de donnée (cache des objets vidé). La taille de
+l'historique des adversaires, la mémoire allouée et le temps d'appariement du tour suivant doivent rester stables.
+
+Exécution : python -m benchmark.bench_reopen_tournament [nombre_de_joueur] [nombre_de_réouverture]
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmark.bench_navigation_writes import NBR_OF_TURN, _create_tournament, _is_event, _is_str_event, \
+    _play_turns, _select
+
+NBR_OF_PLAYER = 40
+NBR_OF_REOPEN = 100
+# Le moteur glouton réinitialise l'historique des adversaires dès qu'il bloque, le moteur suisse le conserve
+PAIRING_ENGINE = 'dutch'
+REPORTED_REOPENS = (1, 10, 50, 100)
+
+
+def run(nbr_of_player: int = NBR_OF_PLAYER, nbr_of_reopen: int = NBR_OF_REOPEN) -> None:
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as working_dir:
+        os.chdir(working_dir)
+        import chessmanager_main
+        from data.config import AppInput, TOURNAMENT_DB_NAME
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = chessmanager_main.ChessManager()
+            _create_tournament(app, nbr_of_player, PAIRING_ENGINE)
+            _play_turns(app, NBR_OF_TURN - 1)
+
+        tracemalloc.start()
+        for reopen_nbr in range(1, nbr_of_reopen + 1):
+            if reopen_nbr % 2:
+                app.loader.identity_map.clear()
+            with contextlib.redirect_stdout(io.StringIO()):
+                app.set_to_main_menu()
+                _select(app, _is_event(AppInput.VIEW_TOURNAMENT_LIST))
+                _select(app, _is_str_event(start='ON GOING'))
+                # Comme dans la boucle principale, l'affichage est vidé après chaque action
+                app.main_v.flip_display()
+            if reopen_nbr not in REPORTED_REOPENS:
+                continue
+
+            tournament_id = next(iter(app.loader.identity_map.objects_by_db[TOURNAMENT_DB_NAME]))
+            tournament = app.loader.identity_map.get(TOURNAMENT_DB_NAME, tournament_id)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                tournament.get_next_turn_player_pair()
+            pairing_time = time.perf_counter() - start
+            # L'historique des adversaires est reconstruit au premier appariement suivant le chargement
+            nbr_of_opponent = sum(len(player.already_played_against) for player in tournament.players)
+            print(f"reopen {reopen_nbr:>4} : {nbr_of_opponent} opponent entries, "
+                  f"{tracemalloc.get_traced_memory()[0] / 1024:8.1f}KB allocated, "
+                  f"pairing {pairing_time * 1000:.2f}ms")
+        tracemalloc.stop()
+        os.chdir(os.path.dirname(working_dir))
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,82 @@
+"""
+Benchmark du classement d'un tournoi : podium et ordre d'appariement reconstruits à partir des données du dernier
+tour (tri de tout le tableau à chaque demande) contre classement incrémental tenu à jour par les résultats des matchs.
+
+Exécution : python -m benchmark.bench_standings [nombre_de_joueur_max]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Tuple
+
+from chess_manager.M import match_model, player_model, tournament_model, turn_model
+
+PLAYER_COUNTS = [64, 256, 1000, 5000]
+NBR_OF_ROUND = 7
+PODIUM_SIZE = 3
+
+
+def _play_tournament(nbr_of_player: int, incremental: bool) -> Tuple[float, float]:
+    """
+    Joue NBR_OF_ROUND rondes aux résultats aléatoires en affichant le podium après chaque résultat, retourne le
+    temps moyen d'un résultat suivi d'une demande de podium et le temps moyen de mise en ordre des joueurs pour
+    l'appariement.
+    """
+    result_random = random.Random(0)
+    players = [player_model.PlayerM('First', f'Last{player_id}', '01/01/2000', f'AB{player_id:05d}',
+                                    player_id=player_id)
+               for player_id in range(1, nbr_of_player + 1)]
+    tournament = tournament_model.TournamentM('Bench', 'Here', turn_nbr=NBR_OF_ROUND, player_nbr=nbr_of_player,
+                                              players=players, pairing_engine='dutch')
+    podium_time, nbr_of_podium, ordering_time = 0, 0, 0
+
+    for round_nbr in range(NBR_OF_ROUND):
+        start = time.perf_counter()
+        if not tournament.turn_list:
+            ordered_player_data = [[player, 0] for player in players]
+        elif incremental:
+            ordered_player_data = tournament.get_standings().get_ordered_player_data()
+        else:
+            ordered_player_data = tournament_model._order_player_by_score(tournament.turn_list[-1].get_turn_data())
+        ordering_time += time.perf_counter() - start
+
+        turn = turn_model.TurnM(f'Round{round_nbr + 1}')
+        for player_1_data, player_2_data in tournament_model.pairing_engine.make_dutch_player_pair(
+                ordered_player_data, tournament.get_pairing_state()):
+            turn.register_match(match_model.MatchM(player_1_data[0], player_1_data[1],
+                                                   player_2_data[0], player_2_data[1]))
+        # L'enregistrement du tour met à jour le classement incrémental (ordre de départage), il est compris dans
+        # la mesure
+        start = time.perf_counter()
+        tournament.register_turn(turn)
+        ordering_time += time.perf_counter() - start
+
+        for match in turn.match_list:
+            winner = result_random.choice([match.player_1, match.player_2, None])
+            # La mise à jour du classement incrémental par le résultat est comprise dans la mesure
+            start = time.perf_counter()
+            match.end_match(winner)
+            if incremental:
+                tournament.get_standings().get_top(PODIUM_SIZE)
+            else:
+                sorted(turn.get_turn_data(), key=lambda turn_player_data: turn_player_data[1],
+                       reverse=True)[:PODIUM_SIZE]
+            podium_time += time.perf_counter() - start
+            nbr_of_podium += 1
+    return podium_time / nbr_of_podium, ordering_time / NBR_OF_ROUND
+
+
+def run(max_nbr_of_player: int = PLAYER_COUNTS[-1]) -> None:
+    for nbr_of_player in [count for count in PLAYER_COUNTS if count <= max_nbr_of_player]:
+        rebuilt_podium, rebuilt_ordering = _play_tournament(nbr_of_player, incremental=False)
+        incremental_podium, incremental_ordering = _play_tournament(nbr_of_player, incremental=True)
+        print(f"{nbr_of_player:>5} players : podium {rebuilt_podium * 1000:8.3f}ms rebuilt, "
+              f"{incremental_podium * 1000:8.3f}ms incremental (x{rebuilt_podium / incremental_podium:.0f}) - "
+              f"new turn + pairing order {rebuilt_ordering * 1000:7.2f}ms rebuilt, "
+              f"{incremental_ordering * 1000:7.2f}ms incremental")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
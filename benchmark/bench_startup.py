@@ -0,0 +1,125 @@
+"""
+Benchmark du temps de démarrage de l'application (construction de ChessManager jusqu'au menu principal) en fonction
+de la taille de l'archive de tournois enregistrés.
+
+Exécution : python -m benchmark.bench_startup [backend] [nombre_de_tournoi_max]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+ARCHIVE_SIZES = [0, 100, 1000, 5000]
+NBR_OF_PLAYER_BY_TOURNAMENT = 8
+NBR_OF_TURN_BY_TOURNAMENT = 4
+NBR_OF_RUN = 5
+
+
+def _get_archive(nbr_of_tournament: int) -> Dict[str, List[Dict]]:
+    """
+    Génère les entrées de chaque base de donnée pour une archive de tournois terminés. Les ids sont attribués dans
+    l'ordre des listes, à partir de 1.
+    """
+    players, matches, turns, tournaments = list(), list(), list(), list()
+    for tournament_nbr in range(nbr_of_tournament):
+        player_id_list = list()
+        for _ in range(NBR_OF_PLAYER_BY_TOURNAMENT):
+            players.append({'first_name': 'First', 'last_name': f'Last{len(players)}', 'birthday': '01/01/2000',
+                            'ine': f'AB{len(players) % 100000:05d}', 'player_id': len(players) + 1})
+            player_id_list.append(len(players))
+
+        turn_id_list = list()
+        for turn_nbr in range(NBR_OF_TURN_BY_TOURNAMENT):
+            match_id_list = list()
+            for player_1, player_2 in zip(player_id_list[::2], player_id_list[1::2]):
+                matches.append({'player_1': player_1, 'player_1_score': turn_nbr + 1, 'player_2': player_2,
+                                'player_2_score': turn_nbr, 'winner': player_1, 'match_id': len(matches) + 1})
+                match_id_list.append(len(matches))
+            turns.append({'name': f'Round{turn_nbr + 1}', 'start_time': '01/01/22 10:00',
+                          'end_time': '01/01/22 11:00', 'match_list': match_id_list, 'turn_id': len(turns) + 1})
+            turn_id_list.append(len(turns))
+
+        tournaments.append({'name': f'Tournament{tournament_nbr}', 'place': 'Here', 'description': 'Archive',
+                            'turn_nbr': NBR_OF_TURN_BY_TOURNAMENT, 'player_nbr': NBR_OF_PLAYER_BY_TOURNAMENT,
+                            'players': player_id_list, 'turn_list': turn_id_list, 'start_date': '01/01/22 10:00',
+                            'end_date': '01/01/22 18:00', 'tournament_id': len(tournaments) + 1})
+
+    from data import config
+    return {config.PLAYER_DB_NAME: players, config.MATCH_DB_NAME: matches,
+            config.TURN_DB_NAME: turns, config.TOURNAMENT_DB_NAME: tournaments}
+
+
+def _write_archive(backend: str, archive: Dict[str, List[Dict]]) -> None:
+    """Écrit l'archive dans le répertoire de sauvegarde du répertoire courant au format du backend"""
+    from core import tinydb_loader, sqlite_loader, journal_loader
+    from data import config
+
+    if backend == 'sqlite':
+        loader = sqlite_loader.SQLiteLoader()
+        save_func_by_db = {config.PLAYER_DB_NAME: loader.save_player, config.MATCH_DB_NAME: loader.save_match,
+                           config.TURN_DB_NAME: loader.save_turn, config.TOURNAMENT_DB_NAME: loader.save_tournament}
+        with loader.unit_of_work():
+            for db_name, entries in archive.items():
+                for entry in entries:
+                    save_func_by_db[db_name]({**entry, journal_loader.ID_KEY_BY_DB[db_name]: -1})
+        loader.connection.close()
+        return
+
+    # Les fichiers tinydb et les journaux sont écrits directement : l'insertion entrée par entrée dans tinydb
+    # relit la table complète à chaque appel.
+    for db_name, entries in archive.items():
+        id_key = journal_loader.ID_KEY_BY_DB[db_name]
+        if backend == 'journal':
+            file_path = journal_loader.get_file_path_from_name(db_name)
+            lines = [json.dumps({'id': entry[id_key], 'data': entry}, sort_keys=True) for entry in entries]
+        else:
+            file_path = tinydb_loader.get_file_path_from_name(db_name)
+            lines = [json.dumps({'_default': {str(entry[id_key]): entry for entry in entries}})]
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as db_file:
+            db_file.write(''.join(f"{line}\n" for line in lines))
+
+
+def _measure_startup() -> Tuple[float, float]:
+    """
+    Retourne le meilleur temps de construction de l'application sur NBR_OF_RUN essais, ainsi que le temps
+    d'affichage de la première page de la liste des tournois (première ouverture de la base des tournois).
+    """
+    import chessmanager_main
+    from data import config
+
+    best_time = None
+    for _ in range(NBR_OF_RUN):
+        start = time.perf_counter()
+        app = chessmanager_main.ChessManager()
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    start = time.perf_counter()
+    app.loader.load_tournament_summaries(None, config.NBR_OF_TOURNAMENT_TO_DISPLAY_BY_PAGE)
+    return best_time, time.perf_counter() - start
+
+
+def run(backend: str = 'tinydb', max_nbr_of_tournament: int = ARCHIVE_SIZES[-1]) -> None:
+    start_dir = os.getcwd()
+    from data import config
+    config.DB_BACKEND = backend
+
+    for nbr_of_tournament in [size for size in ARCHIVE_SIZES if size <= max_nbr_of_tournament]:
+        with tempfile.TemporaryDirectory() as working_dir:
+            os.chdir(working_dir)
+            archive = _get_archive(nbr_of_tournament)
+            _write_archive(backend, archive)
+            startup_time, first_list_time = _measure_startup()
+            nbr_of_entry = sum(len(entries) for entries in archive.values())
+            print(f"{backend} - {nbr_of_tournament:>6} tournament(s), {nbr_of_entry:>7} entries : "
+                  f"startup {startup_time * 1000:.2f}ms, first tournament list {first_list_time * 1000:.2f}ms")
+            os.chdir(start_dir)
+
+
+if __name__ == "__main__":
+    run(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,78 @@
+"""
+Benchmark du classement complet départagé (Buchholz, Buchholz médian, Sonneborn-Berger, score progressif) après
+chaque résultat : départages recalculés depuis l'historique des matchs contre sommes tenues en cache par le
+classement incrémental du tournoi.
+
+Exécution : python -m benchmark.bench_tie_break [nombre_de_joueur_max]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import List
+
+from chess_manager.M import match_model, player_model, tie_break, tournament_model, turn_model
+
+PLAYER_COUNTS = [100, 500, 1000]
+NBR_OF_ROUND = 7
+# Nombre de résultats mesurés par ronde, répartis sur la ronde
+NBR_OF_MEASURE_BY_ROUND = 20
+
+
+def _get_recomputed_ranking(tournament: tournament_model.TournamentM) -> List:
+    """Classement complet avec des départages recalculés à partir de tous les matchs du tournoi"""
+    recomputed_tie_breaks = tie_break.TieBreaks()
+    for turn in tournament.turn_list:
+        recomputed_tie_breaks.record_turn(turn)
+    return recomputed_tie_breaks.sort_player_data(tournament.get_standings().get_ordered_player_data())
+
+
+def _play_tournament(nbr_of_player: int, cached: bool) -> float:
+    """
+    Joue NBR_OF_ROUND rondes aux résultats aléatoires, retourne le temps moyen d'un résultat suivi du calcul du
+    classement complet départagé.
+    """
+    result_random = random.Random(0)
+    players = [player_model.PlayerM('First', f'Last{player_id}', '01/01/2000', f'AB{player_id:05d}',
+                                    player_id=player_id)
+               for player_id in range(1, nbr_of_player + 1)]
+    tournament = tournament_model.TournamentM('Bench', 'Here', turn_nbr=NBR_OF_ROUND, player_nbr=nbr_of_player,
+                                              players=players, pairing_engine='dutch')
+    tournament.get_standings()
+    ranking_time, nbr_of_ranking = 0, 0
+
+    for round_nbr in range(NBR_OF_ROUND):
+        turn = turn_model.TurnM(f'Round{round_nbr + 1}')
+        for player_1_data, player_2_data in tournament.get_next_turn_player_pair():
+            turn.register_match(match_model.MatchM(player_1_data[0], player_1_data[1],
+                                                   player_2_data[0], player_2_data[1]))
+        tournament.register_turn(turn)
+
+        measure_step = max(1, len(turn.match_list) // NBR_OF_MEASURE_BY_ROUND)
+        for match_index, match in enumerate(turn.match_list):
+            winner = result_random.choice([match.player_1, match.player_2, None])
+            if match_index % measure_step:
+                match.end_match(winner)
+                continue
+            start = time.perf_counter()
+            match.end_match(winner)
+            if cached:
+                tournament.get_standings().get_ranking()
+            else:
+                _get_recomputed_ranking(tournament)
+            ranking_time += time.perf_counter() - start
+            nbr_of_ranking += 1
+    return ranking_time / nbr_of_ranking
+
+
+def run(max_nbr_of_player: int = PLAYER_COUNTS[-1]) -> None:
+    for nbr_of_player in [count for count in PLAYER_COUNTS if count <= max_nbr_of_player]:
+        recomputed_time = _play_tournament(nbr_of_player, cached=False)
+        cached_time = _play_tournament(nbr_of_player, cached=True)
+        print(f"{nbr_of_player:>5} players : full ranking after a result {recomputed_time * 1000:8.2f}ms "
+              f"recomputed, {cached_time * 1000:8.2f}ms cached (x{recomputed_time / cached_time:.1f})")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
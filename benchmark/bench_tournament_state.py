@@ -0,0 +1,101 @@
+"""
+Benchmark des données lues par l'appariement : équilibre des couleurs recalculé en parcourant tous les matchs du
+tournoi contre l'état compact de TournamentState (tableaux array indexés par joueur, tenus à jour à chaque tour), et
+adversaires rencontrés en ensembles d'ids par objet joueur contre bits d'adversaires de l'état (mémoire et temps des
+tests de revanche d'une ronde).
+
+Exécution : python -m benchmark.bench_tournament_state [nombre_de_joueur_max]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import Dict, Tuple
+
+from chess_manager.M import match_model, player_model, tournament_model, turn_model
+
+PLAYER_COUNTS = [1000, 10000]
+NBR_OF_ROUND = 9
+# Nombre de joueurs suivants dans le classement testés par joueur, comme le voisinage de l'appariement
+NBR_OF_CANDIDATE = 24
+
+
+def _get_legacy_colour_balance(tournament: tournament_model.TournamentM) -> Dict[int, int]:
+    """Équilibre des couleurs recalculé en parcourant tous les matchs du tournoi (ancienne représentation)"""
+    colour_balance = {player.player_id: 0 for player in tournament.players}
+    for turn in tournament.turn_list:
+        for match in turn.match_list:
+            colour_balance[match.player_1.player_id] += 1
+            colour_balance[match.player_2.player_id] -= 1
+    return colour_balance
+
+
+def _get_played_tournament(nbr_of_player: int) -> tournament_model.TournamentM:
+    result_random = random.Random(0)
+    players = [player_model.PlayerM('First', f'Last{player_id}', '01/01/2000', f'AB{player_id % 100000:05d}',
+                                    player_id=player_id)
+               for player_id in range(1, nbr_of_player + 1)]
+    tournament = tournament_model.TournamentM('Bench', 'Here', turn_nbr=NBR_OF_ROUND, player_nbr=nbr_of_player,
+                                              players=players, pairing_engine='dutch')
+    for round_nbr in range(NBR_OF_ROUND):
+        turn = turn_model.TurnM(f'Round{round_nbr + 1}')
+        for player_1_data, player_2_data in tournament.get_next_turn_player_pair():
+            turn.register_match(match_model.MatchM(player_1_data[0], player_1_data[1],
+                                                   player_2_data[0], player_2_data[1]))
+        tournament.register_turn(turn)
+        for match in turn.match_list:
+            match.end_match(result_random.choice([match.player_1, match.player_2, None]))
+    return tournament
+
+
+def _time_rematch_tests(tournament: tournament_model.TournamentM) -> Tuple[float, float, int]:
+    """
+    Teste les revanches entre chaque joueur et ses NBR_OF_CANDIDATE suivants dans le classement, dans les ensembles
+    d'ids des objets joueurs puis dans les bits de l'état. Retourne les deux temps et le nombre de revanches trouvées.
+    """
+    ordered_players = [player_data[0] for player_data in tournament.get_standings().get_ordered_player_data()]
+    candidate_pairs = [(player, other_player) for index, player in enumerate(ordered_players)
+                       for other_player in ordered_players[index + 1:index + 1 + NBR_OF_CANDIDATE]]
+    state = tournament.get_state()
+
+    start = time.perf_counter()
+    legacy_rematch = [player.has_played_against(other_player) for player, other_player in candidate_pairs]
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    rematch = [state.has_played(player.player_id, other_player.player_id) for player, other_player in candidate_pairs]
+    bits_time = time.perf_counter() - start
+    assert rematch == legacy_rematch
+    return legacy_time, bits_time, sum(rematch)
+
+
+def run(max_nbr_of_player: int = PLAYER_COUNTS[-1]) -> None:
+    for nbr_of_player in [count for count in PLAYER_COUNTS if count <= max_nbr_of_player]:
+        tournament = _get_played_tournament(nbr_of_player)
+        state = tournament.get_state()
+
+        start = time.perf_counter()
+        legacy_colour_balance = _get_legacy_colour_balance(tournament)
+        legacy_colour_time = time.perf_counter() - start
+        start = time.perf_counter()
+        colour_balance = tournament.get_colour_balance()
+        compact_colour_time = time.perf_counter() - start
+        assert colour_balance == legacy_colour_balance
+
+        dict_size = sys.getsizeof(legacy_colour_balance) + sum(sys.getsizeof(balance)
+                                                               for balance in legacy_colour_balance.values())
+        compact_size = state.get_nbr_of_bytes() + sys.getsizeof(state.index_by_player_id)
+        print(f"{nbr_of_player:>6} players, {NBR_OF_ROUND} rounds : colour balance "
+              f"{legacy_colour_time * 1000:.2f}ms from matches, {compact_colour_time * 1000:.2f}ms from compact state"
+              f" ; kept between turns : {compact_size / 1024:.1f}KB of arrays (rebuilt dict {dict_size / 1024:.1f}KB)")
+
+        legacy_time, bits_time, nbr_of_rematch = _time_rematch_tests(tournament)
+        id_set_size = sum(sys.getsizeof(player.already_played_against) for player in tournament.players)
+        bits_size = sum(sys.getsizeof(player_bits) for player_bits in state.opponent_bits)
+        print(f"{nbr_of_player:>6} players, {NBR_OF_ROUND} rounds : {nbr_of_player * NBR_OF_CANDIDATE} rematch tests "
+              f"({nbr_of_rematch} found) {legacy_time * 1000:.2f}ms in player id sets, {bits_time * 1000:.2f}ms in "
+              f"state bits ; opponents {id_set_size / 1024:.1f}KB of id sets, {bits_size / 1024:.1f}KB of bytearray")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,121 @@
+"""
+Simulation Monte Carlo de tournois sans interface : des tournois de joueurs synthétiques sont appariés par
+TournamentM.get_next_turn_player_pair, les résultats des matchs sont tirés au hasard selon la force cachée des
+joueurs (score attendu Elo). Les tournois sont répartis sur un ProcessPoolExecutor.
+
+Mesures : taux de revanche, écart de score moyen entre adversaires, dispersion des scores finaux, réinitialisations
+de l'historique des adversaires et débit d'appariement.
+
+Exécution : python -m benchmark.simulate_tournaments [moteur] [nombre_de_joueur] [nombre_de_ronde]
+            [nombre_de_tournoi] [nombre_de_processus]
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+from chess_manager.M import elo_rating, match_model, player_model, tournament_model, turn_model
+
+NBR_OF_PLAYER = 1000
+NBR_OF_ROUND = 9
+NBR_OF_TOURNAMENT = 200
+# Force cachée des joueurs synthétiques : classement Elo tiré selon une loi normale
+STRENGTH_MEAN = 1500
+STRENGTH_DEVIATION = 300
+
+
+def simulate_tournament(simulation_args: Tuple[str, int, int, int]) -> Dict:
+    """
+    Reçoit (moteur d'appariement, nombre de joueurs, nombre de rondes, graine), joue le tournoi et retourne ses
+    mesures. La graine rend chaque tournoi reproductible, y compris le mélange du premier tour.
+    """
+    engine_name, nbr_of_player, nbr_of_round, seed = simulation_args
+    random.seed(seed)
+    result_random = random.Random(seed)
+    players = [player_model.PlayerM('Sim', f'Player{player_id}', '01/01/2000', f'SI{player_id % 100000:05d}',
+                                    player_id=player_id)
+               for player_id in range(1, nbr_of_player + 1)]
+    strength_by_player_id = {player.player_id: result_random.gauss(STRENGTH_MEAN, STRENGTH_DEVIATION)
+                             for player in players}
+    tournament = tournament_model.TournamentM('Simulation', 'Nowhere', turn_nbr=nbr_of_round,
+                                              player_nbr=nbr_of_player, players=players,
+                                              pairing_engine=engine_name)
+    played_pairs = set()
+    stats = {'games': 0, 'rematches': 0, 'score_diff': 0., 'resets': 0, 'pairing_time': 0., 'rounds': 0}
+
+    for round_nbr in range(nbr_of_round):
+        pairing_output = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(pairing_output):
+            player_pairs = tournament.get_next_turn_player_pair()
+        stats['pairing_time'] += time.perf_counter() - start
+        # L'appariement glouton signale chaque réinitialisation de l'historique des adversaires
+        stats['resets'] += pairing_output.getvalue().count('\n')
+        stats['rounds'] += 1
+
+        turn = turn_model.TurnM(f'Round{round_nbr + 1}')
+        for player_1_data, player_2_data in player_pairs:
+            pair_key = frozenset((player_1_data[0].player_id, player_2_data[0].player_id))
+            stats['rematches'] += pair_key in played_pairs
+            played_pairs.add(pair_key)
+            stats['score_diff'] += abs(player_1_data[1] - player_2_data[1])
+            turn.register_match(match_model.MatchM(player_1_data[0], player_1_data[1],
+                                                   player_2_data[0], player_2_data[1]))
+        tournament.register_turn(turn)
+        stats['games'] += len(turn.match_list)
+
+        for match in turn.match_list:
+            player_1_expected_score = elo_rating.get_expected_score(strength_by_player_id[match.player_1.player_id],
+                                                                    strength_by_player_id[match.player_2.player_id])
+            # Une partie sur trois entre joueurs de même force est nulle
+            draw_probability = 2 / 3 * min(player_1_expected_score, 1 - player_1_expected_score)
+            outcome = result_random.random()
+            if outcome < draw_probability:
+                match.end_match()
+            elif outcome < draw_probability + player_1_expected_score - draw_probability / 2:
+                match.end_match(match.player_1)
+            else:
+                match.end_match(match.player_2)
+
+    final_scores = [score for _, score in tournament.get_standings().get_ordered_player_data()]
+    stats['final_score_deviation'] = statistics.pstdev(final_scores)
+    return stats
+
+
+def run_simulations(engine_name: str, nbr_of_player: int, nbr_of_round: int, nbr_of_tournament: int,
+                    max_workers: int | None = None) -> Tuple[Dict, float]:
+    """Répartit les tournois simulés sur un pool de processus, retourne les mesures cumulées et la durée totale"""
+    simulation_args = [(engine_name, nbr_of_player, nbr_of_round, seed) for seed in range(nbr_of_tournament)]
+    total_stats: Dict = dict()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunksize = max(1, nbr_of_tournament // (4 * (max_workers or os.cpu_count() or 1)))
+        for stats in executor.map(simulate_tournament, simulation_args, chunksize=chunksize):
+            for stat_name, value in stats.items():
+                total_stats[stat_name] = total_stats.get(stat_name, 0) + value
+    return total_stats, time.perf_counter() - start
+
+
+def run(engine_name: str = 'dutch', nbr_of_player: int = NBR_OF_PLAYER, nbr_of_round: int = NBR_OF_ROUND,
+        nbr_of_tournament: int = NBR_OF_TOURNAMENT, max_workers: int | None = None) -> None:
+    total_stats, elapsed = run_simulations(engine_name, nbr_of_player, nbr_of_round, nbr_of_tournament, max_workers)
+    print(f"{engine_name} - {nbr_of_tournament} tournament(s) of {nbr_of_player} players, {nbr_of_round} rounds, "
+          f"{max_workers or os.cpu_count()} process(es) : {elapsed:.2f}s ({nbr_of_tournament / elapsed:.1f} "
+          f"tournaments/s)")
+    print(f"  rematch rate {total_stats['rematches'] / total_stats['games']:.3%}, "
+          f"mean score difference between opponents {total_stats['score_diff'] / total_stats['games']:.3f} pts, "
+          f"final score deviation {total_stats['final_score_deviation'] / nbr_of_tournament:.3f} pts, "
+          f"{total_stats['resets']} history reset(s)")
+    print(f"  pairing : {total_stats['pairing_time'] / total_stats['rounds'] * 1000:.2f}ms/round, "
+          f"{total_stats['rounds'] / total_stats['pairing_time']:.0f} rounds/s by process")
+
+
+if __name__ == "__main__":
+    run(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:6]])
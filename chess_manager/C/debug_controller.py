@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+
+from core import messenger, tinydb_loader, mainview, event_profiler
+from data import config
+
+from chess_manager.V import debug_view
+
+
+def get_profiling_report_path() -> str:
+    return os.path.join(os.getcwd(), config.SAVE_DIRECTORY, f"{config.PROFILING_REPORT_FILE_NAME}.json")
+
+
+class DebugC:
+    def __init__(self,
+                 loader: tinydb_loader.TinyDBLoader,
+                 main_view: mainview.MainView,
+                 app_messenger: messenger.Messenger,
+                 profiler: event_profiler.EventProfiler) -> None:
+        """
+        Contrôleur du menu de debug, disponible depuis le menu principal lorsque la mesure des événements est activée
+        (EVENT_PROFILING dans data/config.py) : rapport des événements, arbre des appels, export json et remise à zéro
+        """
+        self.main_view = main_view
+        self.loader = loader
+        self.app_messenger = app_messenger
+        self.profiler = profiler
+
+        app_messenger.register_call_event(config.AppInput.DEBUG_MENU, self.show_debug_menu,
+                                          event_str="Debug : event profiling")
+        app_messenger.register_call_event(config.AppInput.DEBUG_PROFILING_REPORT, self.display_profiling_report,
+                                          event_str="Display event report")
+        app_messenger.register_call_event(config.AppInput.DEBUG_PROFILING_CALL_TREE, self.display_call_tree,
+                                          event_str="Display event call tree")
+        app_messenger.register_call_event(config.AppInput.DEBUG_SAVE_PROFILING, self.save_profiling_report,
+                                          event_str="Save event report as json")
+        app_messenger.register_call_event(config.AppInput.DEBUG_RESET_PROFILING, self.reset_profiling,
+                                          event_str="Reset event profiling")
+
+    def show_debug_menu(self) -> None:
+        self.main_view.menu_title = "## Debug : event profiling ##"
+        self.app_messenger.ignore_all()
+        self.app_messenger.accept_multiple_event([
+            (config.AppInput.DEBUG_PROFILING_REPORT, None),
+            (config.AppInput.DEBUG_PROFILING_CALL_TREE, None),
+            (config.AppInput.DEBUG_SAVE_PROFILING, None),
+            (config.AppInput.DEBUG_RESET_PROFILING, None),
+            (config.AppInput.MAIN_MENU, None),
+        ])
+
+    def display_profiling_report(self) -> None:
+        self.main_view.add_to_display(debug_view.profiling_report_view(self.profiler.to_dict()))
+
+    def display_call_tree(self) -> None:
+        self.main_view.add_to_display(debug_view.profiling_call_tree_view(self.profiler.to_dict()))
+
+    def save_profiling_report(self) -> None:
+        """Enregistre le rapport des événements en json dans le répertoire de sauvegarde"""
+        report_path = get_profiling_report_path()
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        self.profiler.dump_json(report_path)
+        self.main_view.add_to_display(f"Event report saved to {report_path}")
+
+    def reset_profiling(self) -> None:
+        self.profiler.reset()
+        self.main_view.add_to_display("Event profiling reset")
@@ -115,17 +115,35 @@ class MatchC:
 
     def _save_match_obj(self,
                         match_obj: match_model.MatchM) -> None:
+        """Sauvegarde un objet match s'il a été modifié depuis sa dernière sauvegarde"""
+        if not match_obj.is_dirty:
+            return
         match_data = match_obj.get_save_data()
         match_obj.match_id = self.loader.save_match(match_data)
+        match_obj.mark_as_saved()
+        self.loader.identity_map.put(DB_NAME, match_obj.match_id, match_obj)
 
-    def create_new_match_from_match_dict(self, match_data):
+    def create_new_match_from_match_dict(self, match_data: Dict) -> match_model.MatchM:
+        """
+        Reçoit les données d'un match, retourne l'objet match en cache si le match est déjà chargé, sinon crée l'objet
+        et le sauvegarde.
+        Un match portant un id provient de la base de donnée, il n'est pas sauvegardé à nouveau.
+        """
+        cached_match = self.loader.identity_map.get(DB_NAME, match_data.get('match_id', -1))
+        if cached_match is not None:
+            return cached_match
         new_match = _get_match_obj_from_match_dict(match_data)
+        if new_match.match_id != -1:
+            new_match.mark_as_saved()
         self._save_match_obj(new_match)
         return new_match
 
     def set_match_as_active(self,
                             match: match_model.MatchM) -> None:
-        """ Reçoit un objet match, le sauvegarde, l'affiche sur la vue principale et affiche les contrôles du match """
+        """
+        Reçoit un objet match, le sauvegarde s'il a été modifié, l'affiche sur la vue principale et affiche les
+        contrôles du match
+        """
         self._save_match_obj(match)
         self.main_view.add_to_display(match_view.see_match_as_line(match))
         self._get_match_control(match)
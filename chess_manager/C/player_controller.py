@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import List, Dict, Callable, Any
+from typing import List, Dict, Callable, Any, Tuple
 from data import config
 
-from core import messenger, tinydb_loader, mainview
+from core import messenger, tinydb_loader, mainview, player_index
 from chess_manager.M import player_model
 from chess_manager.V import player_view
 
@@ -53,6 +53,7 @@ class PlayerC:
                                           "See previous player page")
 
         app_messenger.register_call_event(config.AppInput.LOAD_PLAYER, self.load_player_obj_from_player_id)
+        app_messenger.register_call_event(config.AppInput.LOAD_PLAYER_LIST, self.load_players_obj_from_player_id_list)
         app_messenger.register_call_event(config.AppInput.PLAYER_FULL_VIEW, self._display_player)
         app_messenger.register_call_event(config.AppInput.PLAYER_FLAT_VIEW, get_flat_player_view)
 
@@ -61,7 +62,8 @@ class PlayerC:
         """Reçoit un dictionnaire de donnée et retourne un objet joueur """
         player_id = self.loader.save_player(player_creation_data)
         new_player = get_player_obj_from_player_dict({**player_creation_data, **{'player_id': player_id}})
-        return new_player
+        new_player.mark_as_saved()
+        return self.loader.identity_map.put(DB_NAME, player_id, new_player)
 
     def create_new_player_from_form(self) -> player_model.PlayerM:
         """
@@ -82,27 +84,56 @@ class PlayerC:
         player_data = self.loader.load_player(player_id)
         return player_data
 
+    def _get_cached_player_obj(self, player_data: Dict) -> player_model.PlayerM:
+        """Reçoit les données d'un joueur chargé et retourne l'objet joueur en cache, créé si nécessaire"""
+        cached_player_obj = self.loader.identity_map.get(DB_NAME, player_data['player_id'])
+        if cached_player_obj is not None:
+            return cached_player_obj
+        loaded_player_obj = get_player_obj_from_player_dict(player_data)
+        loaded_player_obj.mark_as_saved(player_data)
+        return self.loader.identity_map.put(DB_NAME, player_data['player_id'], loaded_player_obj)
+
     def load_player_obj_from_player_id(self, player_id: int) -> player_model.PlayerM | bool:
         """Reçoit l'id d'un joueur et retourne un objet joueur si l'id existe, 'False' s'il n'existe pas."""
         # EDGE CASE, We could want to "load" an already loaded player from a cached tournament.
         if isinstance(player_id, player_model.PlayerM):
             return player_id
 
+        cached_player_obj = self.loader.identity_map.get(DB_NAME, player_id)
+        if cached_player_obj is not None:
+            return cached_player_obj
+
         loaded_player_data = self._load_player_data_from_player_id(player_id)
         if not loaded_player_data:
             return False
-        loaded_player_obj = get_player_obj_from_player_dict(loaded_player_data)
-        return loaded_player_obj
+        return self._get_cached_player_obj(loaded_player_data)
 
-    def _load_players_obj_list_from_player_id_list(self,
-                                                   player_id_list) -> List:
-        """Reçoit une list de player_id et retourne une liste d'objets joueurs correspondants"""
-        player_obj_list = list()
+    def load_players_obj_from_player_id_list(self,
+                                             player_id_list: List) -> List:
+        """
+        Reçoit une list de player_id et retourne une liste d'objets joueurs correspondants, les ids inexistants sont
+        ignorés. Les ids absents du cache sont résolus en une seule lecture de la base de donnée.
+        """
+        # EDGE CASE, la liste peut contenir des joueurs déjà chargés, ils sont conservés tels quels.
+        player_by_id = dict()
         for player_id in player_id_list:
-            player_obj = self.load_player_obj_from_player_id(player_id)
-            if not player_obj:
+            if isinstance(player_id, player_model.PlayerM):
                 continue
-            player_obj_list.append(player_obj)
+            cached_player_obj = self.loader.identity_map.get(DB_NAME, player_id)
+            if cached_player_obj is not None:
+                player_by_id[player_id] = cached_player_obj
+
+        player_id_to_load = [player_id for player_id in player_id_list
+                             if not isinstance(player_id, player_model.PlayerM) and player_id not in player_by_id]
+        for player_data in self.loader.load_players(player_id_to_load):
+            player_by_id[player_data['player_id']] = self._get_cached_player_obj(player_data)
+
+        player_obj_list = list()
+        for player_id in player_id_list:
+            if isinstance(player_id, player_model.PlayerM):
+                player_obj_list.append(player_id)
+            elif player_id in player_by_id:
+                player_obj_list.append(player_by_id[player_id])
         return player_obj_list
 
     def _add_temp_player_display_event_to_messenger(self,
@@ -140,13 +171,7 @@ class PlayerC:
         """
         if list_of_player_id is None:
             list_of_player_id = [player_id for player_id in range(1, self.loader.get_nbr_db_entry(DB_NAME) + 1)]
-        player_list = list()
-
-        for player_id in list_of_player_id:
-            player_obj = self.load_player_obj_from_player_id(player_id)
-            if not player_obj:
-                continue
-            player_list.append(player_obj)
+        player_list = self.load_players_obj_from_player_id_list(list_of_player_id)
 
         return sorted(player_list,
                       key=lambda individual_player_obj: individual_player_obj.get_alphab_sort())
@@ -155,66 +180,94 @@ class PlayerC:
     #     sorted_player_list = self.load_and_order_player_alphab(player_id_list)
     #     self.show_player_selection_list(sorted_player_list)
 
+    def _load_player_page(self,
+                          page_cursor: Tuple | None,
+                          backward: bool,
+                          nbr_of_display_by_page: int,
+                          player_exclude_from_display: List) -> Tuple[List, bool, bool]:
+        """
+        Lit depuis l'index alphabétique du loader les joueurs suivant (ou précédant si 'backward') le curseur reçu,
+        en ignorant les joueurs exclus. Retourne la page d'objets joueurs, si une page suivante et si une page
+        précédente existent.
+        """
+        player_data_page = list()
+        loading_cursor = page_cursor
+        while True:
+            # Un joueur de plus que nécessaire est demandé pour savoir si une autre page existe dans cette direction
+            nbr_to_load = nbr_of_display_by_page + 1 - len(player_data_page)
+            loaded_player_data = self.loader.load_player_page(loading_cursor, nbr_to_load, backward)
+            kept_player_data = [player_data for player_data in loaded_player_data
+                                if player_data['player_id'] not in player_exclude_from_display]
+            if backward:
+                player_data_page = [*kept_player_data, *player_data_page]
+            else:
+                player_data_page = [*player_data_page, *kept_player_data]
+            if len(loaded_player_data) < nbr_to_load or len(player_data_page) > nbr_of_display_by_page:
+                break
+            loading_cursor = player_index.get_player_cursor(loaded_player_data[0 if backward else -1])
+
+        has_more_page = len(player_data_page) > nbr_of_display_by_page
+        if not backward:
+            player_page = [self._get_cached_player_obj(player_data)
+                           for player_data in player_data_page[:nbr_of_display_by_page]]
+            return player_page, has_more_page, page_cursor is not None
+
+        if not has_more_page and len(player_data_page) < nbr_of_display_by_page:
+            # Début de l'index atteint avant de remplir la page : on affiche la première page complète
+            return self._load_player_page(None, False, nbr_of_display_by_page, player_exclude_from_display)
+        player_page = [self._get_cached_player_obj(player_data)
+                       for player_data in player_data_page[-nbr_of_display_by_page:]]
+        return player_page, True, has_more_page
+
     def show_player_selection_list(self,
                                    list_of_player_to_display: List | None = None,
                                    player_exclude_from_display: List | None = None,
                                    nbr_of_display_by_page: int = config.NBR_OF_PLAYER_TO_DISPLAY_BY_PAGE,
                                    actual_page: int = 0,
-                                   callback_func: Any | None = None):
+                                   callback_func: Any | None = None,
+                                   page_cursor: Tuple | None = None,
+                                   backward: bool = False):
         """
         Permet l'affichage d'une liste de joueurs sur la vue principale et accepte les évènements liés à la
         visualisation des joueurs
-        Si aucune liste n'est fourni, l'intégralité de la base ed donnée est chargée,
+        Si aucune liste n'est fournie, les joueurs sont lus page par page depuis l'index alphabétique du loader : la
+        page commence après le curseur reçu (ou finit avant le curseur si 'backward').
         """
         self.main_view.menu_title = "## Player SELECTION ##"
         self.app_messenger.ignore_all()
-
-        if actual_page != 0:
-            self.app_messenger.accept_event(config.AppInput.PREV_PLAYER_PAGE,
-                                            [list_of_player_to_display,
-                                             player_exclude_from_display,
-                                             nbr_of_display_by_page,
-                                             actual_page - 1,
-                                             callback_func])
-
-        self.app_messenger.accept_event(config.AppInput.NEXT_PLAYER_PAGE,
-                                        [list_of_player_to_display,
-                                         player_exclude_from_display,
-                                         nbr_of_display_by_page,
-                                         actual_page + 1,
-                                         callback_func])
-
         self.app_messenger.accept_event(config.AppInput.MAIN_MENU)
         self.app_messenger.accept_event(config.AppInput.QUIT)
 
-        nbr_of_display_by_page = min(nbr_of_display_by_page, self.loader.get_nbr_db_entry(DB_NAME))
-
         if player_exclude_from_display is None:
             player_exclude_from_display = list()
 
         if list_of_player_to_display is None:
-            display_from = 0 + actual_page * nbr_of_display_by_page
-            display_to = display_from + nbr_of_display_by_page + len(player_exclude_from_display)
-            player_alphab = self.load_and_order_player_alphab()
-            list_of_player_to_display = player_alphab[display_from:display_to]
-
-        if len(list_of_player_to_display) < nbr_of_display_by_page:
-            self.app_messenger.ignore_event(config.AppInput.NEXT_PLAYER_PAGE)
-
-        for excluded in player_exclude_from_display:
-            if excluded in list_of_player_to_display:
-                list_of_player_to_display.remove(excluded)
-
-        if len(list_of_player_to_display) > nbr_of_display_by_page:
-            list_of_player_to_display = list_of_player_to_display[:nbr_of_display_by_page]
-
-        player_listing = self.load_and_order_player_alphab(list_of_player_to_display)
+            player_listing, has_next_page, has_previous_page = self._load_player_page(page_cursor,
+                                                                                      backward,
+                                                                                      nbr_of_display_by_page,
+                                                                                      player_exclude_from_display)
+        else:
+            ordered_player = [player for player in self.load_and_order_player_alphab(list_of_player_to_display)
+                              if player.player_id not in player_exclude_from_display]
+            display_from = actual_page * nbr_of_display_by_page
+            player_listing = ordered_player[display_from:display_from + nbr_of_display_by_page]
+            has_next_page = len(ordered_player) > display_from + nbr_of_display_by_page
+            has_previous_page = actual_page > 0
 
         if len(player_listing) == 0:
             self.main_view.add_to_display(player_view.no_existing_player_error())
-            self.app_messenger.ignore_event(config.AppInput.NEXT_PLAYER_PAGE)
             return
 
+        page_args = [list_of_player_to_display, player_exclude_from_display, nbr_of_display_by_page]
+        first_cursor = player_index.get_player_cursor(player_listing[0].get_save_data())
+        last_cursor = player_index.get_player_cursor(player_listing[-1].get_save_data())
+        if has_previous_page:
+            self.app_messenger.accept_event(config.AppInput.PREV_PLAYER_PAGE,
+                                            [*page_args, actual_page - 1, callback_func, first_cursor, True])
+        if has_next_page:
+            self.app_messenger.accept_event(config.AppInput.NEXT_PLAYER_PAGE,
+                                            [*page_args, actual_page + 1, callback_func, last_cursor, False])
+
         if callback_func is None:
             callback_func = self._display_player
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import threading
 from functools import partial
 from typing import Dict, Callable, List, Tuple
 
-from core import messenger, mainview, tinydb_loader
+from core import messenger, mainview, tinydb_loader, tournament_index
 from data import config
 
-from chess_manager.M import tournament_model, player_model, turn_model
+from chess_manager.M import tournament_model, player_model, turn_model, match_model, tie_break, lazy_relation
 from chess_manager.V import tournament_view
 
 DB_NAME = config.TOURNAMENT_DB_NAME
@@ -24,20 +25,6 @@ def _get_new_tournament_creation_data(main_view: mainview.MainView) -> Dict:
     return form_answer
 
 
-def _order_tournament_by_tournament_id(tournament_list: List) -> List:
-    return sorted(tournament_list, key=lambda tournament_obj: tournament_obj.tournament_id, reverse=True)
-
-
-def _order_tournament_by_status(tournament_list: List) -> List:
-    """Reçoit une liste de match non ordonnée, retourne une liste de match en cours puis terminé"""
-    unfinished = [tournament for tournament in tournament_list if tournament.end_date is None]
-    finished = [tournament for tournament in tournament_list if tournament not in unfinished]
-
-    unfinished = _order_tournament_by_tournament_id(unfinished)
-    finished = _order_tournament_by_tournament_id(finished)
-    return [*unfinished, *finished]
-
-
 class TournamentC:
     def __init__(self,
                  loader: tinydb_loader.TinyDBLoader,
@@ -47,6 +34,11 @@ class TournamentC:
         self.main_view = main_view
         self.loader = loader
         self.app_messenger = app_messenger
+        # Appariement du tour suivant calculé d'avance : tournoi suivi, thread de calcul, clé et résultat
+        self.watched_tournament: tournament_model.TournamentM | None = None
+        self.pairing_thread: threading.Thread | None = None
+        self.pairing_key: Tuple | None = None
+        self.precomputed_pairing: Dict = dict()
 
         app_messenger.register_call_event(config.AppInput.NEW_TOURNAMENT, self.create_new_tournament,
                                           "Create new tournament")
@@ -58,6 +50,10 @@ class TournamentC:
                                           "Back to tournament menu")
         app_messenger.register_call_event(config.AppInput.BACK_TO_TOURNAMENT_LIST, self.show_tournament_selection_list,
                                           "Back to tournament list")
+        app_messenger.register_call_event(config.AppInput.NEXT_TOURNAMENT_PAGE, self.show_tournament_selection_list,
+                                          "See next tournament page")
+        app_messenger.register_call_event(config.AppInput.PREV_TOURNAMENT_PAGE, self.show_tournament_selection_list,
+                                          "See previous tournament page")
         app_messenger.register_call_event(config.AppInput.NEXT_TURN, self.go_to_next_turn,
                                           "Go to next turn")
         app_messenger.register_call_event(config.AppInput.TOURNAMENT_RANKING, self.view_tournament_leaderboard,
@@ -68,15 +64,19 @@ class TournamentC:
                                           "Back to turn list")
 
     def save_tournament(self, tournament_obj: tournament_model.TournamentM) -> None:
+        """Sauvegarde un objet tournoi s'il a été modifié depuis sa dernière sauvegarde"""
         # EDGE CASE : User can finish the last match and quit the app without generating
         # next turn or checking tournament completion.
         # Checking here allow to properly set the end time.
         if tournament_obj.is_finished and tournament_obj.end_date is None:
             tournament_obj.end_tournament()
+        if not tournament_obj.is_dirty:
+            return
         tournament_obj.tournament_id = self.loader.save_tournament(tournament_obj.from_obj_to_dict())
+        tournament_obj.mark_as_saved()
+        self.loader.identity_map.put(DB_NAME, tournament_obj.tournament_id, tournament_obj)
 
     def display_tournament(self, tournament_obj: tournament_model.TournamentM) -> None:
-        self.save_tournament(tournament_obj)
         self.main_view.add_to_display(_get_tournament_display(tournament_obj))
 
 
@@ -100,14 +100,18 @@ class TournamentC:
         # Si le tournoi est terminé, impossible d'aller au tour suivant
         if tournament_obj.is_finished:
             tournament_obj.end_tournament()
+            self.save_tournament(tournament_obj)
             self.app_messenger.ignore_event(config.AppInput.NEXT_TURN)
 
         self.app_messenger.accept_event(config.AppInput.PLAYER_FLAT_VIEW)
 
         # Si on a joué au moins un tour du tournoi, on affiche le podium et autorise l'affichage des 'stats'.
+        # Le podium est classé par score sans départages : seul le dernier tour est chargé, les départages sont
+        # calculés à l'affichage du classement complet.
         if tournament_obj.turn_list:
             self.app_messenger.accept_event(config.AppInput.DISPLAY_TURN_RANKING)
-            self.app_messenger.send_event(config.AppInput.DISPLAY_TURN_RANKING, [tournament_obj.turn_list[-1], 3])
+            self.app_messenger.send_event(config.AppInput.DISPLAY_TURN_RANKING,
+                                          [tournament_obj.turn_list[-1], 3, tournament_obj.standings, None, False])
             self.app_messenger.accept_event(config.AppInput.TOURNAMENT_DETAILS, [tournament_obj])
             self.app_messenger.accept_event(config.AppInput.TOURNAMENT_RANKING, [tournament_obj])
         # Quoi qu'il arrive, on permet la visualisation des joueurs et des fonctions basiques de l'application
@@ -140,8 +144,14 @@ class TournamentC:
         self.main_view.menu_title = "## Tournament creation ##"
 
         tournament_data = _get_new_tournament_creation_data(self.main_view)
-        tournament_data['turn_nbr'] = int(tournament_data['turn_nbr'])
         tournament_data['player_nbr'] = int(tournament_data['player_nbr'])
+        if not tournament_data.get('pairing_engine'):
+            tournament_data.pop('pairing_engine', None)
+        if tournament_data['turn_nbr'].upper() == tournament_model.AUTO_TURN_NBR:
+            tournament_data['turn_nbr'] = tournament_model.get_auto_turn_nbr(
+                tournament_data['player_nbr'],
+                tournament_data.get('pairing_engine', tournament_model.DEFAULT_PAIRING_ENGINE))
+        tournament_data['turn_nbr'] = int(tournament_data['turn_nbr'])
         new_tournament = tournament_model.TournamentM(**tournament_data)
         self.save_tournament(new_tournament)
 
@@ -168,117 +178,184 @@ class TournamentC:
         self.app_messenger.ignore_event(player_event)
         if len(tournament_obj.players) == tournament_obj.player_nbr:
             self.get_tournament_controls(tournament_obj)
-        tournament_obj.players.sort(key=lambda individual_player_obj: f"{individual_player_obj.get_alphab_sort()}")
+        tournament_obj.players.sort(key=lambda individual_player_obj: individual_player_obj.get_alphab_sort())
         self.save_tournament(tournament_obj)
 
+    def _load_players(self, player_id_list: List) -> List:
+        self.app_messenger.accept_event(config.AppInput.LOAD_PLAYER_LIST)
+        return self.app_messenger.send_event(config.AppInput.LOAD_PLAYER_LIST, [player_id_list])
+
+    def _load_matches(self, match_id_list: List, player_list: List) -> List:
+        """
+        Reçoit une liste d'ids de match et la liste des joueurs du tournoi, retourne les objets matchs en une seule
+        lecture de la base de donnée. Les matchs déjà en cache sont conservés tels quels.
+        """
+        self.app_messenger.accept_event(config.AppInput.NEW_MATCH)
+        match_data_list = self.loader.load_matches(match_id_list)
+        player_by_id = {player.player_id: player for player in player_list} if match_data_list else dict()
+        match_list = list()
+        for match_data in match_data_list:
+            match_data['player_1'] = player_by_id[match_data.get('player_1')]
+            match_data['player_2'] = player_by_id[match_data.get('player_2')]
+            match_list.append(self.app_messenger.send_event(config.AppInput.NEW_MATCH, [match_data]))
+        return match_list
+
+    def _load_turns(self, turn_id_list: List, player_list: List, lazy_relations: Tuple) -> List:
+        """
+        Reçoit une liste d'ids de tour et la liste des joueurs du tournoi, retourne les objets tours. Un tour chargé
+        depuis la base ne contient que les ids de ses matchs, ils sont remplacés par une liste chargée à la demande.
+        """
+        self.app_messenger.accept_event(config.AppInput.LOAD_TURN_LIST)
+        loaded_turn_list = self.app_messenger.send_event(config.AppInput.LOAD_TURN_LIST, [turn_id_list])
+        for turn_obj in loaded_turn_list:
+            # Un tour déjà en cache contient directement ses objets matchs ou leur liste chargée à la demande
+            if isinstance(turn_obj.match_list, lazy_relation.LazyList) or \
+                    all(isinstance(match, match_model.MatchM) for match in turn_obj.match_list):
+                continue
+            turn_obj.match_list = lazy_relation.LazyList(turn_obj.match_list,
+                                                         partial(self._load_matches, player_list=player_list),
+                                                         'match_id')
+            if 'match_list' in lazy_relations:
+                continue
+            turn_obj.match_list.resolve()
+            if turn_obj.finished and turn_obj.end_time is None:
+                print(f"Something went wrong while loading {turn_obj.name}")
+        return loaded_turn_list
+
     def load_tournament_by_tournament_id(self,
                                          tournament_id: int,
-                                         partial_load: bool = False) -> tournament_model.TournamentM:
+                                         lazy_relations: Tuple | None = None) -> tournament_model.TournamentM:
         """
-        Reçoit un tournament_id et le charge partiellement ou non en fonction de l'argument reçu. Si rien n'est
-        précisé, le tournoi est entièrement chargé.
-        Un tournoi partiellement chargé ne contiens que les IDs des joueurs, matchs et tours.
-        Un tournoi complètement chargé est constitué d'objets chargés en mémoire.
+        Reçoit un tournament_id et retourne l'objet tournoi, conservé en cache.
+        Les relations du tournoi citées dans 'lazy_relations' (joueurs, tours, matchs des tours) ne sont chargées
+        qu'à leur premier accès, en une lecture par base de donnée : l'écran suivant ne lit que ce qu'il affiche.
+        Les autres relations sont chargées immédiatement. Par défaut, les relations de config sont chargées à la
+        demande.
         """
+        if lazy_relations is None:
+            lazy_relations = config.LAZY_TOURNAMENT_RELATIONS
+        cached_tournament = self.loader.identity_map.get(DB_NAME, tournament_id)
+        if cached_tournament is not None:
+            cached_tournament.invalidate_player_pairing()
+            return cached_tournament
+
         tournament = self.loader.load_tournament_data(tournament_id)
-        player_list = list()
-        turn_list = list()
-
-        if not partial_load:
-            self.app_messenger.accept_event(config.AppInput.LOAD_PLAYER)
-            self.app_messenger.accept_event(config.AppInput.LOAD_TURN)
-            self.app_messenger.accept_event(config.AppInput.NEW_MATCH)
-
-            for player_id in tournament['players']:
-                player_list.append(self.app_messenger.send_event(config.AppInput.LOAD_PLAYER, [player_id]))
-
-            player_dict = {player.player_id: player for player in player_list}
-            for turn_id in tournament['turn_list']:
-                match_list = list()
-                turn_obj = self.app_messenger.send_event(config.AppInput.LOAD_TURN, [turn_id])
-                for match in turn_obj.match_list:
-                    match_data = self.loader.load_match(match)
-                    if not match_data:
-                        continue
-                    match_data['player_1'] = player_dict[match_data.get('player_1')]
-                    match_data['player_2'] = player_dict[match_data.get('player_2')]
-                    match_list.append(self.app_messenger.send_event(config.AppInput.NEW_MATCH, [match_data]))
-                turn_obj.match_list = match_list
-                turn_is_finished = turn_obj.finished
-                if turn_is_finished and turn_obj.end_time is None:
-                    print(f"Something went wrong while loading {turn_obj.name}")
-                turn_list.append(turn_obj)
-            tournament['players'] = player_list
-            tournament['turn_list'] = turn_list
-
-        tournament_data = {**tournament, 'tournament_id': tournament_id}
-        return tournament_model.TournamentM(**tournament_data)
+        player_list = lazy_relation.LazyList(tournament['players'], self._load_players, 'player_id')
+        turn_list = lazy_relation.LazyList(tournament['turn_list'],
+                                           partial(self._load_turns, player_list=player_list,
+                                                   lazy_relations=lazy_relations),
+                                           'turn_id')
+        for relation_name, relation in (('players', player_list), ('turn_list', turn_list)):
+            if relation_name not in lazy_relations:
+                relation.resolve()
+
+        tournament_obj = tournament_model.TournamentM(**{**tournament, 'players': player_list, 'turn_list': turn_list,
+                                                         'tournament_id': tournament_id})
+        # Les joueurs en cache peuvent avoir été utilisés par un autre tournoi, l'historique des adversaires est
+        # reconstruit à partir des matchs de ce tournoi avant son prochain appariement.
+        tournament_obj.invalidate_player_pairing()
+        tournament_obj.mark_as_saved()
+        return self.loader.identity_map.put(DB_NAME, tournament_id, tournament_obj)
 
     def add_temp_tournament_selection_event_to_messenger(self,
-                                                         tournament_listing: List,
+                                                         tournament_summary_list: List,
                                                          callback_func: Callable) -> None:
         """
-        Reçoit une liste d'objet tournoi, génère des événements pour les afficher sur la vue principale et
-        enregistre ces événements auprès du messenger principal de l'application.
+        Reçoit une liste ordonnée de résumés de tournoi, génère des événements pour les afficher sur la vue principale
+        et enregistre ces événements auprès du messenger principal de l'application.
+        L'événement reçoit l'id du tournoi, le tournoi n'est chargé que lorsqu'il est sélectionné.
         """
-        ordered_tournament = _order_tournament_by_status(tournament_listing)
-
-        for tournament in ordered_tournament:
-            tournament_str = tournament_view.tournament_object_flat_view(tournament)
+        for tournament_summary in tournament_summary_list:
+            tournament_str = tournament_view.tournament_summary_flat_view(tournament_summary)
             updated_event_call = self.app_messenger.update_event(config.AppInput.SET_TOURNAMENT_ACTIV,
                                                                  new_func=callback_func,
                                                                  new_str=tournament_str,
                                                                  make_copy=True)
 
-            self.app_messenger.accept_event(tournament_str, call_event=updated_event_call, event_arg=[tournament])
-
-    def show_tournament_selection_list(self, from_id: int = 0,
-                                       to_id: int | None = None,
+            self.app_messenger.accept_event(tournament_str, call_event=updated_event_call,
+                                            event_arg=[tournament_summary['tournament_id']])
+
+    def _load_tournament_summary_page(self,
+                                      page_cursor: Tuple | None,
+                                      backward: bool,
+                                      nbr_of_display_by_page: int,
+                                      excluded_id: List) -> Tuple[List, bool, bool]:
+        """
+        Lit depuis l'index des résumés du loader les tournois suivant (ou précédant si 'backward') le curseur reçu,
+        en ignorant les tournois exclus. Retourne la page de résumés, si une page suivante et si une page précédente
+        existent.
+        """
+        summary_page = list()
+        loading_cursor = page_cursor
+        while True:
+            # Un tournoi de plus que nécessaire est demandé pour savoir si une autre page existe dans cette direction
+            nbr_to_load = nbr_of_display_by_page + 1 - len(summary_page)
+            loaded_summary = self.loader.load_tournament_summaries(loading_cursor, nbr_to_load, backward)
+            kept_summary = [summary for summary in loaded_summary if summary['tournament_id'] not in excluded_id]
+            if backward:
+                summary_page = [*kept_summary, *summary_page]
+            else:
+                summary_page = [*summary_page, *kept_summary]
+            if len(loaded_summary) < nbr_to_load or len(summary_page) > nbr_of_display_by_page:
+                break
+            loading_cursor = tournament_index.get_summary_cursor(loaded_summary[0 if backward else -1])
+
+        has_more_page = len(summary_page) > nbr_of_display_by_page
+        if not backward:
+            return summary_page[:nbr_of_display_by_page], has_more_page, page_cursor is not None
+        return summary_page[-nbr_of_display_by_page:], page_cursor is not None, has_more_page
+
+    def show_tournament_selection_list(self,
+                                       page_cursor: Tuple | None = None,
+                                       backward: bool = False,
                                        excluded_id: List | None = None,
-                                       callback_func: Callable or None = None) -> None:
+                                       callback_func: Callable or None = None,
+                                       nbr_of_display_by_page: int = config.NBR_OF_TOURNAMENT_TO_DISPLAY_BY_PAGE
+                                       ) -> None:
         """
         Permet l'affichage d'une liste de tournoi sur la vue principale et accepte les évènements liés à la
         visualisation d'un tournoi
-        Si aucune liste n'est fourni, l'intégralité de la base de donnée est chargée
+        Les tournois sont lus page par page depuis l'index des résumés du loader, sans charger les tournois : la page
+        commence après le curseur reçu (ou finit avant le curseur si 'backward').
         """
 
         self.main_view.menu_title = "## Tournament SELECTION ##"
-        self.app_messenger.accept_event(config.AppInput.NEW_MATCH)
-        self.app_messenger.accept_event(config.AppInput.LOAD_TURN)
-        self.app_messenger.accept_event(config.AppInput.LOAD_PLAYER)
 
         if excluded_id is None:
             excluded_id = list()
 
-        tournament_listing = list()
-
-        if to_id is None:
-            to_id = self.loader.get_nbr_db_entry(DB_NAME)
-
-        for tournament_id_to_display in range(from_id, to_id + 1):
-            if tournament_id_to_display in excluded_id:
-                continue
-            if self.loader.tournament_exist(tournament_id_to_display):
-                tournament_listing.append(self.load_tournament_by_tournament_id(tournament_id_to_display,
-                                                                                partial_load=True))
-        if len(tournament_listing) == 0:
+        summary_listing, has_next_page, has_previous_page = self._load_tournament_summary_page(page_cursor,
+                                                                                               backward,
+                                                                                               nbr_of_display_by_page,
+                                                                                               excluded_id)
+        if len(summary_listing) == 0:
             print("No tournament to show")
             return
 
         self.app_messenger.ignore_all()
+        first_cursor = tournament_index.get_summary_cursor(summary_listing[0])
+        last_cursor = tournament_index.get_summary_cursor(summary_listing[-1])
+        if has_previous_page:
+            self.app_messenger.accept_event(config.AppInput.PREV_TOURNAMENT_PAGE,
+                                            [first_cursor, True, excluded_id, callback_func, nbr_of_display_by_page])
+        if has_next_page:
+            self.app_messenger.accept_event(config.AppInput.NEXT_TOURNAMENT_PAGE,
+                                            [last_cursor, False, excluded_id, callback_func, nbr_of_display_by_page])
+
         if callback_func is None:
             callback_func = self.set_tournament_as_active
 
-        self.add_temp_tournament_selection_event_to_messenger(tournament_listing, callback_func)
+        self.add_temp_tournament_selection_event_to_messenger(summary_listing, callback_func)
 
         self.app_messenger.accept_event(config.AppInput.MAIN_MENU)
         self.app_messenger.accept_event(config.AppInput.QUIT)
 
-    def set_tournament_as_active(self, tournament_obj: tournament_model.TournamentM) -> None:
+    def set_tournament_as_active(self, tournament: tournament_model.TournamentM | int) -> None:
         """
-        Reçoit un objet tournois partiellement chargé, le charge entièrement, l'affiche et en affiche les contrôle
+        Reçoit un objet tournoi ou l'id d'un tournoi, le charge entièrement, l'affiche et en affiche les contrôle
         """
-        active_tournament = self.load_tournament_by_tournament_id(tournament_obj.tournament_id)
+        tournament_id = tournament if isinstance(tournament, int) else tournament.tournament_id
+        active_tournament = self.load_tournament_by_tournament_id(tournament_id)
         self.display_tournament(active_tournament)
         self.get_tournament_controls(active_tournament)
 
@@ -314,14 +391,19 @@ class TournamentC:
         """
         Reçoit un object tournoi, retourne le tour qui doit être joué pour progresser le tournoi s'il est disponible,
         sinon retourne False
+        La création du tour, de ses matchs et la sauvegarde du tournoi sont regroupées dans une unité de travail.
         """
+        with self.loader.unit_of_work():
+            return self._get_next_turn(tournament)
+
+    def _get_next_turn(self, tournament: tournament_model.TournamentM) -> turn_model.TurnM | bool:
         if tournament.turn_list and not tournament.turn_list[-1].finished:
             return tournament.turn_list[-1]
 
         if tournament.is_finished:
             return False
 
-        players_pair_list = tournament.get_next_turn_player_pair()
+        players_pair_list = self.get_next_turn_player_pair(tournament)
         if not players_pair_list:
             return False
 
@@ -338,8 +420,84 @@ class TournamentC:
 
         tournament.register_turn(next_turn)
         self.save_tournament(tournament)
+        self.watch_turn_results(tournament)
         return next_turn
 
+    def watch_turn_results(self, tournament: tournament_model.TournamentM) -> None:
+        """
+        Suit les résultats des matchs du tour en cours d'un tournoi : dès que le dernier résultat est saisi,
+        l'appariement du tour suivant est calculé en arrière-plan
+        """
+        self.watched_tournament = tournament
+        if not tournament.turn_list:
+            return
+        for match in tournament.turn_list[-1].match_list:
+            if self.on_match_result not in match.result_listeners:
+                match.result_listeners.append(self.on_match_result)
+        self.on_match_result()
+
+    def on_match_result(self, match: match_model.MatchM | None = None) -> None:
+        tournament = self.watched_tournament
+        if tournament is None or not tournament.turn_list:
+            return
+        if match is not None and match not in tournament.turn_list[-1].match_list:
+            return
+        # TurnM.finished clôture le tour, seul le résultat des matchs est consulté ici
+        if any(turn_match.winner is None for turn_match in tournament.turn_list[-1].match_list):
+            return
+        if tournament.get_current_turn_nbr() >= tournament.turn_nbr:
+            return
+        self.start_next_pairing(tournament)
+
+    def start_next_pairing(self, tournament: tournament_model.TournamentM) -> None:
+        """
+        Lance dans un thread dédié le calcul de l'appariement du tour suivant. Un calcul déjà lancé avec la même
+        clé d'appariement n'est pas relancé, un calcul obsolète est attendu puis abandonné.
+        """
+        pairing_key = (id(tournament), tournament.get_pairing_key())
+        if self.pairing_thread is not None and self.pairing_key == pairing_key:
+            return
+        self.discard_next_pairing()
+        # Le classement, l'état compact et l'historique des adversaires sont construits ici, les relations du
+        # tournoi sont chargées depuis le thread principal : le thread ne fait que les lire
+        tournament.prepare_pairing()
+        self.pairing_key = pairing_key
+        self.pairing_thread = threading.Thread(target=self._compute_next_pairing, args=[tournament], daemon=True)
+        self.pairing_thread.start()
+
+    def _compute_next_pairing(self, tournament: tournament_model.TournamentM) -> None:
+        try:
+            self.precomputed_pairing['player_pair'], self.precomputed_pairing['history_reset'] = \
+                tournament.compute_next_turn_pairing()
+        except Exception as error:
+            self.precomputed_pairing['error'] = error
+
+    def discard_next_pairing(self) -> None:
+        if self.pairing_thread is not None:
+            self.pairing_thread.join()
+        self.pairing_thread = None
+        self.pairing_key = None
+        self.precomputed_pairing = dict()
+
+    def get_next_turn_player_pair(self, tournament: tournament_model.TournamentM) -> List:
+        """
+        Retourne l'appariement du tour suivant, celui calculé en arrière-plan si sa clé correspond toujours au
+        tournoi (aucun résultat modifié depuis son lancement), sinon il est calculé immédiatement. La réinitialisation
+        des adversaires demandée par un appariement calculé d'avance est appliquée ici, dans le thread principal.
+        """
+        if self.pairing_thread is not None:
+            self.pairing_thread.join()
+            precomputed_pairing = self.precomputed_pairing
+            is_valid = self.pairing_key == (id(tournament), tournament.get_pairing_key())
+            self.discard_next_pairing()
+            if is_valid and 'error' in precomputed_pairing:
+                raise precomputed_pairing['error']
+            if is_valid:
+                if precomputed_pairing['history_reset']:
+                    tournament.reset_opponent_history()
+                return precomputed_pairing['player_pair']
+        return tournament.get_next_turn_player_pair()
+
     def switch_to_turn_control(self,
                                tournament: tournament_model.TournamentM,
                                finished: bool = False) -> None:
@@ -358,6 +516,8 @@ class TournamentC:
         self.app_messenger.accept_event(config.AppInput.QUIT)
 
         self.app_messenger.send_event(config.AppInput.VIEW_TURN_LIST, [tournament.turn_list, None, finished])
+        if not finished:
+            self.watch_turn_results(tournament)
 
     def resume_tournament(self, tournament: tournament_model.TournamentM) -> None:
         """
@@ -379,10 +539,13 @@ class TournamentC:
 
     def view_tournament_leaderboard(self, tournament_obj: tournament_model.TournamentM) -> None:
         """
-        Reçoit un objet tournoi et affiche le classement complet du tour pour chacun des tours du tournoi
+        Reçoit un objet tournoi et affiche le classement complet du tour pour chacun des tours du tournoi, départagé
+        sur les tours joués jusqu'à celui-ci
         """
+        turn_tie_breaks = tie_break.TieBreaks()
         for turn in tournament_obj.turn_list:
-            self.app_messenger.send_event(config.AppInput.DISPLAY_TURN_RANKING, [turn])
+            turn_tie_breaks.record_turn(turn)
+            self.app_messenger.send_event(config.AppInput.DISPLAY_TURN_RANKING, [turn, -1, None, turn_tie_breaks])
 
     def get_full_tournament_data(self, tournament_obj: tournament_model.TournamentM) -> Tuple[List, int, int]:
         """
@@ -3,11 +3,14 @@ from __future__ import annotations
 from typing import Dict, List, Any, Tuple
 
 from core import tinydb_loader, mainview, messenger
+from data import config
 from data.config import AppInput
 
-from chess_manager.M import turn_model
+from chess_manager.M import turn_model, standings, tie_break
 from chess_manager.V import turn_view
 
+DB_NAME = config.TURN_DB_NAME
+
 
 def _get_turn_obj_from_turn_dict(turn_dict: Dict) -> turn_model.TurnM:
     return turn_model.TurnM(**turn_dict)
@@ -26,6 +29,7 @@ class TurnC:
         app_messenger.register_call_event(AppInput.SET_TURN_ACTIV, self.set_turn_as_active)
         app_messenger.register_call_event(AppInput.NEW_TURN, self.create_new_turn_from_turn_dict)
         app_messenger.register_call_event(AppInput.LOAD_TURN, self.load_turn_obj_from_turn_id)
+        app_messenger.register_call_event(AppInput.LOAD_TURN_LIST, self.load_turns_obj_from_turn_id_list)
         app_messenger.register_call_event(AppInput.SAVE_TURN, self.save_turn_obj)
         app_messenger.register_call_event(AppInput.END_TURN, self.end_turn_obj)
 
@@ -50,30 +54,66 @@ class TurnC:
     def create_new_turn_from_turn_dict(self, turn_data: Dict) -> turn_model.TurnM:
         """
         Reçoit les données de création d'un tour, génère le tour complétement, le sauvegarde et le retourne
+        Les matchs et le tour sont sauvegardés dans une seule unité de travail du loader.
         """
         player_pair_list = turn_data.pop('player_pair')
         new_turn = _get_turn_obj_from_turn_dict(turn_data)
-        self.feed_turn(new_turn, player_pair_list)
-        self.save_turn_obj(new_turn)
+        with self.loader.unit_of_work():
+            self.feed_turn(new_turn, player_pair_list)
+            self.save_turn_obj(new_turn)
         return new_turn
 
     def set_turn_as_active(self, turn: turn_model.TurnM, tournament_finished: bool = False):
         """
-        Reçoit un objet tour, le sauvegarde et en affiche la liste de matchs
+        Reçoit un objet tour, le sauvegarde s'il a été modifié et en affiche la liste de matchs
         """
         self.save_turn_obj(turn)
         self.app_messenger.accept_event(AppInput.VIEW_MATCH_LIST)
         self.app_messenger.send_event(AppInput.VIEW_MATCH_LIST, [turn.match_list, None, tournament_finished])
 
     def save_turn_obj(self, turn: turn_model.TurnM) -> None:
+        """Sauvegarde un objet tour s'il a été modifié depuis sa dernière sauvegarde"""
+        if not turn.is_dirty:
+            return
         turn.turn_id = self.loader.save_turn(turn.get_save_data())
+        turn.mark_as_saved()
+        self.loader.identity_map.put(DB_NAME, turn.turn_id, turn)
 
     def load_turn_obj_from_turn_id(self, turn_id: int) -> bool | turn_model.TurnM:
+        """
+        Reçoit l'id d'un tour et retourne l'objet tour en cache s'il existe, sinon le charge depuis la base de donnée.
+        Un tour chargé depuis la base ne contient que les ids de ses matchs.
+        """
+        cached_turn_obj = self.loader.identity_map.get(DB_NAME, turn_id)
+        if cached_turn_obj is not None:
+            return cached_turn_obj
+
         loaded_turn_data = self.loader.load_turn(turn_id)
         if not loaded_turn_data:
             return False
         loaded_turn_obj = _get_turn_obj_from_turn_dict(loaded_turn_data)
-        return loaded_turn_obj
+        loaded_turn_obj.mark_as_saved(loaded_turn_data)
+        return self.loader.identity_map.put(DB_NAME, turn_id, loaded_turn_obj)
+
+    def load_turns_obj_from_turn_id_list(self, turn_id_list: List) -> List:
+        """
+        Reçoit une liste de turn_id et retourne la liste des objets tours correspondants. Les tours absents du cache
+        sont résolus en une seule lecture de la base de donnée, les ids inexistants sont ignorés.
+        """
+        turn_by_id = dict()
+        for turn_id in turn_id_list:
+            cached_turn_obj = self.loader.identity_map.get(DB_NAME, turn_id)
+            if cached_turn_obj is not None:
+                turn_by_id[turn_id] = cached_turn_obj
+
+        turn_id_to_load = [turn_id for turn_id in turn_id_list if turn_id not in turn_by_id]
+        for turn_data in self.loader.load_turns(turn_id_to_load):
+            loaded_turn_obj = _get_turn_obj_from_turn_dict(turn_data)
+            loaded_turn_obj.mark_as_saved(turn_data)
+            turn_by_id[turn_data['turn_id']] = self.loader.identity_map.put(DB_NAME, turn_data['turn_id'],
+                                                                            loaded_turn_obj)
+
+        return [turn_by_id[turn_id] for turn_id in turn_id_list if turn_id in turn_by_id]
 
     def end_turn_obj(self, turn: turn_model.TurnM):
         """
@@ -104,32 +144,71 @@ class TurnC:
             self.app_messenger.accept_event(turn_str, call_event=updated_event_call,
                                             event_arg=[turn, tournament_finished])
 
-    def get_turn_ranking(self, turn: turn_model.TurnM, nbr_player_to_display: int = -1) -> List:
+    def get_turn_ranking(self, turn: turn_model.TurnM, nbr_player_to_display: int = -1,
+                         tournament_standings: standings.Standings | None = None,
+                         turn_tie_breaks: tie_break.TieBreaks | None = None,
+                         with_tie_breaks: bool = True) -> List:
         """
-        Reçoit un objet tour chargé, ordonne les joueurs en fonction de leur score et retourne la représentation
-        du classement en fonction du nombre de joueurs à afficher.
+        Reçoit un objet tour chargé, ordonne les joueurs en fonction de leur score puis de leurs départages et
+        retourne la représentation du classement en fonction du nombre de joueurs à afficher.
         Si aucun nombre n'est précisé l'intégralité des joueurs du tour sont affichés
+        Si le classement du tournoi est transmis (tour en cours), les premiers joueurs y sont lus directement.
+        Les départages d'un tour passé sont calculés sur les tours transmis ('turn_tie_breaks'), à défaut sur ce
+        seul tour.
+        Sans départages ('with_tie_breaks' faux), les joueurs sont classés par les scores cumulés du tour seul.
         """
+        if not with_tie_breaks:
+            return self._get_score_ranking(turn, nbr_player_to_display, tournament_standings)
         to_return = list()
-        turn_data = turn.get_turn_data()
-
-        ordered_player = sorted(turn_data, key=lambda turn_player_data: turn_player_data[1], reverse=True)
+        if tournament_standings is not None:
+            turn_tie_breaks = tournament_standings.tie_breaks
+            ordered_player = tournament_standings.get_ranking(nbr_player_to_display)
+        else:
+            if turn_tie_breaks is None:
+                turn_tie_breaks = tie_break.TieBreaks()
+                turn_tie_breaks.record_turn(turn)
+            ordered_player = turn_tie_breaks.sort_player_data(turn.get_turn_data())
         if nbr_player_to_display == -1 or nbr_player_to_display > len(ordered_player):
             nbr_player_to_display = len(ordered_player)
 
         for player_ranking, player_data in enumerate(ordered_player[:nbr_player_to_display]):
             player_flat_view = self.app_messenger.send_event(AppInput.PLAYER_FLAT_VIEW, [player_data[0]])
-            ranking_display = f"{player_ranking + 1} : {player_flat_view} -> {player_data[1]} Pts"
+            tie_break_view = turn_tie_breaks.get_flat_view(player_data[0].player_id)
+            ranking_display = f"{player_ranking + 1} : {player_flat_view} -> {player_data[1]} Pts ({tie_break_view})"
             to_return.append(ranking_display)
         return to_return
 
-    def display_turn_ranking(self, turn: turn_model.TurnM, nbr_player_to_display: int = -1) -> None:
+    def _get_score_ranking(self, turn: turn_model.TurnM, nbr_player_to_display: int,
+                           tournament_standings: standings.Standings | None) -> List:
+        """
+        Classement par score sans départages, lu dans le classement du tournoi s'il est déjà construit, sinon dans
+        les scores cumulés des matchs du tour : seul ce tour est chargé
+        """
+        if tournament_standings is not None:
+            ordered_player = tournament_standings.get_top(nbr_player_to_display)
+        else:
+            ordered_player = sorted(turn.get_turn_data(), key=lambda turn_player_data: turn_player_data[1],
+                                    reverse=True)
+        if nbr_player_to_display == -1 or nbr_player_to_display > len(ordered_player):
+            nbr_player_to_display = len(ordered_player)
+
+        to_return = list()
+        for player_ranking, player_data in enumerate(ordered_player[:nbr_player_to_display]):
+            player_flat_view = self.app_messenger.send_event(AppInput.PLAYER_FLAT_VIEW, [player_data[0]])
+            to_return.append(f"{player_ranking + 1} : {player_flat_view} -> {player_data[1]} Pts")
+        return to_return
+
+    def display_turn_ranking(self, turn: turn_model.TurnM, nbr_player_to_display: int = -1,
+                             tournament_standings: standings.Standings | None = None,
+                             turn_tie_breaks: tie_break.TieBreaks | None = None,
+                             with_tie_breaks: bool = True) -> None:
         """
         Reçoit un tour et un nombre de places de podium à afficher, génère le classement du tour et affiche le podium
         sur la vue principale.
         Si le nombre de joueurs n'est pas précisé, l'intégralité des joueurs du tour sont affichés
         """
-        ranking_display = self.get_turn_ranking(turn, nbr_player_to_display)
+        ranking_display = self.get_turn_ranking(turn, nbr_player_to_display, tournament_standings, turn_tie_breaks,
+                                                with_tie_breaks)
         self.main_view.add_to_display(f"{turn.name} ranking :")
         for individual_player_score in ranking_display:
             self.main_view.add_to_display(individual_player_score)
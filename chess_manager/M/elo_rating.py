@@ -0,0 +1,142 @@
+"""
+Classement Elo calculé à partir de l'historique des matchs.
+
+Les parties sont regroupées en périodes de classement (un tour, un tournoi ou un paquet de l'archive) : toutes les
+parties d'une période sont évaluées à partir des classements du début de période, les variations sont ensuite
+appliquées ensemble. Une période est ainsi traitée en une passe sur des tableaux (index des joueurs, résultats),
+vectorisée avec numpy s'il est installé, en python pur sinon.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+from chess_manager.M import tournament_model
+
+try:
+    import numpy
+except ImportError:  # numpy est optionnel, le calcul se fait alors en python pur
+    numpy = None
+
+DEFAULT_RATING = 1500.
+K_FACTOR = 20.
+RATING_SCALE = 400.
+
+
+def get_expected_score(rating: float, opponent_rating: float) -> float:
+    """Score attendu d'un joueur face à un adversaire, de 0 à 1"""
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / RATING_SCALE))
+
+
+def get_player_1_result(match_data: Dict) -> float | None:
+    """Points gagnés par le premier joueur d'un match sauvegardé, None si le match n'est pas terminé"""
+    winner = match_data['winner']
+    if winner is None:
+        return None
+    if not winner:
+        return .5
+    return 1. if winner == match_data['player_1'] else 0.
+
+
+@dataclass
+class RatingPeriod:
+    """Parties d'une période de classement, en tableaux parallèles d'index de joueurs et de résultats"""
+    player_1_index: List[int] = field(default_factory=list)
+    player_2_index: List[int] = field(default_factory=list)
+    player_1_result: List[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.player_1_result)
+
+    def add_game(self, player_1_index: int, player_2_index: int, player_1_result: float) -> None:
+        self.player_1_index.append(player_1_index)
+        self.player_2_index.append(player_2_index)
+        self.player_1_result.append(player_1_result)
+
+
+def get_rating_periods(match_data_periods: Iterable[List[Dict]], index_by_player_id: Dict[int, int]) -> List:
+    """
+    Reçoit des périodes de matchs sauvegardés (dictionnaires de get_save_data) et l'index de chaque joueur déjà
+    connu, retourne les périodes de classement des matchs terminés. Les nouveaux joueurs sont ajoutés à l'index.
+    """
+    rating_periods = list()
+    for match_data_list in match_data_periods:
+        rating_period = RatingPeriod()
+        for match_data in match_data_list:
+            player_1_result = get_player_1_result(match_data)
+            if player_1_result is None:
+                continue
+            player_1_index = index_by_player_id.setdefault(match_data['player_1'], len(index_by_player_id))
+            player_2_index = index_by_player_id.setdefault(match_data['player_2'], len(index_by_player_id))
+            rating_period.add_game(player_1_index, player_2_index, player_1_result)
+        if rating_period:
+            rating_periods.append(rating_period)
+    return rating_periods
+
+
+def _apply_rating_period(ratings: List[float], rating_period: RatingPeriod, k_factor: float) -> None:
+    """Applique en python pur les variations de classement d'une période à la liste des classements"""
+    rating_changes = dict()
+    for player_1_index, player_2_index, player_1_result in zip(rating_period.player_1_index,
+                                                               rating_period.player_2_index,
+                                                               rating_period.player_1_result):
+        expected_score = get_expected_score(ratings[player_1_index], ratings[player_2_index])
+        rating_change = k_factor * (player_1_result - expected_score)
+        rating_changes[player_1_index] = rating_changes.get(player_1_index, 0) + rating_change
+        rating_changes[player_2_index] = rating_changes.get(player_2_index, 0) - rating_change
+    for player_index, rating_change in rating_changes.items():
+        ratings[player_index] += rating_change
+
+
+def _apply_rating_period_numpy(ratings: numpy.ndarray, rating_period: RatingPeriod, k_factor: float) -> None:
+    """Applique en une passe vectorisée les variations de classement d'une période au tableau des classements"""
+    player_1_index = numpy.asarray(rating_period.player_1_index)
+    player_2_index = numpy.asarray(rating_period.player_2_index)
+    expected_score = 1 / (1 + 10 ** ((ratings[player_2_index] - ratings[player_1_index]) / RATING_SCALE))
+    rating_change = k_factor * (numpy.asarray(rating_period.player_1_result) - expected_score)
+    ratings += numpy.bincount(player_1_index, weights=rating_change, minlength=len(ratings))
+    ratings -= numpy.bincount(player_2_index, weights=rating_change, minlength=len(ratings))
+
+
+def compute_ratings(rating_periods: List[RatingPeriod], ratings: List[float], k_factor: float = K_FACTOR,
+                    use_numpy: bool | None = None) -> List[float]:
+    """
+    Reçoit des périodes de classement dans l'ordre chronologique et les classements initiaux des joueurs (par
+    index), retourne les classements après la dernière période. numpy est utilisé par défaut s'il est installé.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if not use_numpy:
+        ratings = list(ratings)
+        for rating_period in rating_periods:
+            _apply_rating_period(ratings, rating_period, k_factor)
+        return ratings
+
+    rating_array = numpy.array(ratings, dtype=float)
+    for rating_period in rating_periods:
+        _apply_rating_period_numpy(rating_array, rating_period, k_factor)
+    return rating_array.tolist()
+
+
+def compute_ratings_from_matches(match_data_periods: Iterable[List[Dict]],
+                                 initial_rating_by_player_id: Dict[int, float] | None = None,
+                                 k_factor: float = K_FACTOR,
+                                 use_numpy: bool | None = None) -> Dict[int, float]:
+    """
+    Reçoit des périodes de matchs sauvegardés dans l'ordre chronologique (les tours d'un tournoi, les tournois de
+    l'archive...) et les classements connus avant la première période, retourne le classement de chaque joueur.
+    Un joueur sans classement connu commence à DEFAULT_RATING.
+    """
+    if initial_rating_by_player_id is None:
+        initial_rating_by_player_id = dict()
+    index_by_player_id = {player_id: index for index, player_id in enumerate(initial_rating_by_player_id)}
+    rating_periods = get_rating_periods(match_data_periods, index_by_player_id)
+
+    initial_ratings = [initial_rating_by_player_id.get(player_id, DEFAULT_RATING) for player_id in index_by_player_id]
+    ratings = compute_ratings(rating_periods, initial_ratings, k_factor, use_numpy)
+    return dict(zip(index_by_player_id, ratings))
+
+
+def get_tournament_match_periods(tournament: tournament_model.TournamentM) -> List[List[Dict]]:
+    """Retourne les matchs sauvegardés d'un tournoi, une période de classement par tour"""
+    return [[match.get_save_data() for match in turn.match_list] for turn in tournament.turn_list]
@@ -0,0 +1,99 @@
+"""
+Relations chargées à la demande entre modèles : joueurs et tours d'un tournoi, matchs d'un tour.
+
+Une LazyList est créée avec les ids des objets liés et une fonction de chargement (liste d'ids -> liste d'objets). Sa
+longueur et les ids de ses objets sont connus sans chargement, l'accès à un élément par son index ne charge que cet
+élément, toute autre utilisation (itération, tranche, modification...) charge en une fois les éléments manquants.
+"""
+from __future__ import annotations
+
+from collections.abc import MutableSequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+
+class LazyList(MutableSequence):
+    def __init__(self, entry_id_list: Iterable, load_entries: Callable, id_attribute: str) -> None:
+        self.entry_id_list = list(entry_id_list)
+        self.load_entries = load_entries
+        self.id_attribute = id_attribute
+        self.entry_by_index: Dict[int, Any] = dict()
+        self.entries: List | None = None
+
+    @property
+    def is_resolved(self) -> bool:
+        return self.entries is not None
+
+    def _load_entry_by_id(self, entry_id_list: List) -> Dict:
+        return {getattr(entry, self.id_attribute): entry for entry in self.load_entries(entry_id_list)}
+
+    def resolve(self) -> List:
+        """Charge en une fois les éléments pas encore chargés, les ids inexistants sont ignorés"""
+        if self.entries is None:
+            missing_index = [index for index in range(len(self.entry_id_list)) if index not in self.entry_by_index]
+            entry_by_id = self._load_entry_by_id([self.entry_id_list[index] for index in missing_index])
+            for index in missing_index:
+                if self.entry_id_list[index] in entry_by_id:
+                    self.entry_by_index[index] = entry_by_id[self.entry_id_list[index]]
+            self.entries = [self.entry_by_index[index] for index in range(len(self.entry_id_list))
+                            if index in self.entry_by_index]
+            self.entry_by_index.clear()
+        return self.entries
+
+    def get_id_list(self) -> List:
+        """Retourne les ids des objets de la liste sans les charger"""
+        if self.entries is None:
+            return self.entry_id_list[:]
+        return [getattr(entry, self.id_attribute) for entry in self.entries]
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if self.entries is not None or isinstance(index, slice):
+            return self.resolve()[index]
+        if index < 0:
+            index += len(self.entry_id_list)
+        if not 0 <= index < len(self.entry_id_list):
+            raise IndexError("LazyList index out of range")
+        if index not in self.entry_by_index:
+            entry_id = self.entry_id_list[index]
+            entry_by_id = self._load_entry_by_id([entry_id])
+            if entry_id not in entry_by_id:
+                # L'élément n'existe pas : la liste est chargée entièrement pour que les index restent cohérents
+                return self.resolve()[index]
+            self.entry_by_index[index] = entry_by_id[entry_id]
+        return self.entry_by_index[index]
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        self.resolve()[index] = value
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self.resolve()[index]
+
+    def __len__(self) -> int:
+        if self.entries is None:
+            return len(self.entry_id_list)
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.resolve())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyList):
+            other = other.resolve()
+        return self.resolve() == other
+
+    def __repr__(self) -> str:
+        if self.entries is None:
+            return f"LazyList({self.entry_id_list!r})"
+        return repr(self.entries)
+
+    def insert(self, index: int, value: Any) -> None:
+        self.resolve().insert(index, value)
+
+    def sort(self, *args, **kwargs) -> None:
+        self.resolve().sort(*args, **kwargs)
+
+
+def get_id_list(entry_list: List, id_attribute: str) -> List:
+    """Retourne les ids des objets d'une liste, sans charger ceux d'une liste à la demande"""
+    if isinstance(entry_list, LazyList):
+        return entry_list.get_id_list()
+    return [getattr(entry, id_attribute) for entry in entry_list]
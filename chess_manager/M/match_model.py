@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple, Dict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
 
-from chess_manager.M import player_model
+from chess_manager.M import player_model, save_tracking
 
 
 @dataclass
-class MatchM:
+class MatchM(save_tracking.SaveTrackedM):
     """Représentation d'un match entre deux joueurs."""
     player_1: player_model.PlayerM
     player_1_score: int
@@ -15,10 +15,8 @@ class MatchM:
     player_2_score: int
     winner: bool or None = None
     match_id: int = -1
-
-    def __post_init__(self) -> None:
-        self.player_1.already_played_against.append(self.player_2)
-        self.player_2.already_played_against.append(self.player_1)
+    # Fonctions appelées avec le match à chaque résultat enregistré (mise à jour du classement du tournoi)
+    result_listeners: List[Callable] = field(default_factory=list, repr=False, compare=False)
 
     def get_match_data(self) -> Tuple:
         """Retourne des tuples (joueur, score) pour être stocké dans un objet 'tour'."""
@@ -31,6 +29,7 @@ class MatchM:
             self.player_1_score += .5
             self.player_2_score += .5
             self.winner = False
+            self._notify_result()
             return
         if winner is self.player_1:
             self.player_1_score += 1
@@ -40,6 +39,11 @@ class MatchM:
             raise ValueError
 
         self.winner = winner.player_id
+        self._notify_result()
+
+    def _notify_result(self) -> None:
+        for result_listener in self.result_listeners:
+            result_listener(self)
 
     def get_save_data(self) -> Dict:
         return {"player_1": self.player_1.player_id,
@@ -48,3 +52,31 @@ class MatchM:
                 "player_2_score": self.player_2_score,
                 "winner": self.winner,
                 "match_id": self.match_id}
+
+
+class RecordedMatchSet:
+    """
+    Matchs déjà pris en compte par un calcul (départages, état du tournoi). Un match sauvegardé est reconnu par son id
+    en base, y compris rechargé dans un nouvel objet. Un match pas encore sauvegardé est reconnu par l'objet lui-même,
+    conservé pour que son adresse mémoire ne puisse pas être réattribuée à un autre objet.
+    """
+
+    def __init__(self) -> None:
+        self.match_ids = set()
+        self.unsaved_match_by_address: Dict[int, MatchM] = dict()
+
+    def add(self, match: MatchM) -> bool:
+        """Ajoute un match, retourne False s'il avait déjà été ajouté"""
+        if self.unsaved_match_by_address.get(id(match)) is match or match.match_id in self.match_ids:
+            return False
+        if match.match_id == -1:
+            self.unsaved_match_by_address[id(match)] = match
+        else:
+            self.match_ids.add(match.match_id)
+        return True
+
+    def copy(self) -> RecordedMatchSet:
+        match_set = RecordedMatchSet()
+        match_set.match_ids = set(self.match_ids)
+        match_set.unsaved_match_by_address = dict(self.unsaved_match_by_address)
+        return match_set
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from itertools import groupby
+from typing import Dict, List, Tuple
+
+from core import max_weight_matching
+from chess_manager.M import tournament_state
+
+# Poids des critères d'appariement : écart de score (au carré, en demi-points), déséquilibre de couleur des deux
+# joueurs et écart de classement (départage entre appariements équivalents).
+SCORE_DIFF_WEIGHT = 1000
+COLOUR_WEIGHT = 100
+RANK_DISTANCE_WEIGHT = 1
+
+# Nombre de joueurs suivants dans le classement auxquels chaque joueur est relié lors de la première tentative.
+# Le voisinage est doublé tant que le couplage n'apparie pas tous les joueurs sans revanche.
+PAIRING_NEIGHBOURHOOD = 24
+# Les grands tournois sont appariés par blocs consécutifs du classement (de PAIRING_BLOCK_SIZE à deux fois
+# PAIRING_BLOCK_SIZE joueurs), les joueurs qu'un bloc ne peut apparier sans revanche sont reportés au bloc suivant.
+# Le couplage étant en O(n³), le coût d'une ronde devient linéaire en nombre de joueurs.
+PAIRING_BLOCK_SIZE = 64
+# Appariement par groupes de score : nombre maximum d'adversaires examinés dans la moitié basse d'un groupe pour un
+# joueur de la moitié haute avant de le reporter au groupe suivant.
+DUTCH_SEARCH_LIMIT = 32
+
+
+def _get_pair_cost(player_data: List, other_player_data: List, rank_distance: int, colour_balance: Dict) -> int:
+    """Coût d'un appariement entre deux joueurs, hors revanche"""
+    score_diff = int(2 * (player_data[1] - other_player_data[1]))
+    balance = colour_balance.get(player_data[0].player_id, 0)
+    other_balance = colour_balance.get(other_player_data[0].player_id, 0)
+    colour_cost = 0
+    # Les deux joueurs attendent la même couleur
+    if balance * other_balance > 0:
+        colour_cost = min(abs(balance), abs(other_balance))
+    return SCORE_DIFF_WEIGHT * score_diff ** 2 + COLOUR_WEIGHT * colour_cost + RANK_DISTANCE_WEIGHT * rank_distance
+
+
+def _get_weighted_edges(ordered_player_data: List, state: tournament_state.TournamentState, colour_balance: Dict,
+                        neighbourhood: int, allow_rematch: bool) -> List[Tuple]:
+    """
+    Construit le graphe pondéré des appariements possibles entre chaque joueur et ses 'neighbourhood' suivants dans
+    le classement. Le poids d'une arête décroît avec son coût. Une revanche coûte plus que tous les autres
+    appariements réunis, ou est exclue du graphe si elle n'est pas autorisée.
+    """
+    nbr_of_player = len(ordered_player_data)
+    cost_by_pair = dict()
+    for index, player_data in enumerate(ordered_player_data):
+        for other_index in range(index + 1, min(nbr_of_player, index + 1 + neighbourhood)):
+            other_player_data = ordered_player_data[other_index]
+            cost_by_pair[index, other_index] = _get_pair_cost(player_data, other_player_data,
+                                                              other_index - index, colour_balance)
+
+    max_cost = max(cost_by_pair.values(), default=0)
+    rematch_cost = (max_cost + 1) * (nbr_of_player // 2 + 1)
+    base_weight = max_cost + rematch_cost + 1
+    edges = list()
+    for (index, other_index), pair_cost in cost_by_pair.items():
+        if state.has_played(ordered_player_data[index][0].player_id, ordered_player_data[other_index][0].player_id):
+            if not allow_rematch:
+                continue
+            pair_cost += rematch_cost
+        edges.append((index, other_index, base_weight - pair_cost))
+    return edges
+
+
+def _orient_pair(player_data: List, other_player_data: List, colour_balance: Dict) -> Tuple:
+    """Le joueur le plus en attente des blancs est placé en premier, à défaut le mieux classé"""
+    if colour_balance.get(other_player_data[0].player_id, 0) < colour_balance.get(player_data[0].player_id, 0):
+        return other_player_data, player_data
+    return player_data, other_player_data
+
+
+def _pair_block(ordered_player_data: List, state: tournament_state.TournamentState, colour_balance: Dict,
+                allow_rematch: bool) -> Tuple[List, List]:
+    """
+    Apparie un bloc de joueurs classés par couplage de poids maximum, retourne les paires et les joueurs restés sans
+    adversaire.
+    """
+    nbr_of_player = len(ordered_player_data)
+    nbr_of_pair = nbr_of_player // 2
+    pair_index_list = list()
+    neighbourhood = PAIRING_NEIGHBOURHOOD
+    while nbr_of_pair > 0:
+        edges = _get_weighted_edges(ordered_player_data, state, colour_balance, neighbourhood, allow_rematch)
+        mate = max_weight_matching.max_weight_matching(edges, max_cardinality=True)
+        pair_index_list = [(index, mate_index) for index, mate_index in enumerate(mate) if mate_index > index]
+        has_rematch = any(state.has_played(ordered_player_data[index][0].player_id,
+                                           ordered_player_data[mate_index][0].player_id)
+                          for index, mate_index in pair_index_list)
+        if (len(pair_index_list) == nbr_of_pair and not has_rematch) or neighbourhood >= nbr_of_player:
+            break
+        neighbourhood *= 2
+
+    paired_index = {index for pair_index in pair_index_list for index in pair_index}
+    player_pairs = [_orient_pair(ordered_player_data[index], ordered_player_data[mate_index], colour_balance)
+                    for index, mate_index in pair_index_list]
+    unpaired = [player_data for index, player_data in enumerate(ordered_player_data) if index not in paired_index]
+    return player_pairs, unpaired
+
+
+def _get_state(ordered_player_data: List,
+               state: tournament_state.TournamentState | None) -> tournament_state.TournamentState:
+    """Sans état du tournoi, les joueurs n'ont ni adversaire ni couleur jouée"""
+    if state is None:
+        return tournament_state.TournamentState([player_data[0].player_id for player_data in ordered_player_data])
+    return state
+
+
+def make_max_weight_player_pair(ordered_player_data: List,
+                                state: tournament_state.TournamentState | None = None) -> List:
+    """
+    Reçoit une liste de (joueurs, score) classée par score décroissant et l'état compact du tournoi (adversaires
+    rencontrés et équilibre de couleur de chaque joueur), retourne la liste de paires (joueur, score) qui maximise le
+    poids total du graphe d'appariement : aucune revanche si c'est évitable, puis écarts de score et déséquilibres de
+    couleur minimaux.
+    Avec un nombre impair de joueurs, un joueur reste sans adversaire.
+    """
+    state = _get_state(ordered_player_data, state)
+    colour_balance = state.get_colour_balance()
+
+    player_pairs = list()
+    carried_player_data = list()
+    block_start = 0
+    while block_start < len(ordered_player_data):
+        # Le dernier bloc contient tous les joueurs restants et autorise les revanches inévitables
+        is_last_block = block_start + 2 * PAIRING_BLOCK_SIZE > len(ordered_player_data)
+        block_end = len(ordered_player_data) if is_last_block else block_start + PAIRING_BLOCK_SIZE
+        block = [*carried_player_data, *ordered_player_data[block_start:block_end]]
+        block_pairs, carried_player_data = _pair_block(block, state, colour_balance, allow_rematch=is_last_block)
+        player_pairs.extend(block_pairs)
+        block_start = block_end
+    return player_pairs
+
+
+def _is_colour_compatible(player_data: List, other_player_data: List, colour_balance: Dict) -> bool:
+    """Deux joueurs sont compatibles s'ils n'attendent pas tous les deux la même couleur"""
+    return colour_balance.get(player_data[0].player_id, 0) * colour_balance.get(other_player_data[0].player_id, 0) <= 0
+
+
+def _find_opponent_index(player_data: List, candidate_list: List, state: tournament_state.TournamentState,
+                         colour_balance: Dict) -> int:
+    """
+    Retourne l'index du premier adversaire de la liste que le joueur n'a pas encore rencontré, de préférence de
+    couleur compatible. Retourne -1 si aucun des DUTCH_SEARCH_LIMIT premiers candidats ne convient.
+    """
+    first_new_opponent_index = -1
+    for candidate_index, candidate_data in enumerate(candidate_list[:DUTCH_SEARCH_LIMIT]):
+        if state.has_played(player_data[0].player_id, candidate_data[0].player_id):
+            continue
+        if _is_colour_compatible(player_data, candidate_data, colour_balance):
+            return candidate_index
+        if first_new_opponent_index == -1:
+            first_new_opponent_index = candidate_index
+    return first_new_opponent_index
+
+
+def _pair_score_group(score_group: List, state: tournament_state.TournamentState,
+                      colour_balance: Dict) -> Tuple[List, List]:
+    """
+    Apparie un groupe de score : la moitié haute contre la moitié basse, dans l'ordre du classement. Un joueur sans
+    adversaire possible dans la moitié basse est apparié avec les autres joueurs restants si possible, sinon il est
+    reporté au groupe suivant. Retourne les paires et les joueurs reportés.
+    """
+    half = len(score_group) // 2
+    bottom_half = score_group[half:]
+    player_pairs = list()
+    unpaired = list()
+    for player_data in score_group[:half]:
+        opponent_index = _find_opponent_index(player_data, bottom_half, state, colour_balance)
+        if opponent_index == -1:
+            unpaired.append(player_data)
+            continue
+        player_pairs.append(_orient_pair(player_data, bottom_half.pop(opponent_index), colour_balance))
+
+    remaining = [*unpaired, *bottom_half]
+    floaters = list()
+    while remaining:
+        player_data = remaining.pop(0)
+        opponent_index = _find_opponent_index(player_data, remaining, state, colour_balance)
+        if opponent_index == -1:
+            floaters.append(player_data)
+            continue
+        player_pairs.append(_orient_pair(player_data, remaining.pop(opponent_index), colour_balance))
+    return player_pairs, floaters
+
+
+def make_dutch_player_pair(ordered_player_data: List, state: tournament_state.TournamentState | None = None) -> List:
+    """
+    Appariement par groupes de score inspiré du système suisse hollandais : les joueurs sont répartis par score,
+    chaque groupe est apparié moitié haute contre moitié basse et les joueurs non appariés descendent dans le groupe
+    suivant. Le coût d'une ronde dépend de la taille des groupes de score et non du nombre de joueurs.
+    Les joueurs restant en fin de classement sont appariés par couplage de poids maximum, en minimisant les
+    revanches. Les adversaires rencontrés et l'équilibre de couleur sont lus dans l'état compact du tournoi.
+    Avec un nombre impair de joueurs, un joueur reste sans adversaire.
+    """
+    state = _get_state(ordered_player_data, state)
+    colour_balance = state.get_colour_balance()
+
+    player_pairs = list()
+    floaters = list()
+    for _, score_group in groupby(ordered_player_data, key=lambda player_data: player_data[1]):
+        group_pairs, floaters = _pair_score_group([*floaters, *score_group], state, colour_balance)
+        player_pairs.extend(group_pairs)
+
+    if len(floaters) > 1:
+        last_pairs, _ = _pair_block(floaters, state, colour_balance, allow_rematch=True)
+        player_pairs.extend(last_pairs)
+    return player_pairs
+
+
+def make_berger_schedule(player_id_list: List[int]) -> List[List[List[int]]]:
+    """
+    Reçoit la liste des ids des joueurs dans l'ordre du tirage au sort, retourne le calendrier complet d'un tournoi
+    toutes rondes (tables de Berger) : pour chaque ronde, la liste des paires [id premier joueur, id second joueur].
+    Avec un nombre impair de joueurs, un joueur est exempt à chaque ronde. Le calcul est en O(n²).
+    """
+    if len(player_id_list) < 2:
+        return list()
+    seeded_id_list: List = list(player_id_list)
+    if len(seeded_id_list) % 2:
+        # Adversaire fictif : le joueur apparié avec lui est exempt de la ronde
+        seeded_id_list.append(None)
+    nbr_of_player = len(seeded_id_list)
+    fixed_id = seeded_id_list[-1]
+    rotating_id_list = seeded_id_list[:-1]
+    half = nbr_of_player // 2
+    schedule = list()
+    for round_index in range(nbr_of_player - 1):
+        # Décalage de n/2 places par ronde : n/2 et n-1 étant premiers entre eux, chaque décalage est atteint une fois
+        shift = round_index * half % (nbr_of_player - 1)
+        circle = rotating_id_list[shift:] + rotating_id_list[:shift]
+        round_pairs = [[circle[0], fixed_id] if round_index % 2 == 0 else [fixed_id, circle[0]]]
+        round_pairs.extend([circle[table], circle[nbr_of_player - 1 - table]] for table in range(1, half))
+        schedule.append([pair for pair in round_pairs if None not in pair])
+    return schedule
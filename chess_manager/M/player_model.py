@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Any, Dict
+from typing import Any, Dict, Set, Tuple
+
+from chess_manager.M import save_tracking
 
 MAX_STR_LEN = 19
 
@@ -59,24 +61,41 @@ PLAYER_FORM_VALIDATOR: Dict = {
 }
 
 
-@dataclass
-class PlayerM:
-    """Représentation d'un joueur d'échec."""
+@dataclass(eq=False)
+class PlayerM(save_tracking.SaveTrackedM):
+    """
+    Représentation d'un joueur d'échec.
+    L'historique des adversaires est un ensemble d'ids de joueurs, l'égalité et le hash reposent sur l'id du joueur.
+    """
     first_name: str
     last_name: str
     birthday: str
     ine: str
-    already_played_against: List = field(default_factory=list)
+    already_played_against: Set[int] = field(default_factory=set)
     player_id: int = -1
 
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PlayerM):
+            return NotImplemented
+        # Un joueur non sauvegardé n'a pas encore d'id, il n'est égal qu'à lui-même
+        if self.player_id == -1 or other.player_id == -1:
+            return self is other
+        return self.player_id == other.player_id
+
+    def __hash__(self) -> int:
+        return hash(self.player_id)
+
     def has_played_against(self, other_player: PlayerM) -> bool:
-        return other_player in self.already_played_against
+        return other_player.player_id in self.already_played_against
+
+    def add_opponent(self, other_player: PlayerM) -> None:
+        self.already_played_against.add(other_player.player_id)
 
     def clear_player_pairing(self) -> None:
         self.already_played_against.clear()
 
-    def get_alphab_sort(self) -> str:
-        return f"{self.last_name.upper()}{self.first_name.upper()}{self.ine.upper()}"
+    def get_alphab_sort(self) -> Tuple[str, str, str]:
+        return self.last_name.upper(), self.first_name.upper(), self.ine.upper()
 
     def get_save_data(self) -> Dict:
         return {'first_name': self.first_name,
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import copy
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class SaveTrackedM(ABC):
+    """
+    Suivi des modifications d'un modèle depuis sa dernière sauvegarde.
+    Le modèle conserve une copie des données de sa dernière sauvegarde (ou de son chargement) et les compare à ses
+    données de sauvegarde actuelles, une sauvegarde sans modification peut ainsi être évitée.
+    """
+
+    @abstractmethod
+    def get_save_data(self) -> Dict:
+        """Retourne les données sauvegardées du modèle, comparées à celles de sa dernière sauvegarde"""
+
+    def mark_as_saved(self, saved_data: Dict | None = None) -> None:
+        """
+        Enregistre l'état sauvegardé du modèle : les données reçues (données chargées depuis la base) ou à défaut ses
+        données de sauvegarde actuelles.
+        """
+        if saved_data is None:
+            saved_data = self.get_save_data()
+        self._last_saved_data = copy.deepcopy(saved_data)
+
+    def get_dirty_fields(self) -> List[str]:
+        """Retourne la liste des champs modifiés depuis la dernière sauvegarde, tous s'il n'a jamais été sauvegardé"""
+        save_data = self.get_save_data()
+        last_saved_data = getattr(self, '_last_saved_data', None)
+        if last_saved_data is None:
+            return list(save_data)
+        return [field_name for field_name, value in save_data.items() if last_saved_data.get(field_name) != value]
+
+    @property
+    def is_dirty(self) -> bool:
+        return len(self.get_dirty_fields()) > 0
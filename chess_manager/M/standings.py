@@ -0,0 +1,143 @@
+"""
+Classement d'un tournoi tenu à jour au fil des résultats des matchs.
+
+Les joueurs sont répartis par groupe de score (en demi-points). Un arbre de Fenwick compte les joueurs de chaque
+groupe : le rang d'un joueur s'obtient en O(log n). Dans un groupe, les joueurs sont départagés par leur ordre
+d'apparition dans le dernier tour, comme le tri stable des données du tour qu'il remplace, pour l'appariement, et
+par leurs départages pour l'affichage du classement.
+Cet ordre change pour tous les joueurs à chaque tour : il est tenu dans une liste d'ids, les groupes de score ne
+sont pas ordonnés et seuls les groupes affichés sont triés à la demande. L'ordre d'appariement est le tri stable par
+score de cette liste.
+"""
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Set
+
+from core.fenwick_tree import FenwickTree
+from chess_manager.M import match_model, player_model, turn_model, tie_break
+
+
+def get_score_bucket(score: float) -> int:
+    """Groupe de score d'un joueur : son score en demi-points"""
+    return int(round(score * 2))
+
+
+class Standings:
+    def __init__(self, players: List[player_model.PlayerM]) -> None:
+        self.player_by_id: Dict[int, player_model.PlayerM] = dict()
+        self.score_by_player_id: Dict[int, float] = dict()
+        self.seed_by_player_id: Dict[int, int] = dict()
+        # Ids des joueurs dans l'ordre de départage
+        self._seeded_ids: List[int] = list()
+        # Ids des joueurs de chaque groupe de score
+        self._ids_by_bucket: Dict[int, Set[int]] = dict()
+        self._bucket_counter = FenwickTree()
+        self.tie_breaks = tie_break.TieBreaks()
+        for player in players:
+            self.set_score(player, 0)
+
+    def __len__(self) -> int:
+        return len(self.score_by_player_id)
+
+    def _insert(self, player_id: int, score: float) -> None:
+        bucket = get_score_bucket(score)
+        self.score_by_player_id[player_id] = score
+        self._ids_by_bucket.setdefault(bucket, set()).add(player_id)
+        self._bucket_counter.add(bucket, 1)
+
+    def _remove(self, player_id: int) -> None:
+        bucket = get_score_bucket(self.score_by_player_id.pop(player_id))
+        bucket_ids = self._ids_by_bucket[bucket]
+        bucket_ids.discard(player_id)
+        if not bucket_ids:
+            del self._ids_by_bucket[bucket]
+        self._bucket_counter.add(bucket, -1)
+
+    def set_score(self, player: player_model.PlayerM, score: float) -> None:
+        """Enregistre le score d'un joueur, en O(log n)"""
+        self.player_by_id[player.player_id] = player
+        if player.player_id not in self.seed_by_player_id:
+            self.seed_by_player_id[player.player_id] = len(self._seeded_ids)
+            self._seeded_ids.append(player.player_id)
+        if player.player_id in self.score_by_player_id:
+            if self.score_by_player_id[player.player_id] == score:
+                return
+            self._remove(player.player_id)
+        self._insert(player.player_id, score)
+
+    def set_seed_order(self, player_list: List[player_model.PlayerM]) -> None:
+        """
+        Redéfinit l'ordre de départage des joueurs à égalité : l'ordre de la liste reçue, puis les joueurs absents de
+        la liste dans leur ordre précédent, en O(n). Les groupes de score ne sont pas modifiés.
+        """
+        listed_ids = [player.player_id for player in player_list]
+        listed_id_set = set(listed_ids)
+        self._seeded_ids = [*listed_ids, *(player_id for player_id in self._seeded_ids
+                                           if player_id not in listed_id_set)]
+        self.seed_by_player_id = {player_id: seed for seed, player_id in enumerate(self._seeded_ids)}
+
+    def update_from_match(self, match: match_model.MatchM) -> None:
+        """Les scores d'un match sont les scores cumulés de ses joueurs dans le tournoi"""
+        self.set_score(match.player_1, match.player_1_score)
+        self.set_score(match.player_2, match.player_2_score)
+        self.tie_breaks.record_match(match)
+
+    def watch_turn(self, turn: turn_model.TurnM) -> None:
+        """
+        Enregistre les scores des matchs d'un nouveau tour, suit leurs résultats et reprend l'ordre de départage du
+        tour
+        """
+        seed_order = list()
+        for match in turn.match_list:
+            self.update_from_match(match)
+            if self.update_from_match not in match.result_listeners:
+                match.result_listeners.append(self.update_from_match)
+            seed_order.extend((match.player_1, match.player_2))
+        self.set_seed_order(seed_order)
+
+    def get_rank(self, player: player_model.PlayerM) -> int:
+        """Retourne le rang d'un joueur : 1 + le nombre de joueurs ayant un score strictement supérieur"""
+        bucket = get_score_bucket(self.score_by_player_id[player.player_id])
+        return 1 + self._bucket_counter.total - self._bucket_counter.prefix_sum(bucket)
+
+    def _get_bucket_player_data(self, bucket: int, nbr_of_player: int) -> List:
+        """Retourne les (joueur, score) des 'nbr_of_player' premiers d'un groupe de score, dans l'ordre de départage"""
+        bucket_ids = heapq.nsmallest(nbr_of_player, self._ids_by_bucket[bucket],
+                                     key=self.seed_by_player_id.__getitem__)
+        return [[self.player_by_id[player_id], self.score_by_player_id[player_id]] for player_id in bucket_ids]
+
+    def get_top(self, nbr_of_player: int = -1) -> List:
+        """Retourne les (joueur, score) des 'nbr_of_player' premiers du classement, tous les joueurs par défaut"""
+        if nbr_of_player == -1:
+            nbr_of_player = len(self)
+        top = list()
+        for bucket in sorted(self._ids_by_bucket, reverse=True):
+            if len(top) >= nbr_of_player:
+                break
+            top.extend(self._get_bucket_player_data(bucket, nbr_of_player - len(top)))
+        return top
+
+    def get_ranking(self, nbr_of_player: int = -1) -> List:
+        """
+        Retourne les (joueur, score) des 'nbr_of_player' premiers du classement départagés, tous les joueurs par
+        défaut. Seuls les groupes de score affichés sont triés par départage.
+        """
+        if nbr_of_player == -1:
+            nbr_of_player = len(self)
+        ranking = list()
+        for bucket in sorted(self._ids_by_bucket, reverse=True):
+            if len(ranking) >= nbr_of_player:
+                break
+            bucket_player_data = self._get_bucket_player_data(bucket, len(self._ids_by_bucket[bucket]))
+            ranking.extend(self.tie_breaks.sort_player_data(bucket_player_data))
+        return ranking[:nbr_of_player]
+
+    def get_ordered_player_data(self) -> List:
+        """
+        Retourne la liste des (joueur, score) classée par score décroissant, prête pour l'appariement : tri stable de
+        l'ordre de départage par score, en O(n log n)
+        """
+        score_by_player_id = self.score_by_player_id
+        return [[self.player_by_id[player_id], score_by_player_id[player_id]]
+                for player_id in sorted(self._seeded_ids, key=score_by_player_id.__getitem__, reverse=True)]
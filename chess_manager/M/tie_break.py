@@ -0,0 +1,103 @@
+"""
+Départages d'un classement : Buchholz, Buchholz médian, Sonneborn-Berger et score progressif.
+
+Les sommes sur les adversaires de chaque joueur sont tenues en cache et mises à jour à chaque résultat : un
+changement de score d'un joueur est reporté sur ses seuls adversaires, le coût d'un résultat dépend du nombre de
+rondes et non du nombre de joueurs.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from chess_manager.M import match_model, turn_model
+
+# Ordre d'application des départages, après le score
+TIE_BREAK_ORDER = ('buchholz', 'median_buchholz', 'sonneborn_berger', 'progressive')
+TIE_BREAK_SHORT_NAMES = {'buchholz': 'BH', 'median_buchholz': 'MBH', 'sonneborn_berger': 'SB', 'progressive': 'PS'}
+
+
+def get_match_results(match: match_model.MatchM) -> Tuple[float, float]:
+    """Retourne les points gagnés par chaque joueur d'un match terminé"""
+    if not match.winner:
+        return .5, .5
+    if match.winner == match.player_1.player_id:
+        return 1, 0
+    return 0, 1
+
+
+class TieBreaks:
+    def __init__(self) -> None:
+        self.score_by_player_id: Dict[int, float] = dict()
+        # Parties jouées par chaque joueur : (id de l'adversaire, points gagnés)
+        self.games_by_player_id: Dict[int, List[Tuple[int, float]]] = dict()
+        self.buchholz_by_player_id: Dict[int, float] = dict()
+        self.sonneborn_berger_by_player_id: Dict[int, float] = dict()
+        self.progressive_by_player_id: Dict[int, float] = dict()
+        self._recorded_matches = match_model.RecordedMatchSet()
+
+    def set_score(self, player_id: int, score: float) -> None:
+        """Enregistre le score d'un joueur et reporte sa variation sur les sommes en cache de ses adversaires"""
+        delta = score - self.score_by_player_id.get(player_id, 0)
+        self.score_by_player_id[player_id] = score
+        if not delta:
+            return
+        for opponent_id, result in self.games_by_player_id.get(player_id, ()):
+            self.buchholz_by_player_id[opponent_id] += delta
+            self.sonneborn_berger_by_player_id[opponent_id] += (1 - result) * delta
+
+    def _add_game(self, player_id: int, opponent_id: int, result: float) -> None:
+        opponent_score = self.score_by_player_id.get(opponent_id, 0)
+        self.games_by_player_id.setdefault(player_id, list()).append((opponent_id, result))
+        self.buchholz_by_player_id[player_id] = self.buchholz_by_player_id.get(player_id, 0) + opponent_score
+        self.sonneborn_berger_by_player_id[player_id] = \
+            self.sonneborn_berger_by_player_id.get(player_id, 0) + result * opponent_score
+
+    def record_match(self, match: match_model.MatchM) -> None:
+        """
+        Enregistre le résultat d'un match terminé, une seule fois par match. Les scores d'un match sont les scores
+        cumulés de ses joueurs après ce match.
+        """
+        if match.winner is None or not self._recorded_matches.add(match):
+            return
+        player_1_id, player_2_id = match.player_1.player_id, match.player_2.player_id
+        player_1_result, player_2_result = get_match_results(match)
+        self._add_game(player_1_id, player_2_id, player_1_result)
+        self._add_game(player_2_id, player_1_id, player_2_result)
+        self.set_score(player_1_id, match.player_1_score)
+        self.set_score(player_2_id, match.player_2_score)
+        for player_id, score in ((player_1_id, match.player_1_score), (player_2_id, match.player_2_score)):
+            self.progressive_by_player_id[player_id] = self.progressive_by_player_id.get(player_id, 0) + score
+
+    def record_turn(self, turn: turn_model.TurnM) -> None:
+        for match in turn.match_list:
+            self.record_match(match)
+
+    def get_median_buchholz(self, player_id: int) -> float:
+        """Buchholz sans le meilleur ni le plus faible adversaire, à partir de trois parties jouées"""
+        games = self.games_by_player_id.get(player_id, ())
+        if len(games) < 3:
+            return self.buchholz_by_player_id.get(player_id, 0)
+        opponent_scores = [self.score_by_player_id[opponent_id] for opponent_id, _ in games]
+        return self.buchholz_by_player_id[player_id] - max(opponent_scores) - min(opponent_scores)
+
+    def get_tie_breaks(self, player_id: int) -> Dict[str, float]:
+        return {'buchholz': self.buchholz_by_player_id.get(player_id, 0),
+                'median_buchholz': self.get_median_buchholz(player_id),
+                'sonneborn_berger': self.sonneborn_berger_by_player_id.get(player_id, 0),
+                'progressive': self.progressive_by_player_id.get(player_id, 0)}
+
+    def get_sort_key(self, player_id: int) -> Tuple:
+        """Clé de tri des joueurs à égalité de score, dans l'ordre de TIE_BREAK_ORDER (valeurs décroissantes)"""
+        return (self.buchholz_by_player_id.get(player_id, 0), self.get_median_buchholz(player_id),
+                self.sonneborn_berger_by_player_id.get(player_id, 0), self.progressive_by_player_id.get(player_id, 0))
+
+    def get_flat_view(self, player_id: int) -> str:
+        tie_breaks = self.get_tie_breaks(player_id)
+        return ' '.join(f"{TIE_BREAK_SHORT_NAMES[tie_break_name]} {tie_breaks[tie_break_name]:g}"
+                        for tie_break_name in TIE_BREAK_ORDER)
+
+    def sort_player_data(self, player_data_list: List) -> List:
+        """Trie une liste de (joueur, score) par score puis départages décroissants, le tri est stable"""
+        return sorted(player_data_list,
+                      key=lambda player_data: (player_data[1], *self.get_sort_key(player_data[0].player_id)),
+                      reverse=True)
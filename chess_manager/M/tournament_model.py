@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import datetime
 from dataclasses import dataclass, field
+import math
 import random
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, FrozenSet, List, Set, Tuple
 
-from chess_manager.M import turn_model
+from chess_manager.M import turn_model, save_tracking, pairing_engine, standings, tournament_state, lazy_relation
 
 MAX_STR_LEN = 122
+# Réponse du formulaire de création de tournoi demandant un nombre de tours calculé
+AUTO_TURN_NBR = 'A'
 
 
 def check_valid_int(user_int_input: Any) -> bool:
@@ -26,12 +29,25 @@ def check_valid_str(user_str_input: Any) -> bool | str:
     return True
 
 
+def check_valid_turn_nbr(user_turn_nbr_input: Any) -> bool:
+    """ Vérifie si l'input de l'utilisateur est un nombre de tours valide ou 'A' (nombre de tours automatique). """
+    return user_turn_nbr_input.upper() == AUTO_TURN_NBR or check_valid_int(user_turn_nbr_input)
+
+
+def check_valid_pairing_engine(user_input_engine: Any) -> bool | str:
+    """ Vérifie si le moteur d'appariement entré par l'utilisateur existe, une réponse vide choisit le défaut. """
+    if user_input_engine == '' or user_input_engine in PAIRING_ENGINES or user_input_engine in SCHEDULED_ENGINES:
+        return True
+    return f"Please choose between {', '.join([*PAIRING_ENGINES, *SCHEDULED_ENGINES])}"
+
+
 TOURNAMENT_FORM_VALIDATOR: Dict = {
     'name': check_valid_str,
     'place': check_valid_str,
     'description': check_valid_str,
-    'turn_nbr': check_valid_int,
-    'player_nbr': check_valid_int
+    'turn_nbr': check_valid_turn_nbr,
+    'player_nbr': check_valid_int,
+    'pairing_engine': check_valid_pairing_engine,
 }
 
 
@@ -47,19 +63,15 @@ def _order_player_by_score(full_player_data: List) -> List:
     return full_player_data
 
 
-def _reset_player_pairing(ordered_player_data: List) -> List:
-    """Visite chaque joueur de la liste reçue et en reinitialise le compteur d'adversaires"""
-    for player_data in ordered_player_data:
-        player_data[0].clear_player_pairing()
-    return ordered_player_data
-
-
-def _make_player_pair(ordered_player_data: List) -> List:
+def _make_player_pair(ordered_player_data: List, state: tournament_state.TournamentState | None = None) -> List:
     """
-    Reçoit une liste de (joueurs, score) et retourne une liste de paire (joueurs, score) classé par score
-    décroissant. Si tous les joueurs ont déjà joué les uns contre les autres, les historiques de pairage sont
-    réinitialisés
+    Appariement glouton historique, l'équilibre des couleurs n'est pas pris en compte. Reçoit une liste de (joueurs,
+    score) classée par score décroissant et l'état compact du tournoi, retourne une liste de paire (joueurs, score).
+    Si tous les joueurs ont déjà joué les uns contre les autres, les adversaires rencontrés de l'état reçu sont
+    effacés : le tournoi lui passe une copie de son état et applique la réinitialisation lui-même.
     """
+    if state is None:
+        state = tournament_state.TournamentState([player_data[0].player_id for player_data in ordered_player_data])
     player_pairs = list()
     working_list = ordered_player_data[:]
 
@@ -67,11 +79,11 @@ def _make_player_pair(ordered_player_data: List) -> List:
     current_pairing_player = working_list.pop(0)
 
     while len(working_list) > 0:
-        if current_pairing_player[0].has_played_against(working_list[adversary_index][0]):
+        if state.has_played(current_pairing_player[0].player_id, working_list[adversary_index][0].player_id):
             adversary_index += 1
             if adversary_index >= len(working_list):
-                print("Cannot make more player pair without player playing each other again")
-                return _make_player_pair(_reset_player_pairing(ordered_player_data[:]))
+                state.clear_opponents()
+                return _make_player_pair(ordered_player_data, state)
             continue
         player_pairs.append((current_pairing_player, working_list.pop(adversary_index)))
         adversary_index = 0
@@ -82,8 +94,35 @@ def _make_player_pair(ordered_player_data: List) -> List:
     return player_pairs
 
 
+# Moteurs d'appariement disponibles : fonction (liste de (joueur, score) classée, état compact du tournoi) -> paires
+PAIRING_ENGINES: Dict[str, Callable] = {
+    'greedy': _make_player_pair,
+    'blossom': pairing_engine.make_max_weight_player_pair,
+    'dutch': pairing_engine.make_dutch_player_pair,
+}
+# Moteurs à calendrier : fonction (ids des joueurs tirés au sort) -> paires d'ids de chaque ronde, le calendrier est
+# calculé au début du tournoi et enregistré avec lui
+SCHEDULED_ENGINES: Dict[str, Callable] = {
+    'round_robin': pairing_engine.make_berger_schedule,
+}
+DEFAULT_PAIRING_ENGINE = 'greedy'
+# Moteurs effaçant les adversaires rencontrés de l'état reçu lorsqu'ils sont bloqués : ils sont exécutés sur une
+# copie de l'état, la réinitialisation est appliquée au tournoi par le thread principal (voir reset_opponent_history)
+HISTORY_RESETTING_ENGINES = ('greedy',)
+
+
+def get_auto_turn_nbr(player_nbr: int, pairing_engine_name: str = DEFAULT_PAIRING_ENGINE) -> int:
+    """
+    Nombre de tours automatique : toutes les rondes du calendrier pour un moteur à calendrier, sinon le nombre de
+    tours d'un système suisse permettant de départager un vainqueur unique (log2 du nombre de joueurs).
+    """
+    if pairing_engine_name in SCHEDULED_ENGINES:
+        return player_nbr - 1 + player_nbr % 2 if player_nbr > 1 else 0
+    return max(1, math.ceil(math.log2(max(player_nbr, 2))))
+
+
 @dataclass
-class TournamentM:
+class TournamentM(save_tracking.SaveTrackedM):
     """Représentation d'un tournoi d'échec"""
     name: str
     place: str
@@ -94,14 +133,43 @@ class TournamentM:
     turn_list: List = field(default_factory=list)
     start_date: str | None = None
     end_date: str | None = None
+    pairing_engine: str = DEFAULT_PAIRING_ENGINE
+    pairing_schedule: List = field(default_factory=list)
     tournament_id: int = -1
+    standings: standings.Standings | None = field(default=None, init=False, repr=False, compare=False)
+    state: tournament_state.TournamentState | None = field(default=None, init=False, repr=False, compare=False)
+    pair_index: Set[FrozenSet[int]] | None = field(default=None, init=False, repr=False, compare=False)
+    # Les joueurs peuvent être partagés avec d'autres tournois chargés : leur historique des adversaires est
+    # reconstruit avant le prochain appariement
+    player_pairing_outdated: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.start_date is None:
             self.start_date = datetime.datetime.now().strftime("%d/%m/%y %H:%M")
 
     def register_turn(self, turn: turn_model.TurnM) -> None:
+        """Ajoute un tour au tournoi, ses joueurs deviennent adversaires les uns des autres"""
         self.turn_list.append(turn)
+        for match in turn.match_list:
+            match.player_1.add_opponent(match.player_2)
+            match.player_2.add_opponent(match.player_1)
+            if self.pair_index is not None:
+                self.pair_index.add(frozenset((match.player_1.player_id, match.player_2.player_id)))
+        if self.standings is not None:
+            self.standings.watch_turn(turn)
+        if self.state is not None:
+            self.state.watch_turn(turn)
+
+    def get_standings(self) -> standings.Standings:
+        """
+        Retourne le classement du tournoi. Il est construit à partir des matchs des tours à la première demande,
+        puis mis à jour à chaque résultat de match et à chaque nouveau tour.
+        """
+        if self.standings is None:
+            self.standings = standings.Standings(self.players)
+            for turn in self.turn_list:
+                self.standings.watch_turn(turn)
+        return self.standings
 
     def get_current_turn_nbr(self) -> int:
         return len(self.turn_list)
@@ -119,12 +187,135 @@ class TournamentM:
             return
         self.end_date = datetime.datetime.now().strftime("%d/%m/%y %H:%M")
 
-    def get_next_turn_player_pair(self) -> List:
+    def get_pair_index(self) -> Set[FrozenSet[int]]:
+        """
+        Retourne l'index des paires d'ids de joueurs s'étant déjà rencontrés dans le tournoi. Il est construit à
+        partir des matchs des tours à la première demande, puis complété à chaque nouveau tour.
+        """
+        if self.pair_index is None:
+            self.pair_index = {frozenset((match.player_1.player_id, match.player_2.player_id))
+                               for turn in self.turn_list for match in turn.match_list}
+        return self.pair_index
+
+    def rebuild_player_pairing(self) -> None:
+        """
+        Réinitialise l'historique des adversaires des joueurs puis le reconstruit à partir de l'index des paires du
+        tournoi : chaque rencontre n'est ajoutée qu'une fois, quel que soit le nombre de chargements du tournoi.
+        """
+        self.player_pairing_outdated = False
+        player_by_id = {player.player_id: player for player in self.players}
+        for player in self.players:
+            player.clear_player_pairing()
+        for player_pair in self.get_pair_index():
+            player_1_id, player_2_id = player_pair
+            player_by_id[player_1_id].already_played_against.add(player_2_id)
+            player_by_id[player_2_id].already_played_against.add(player_1_id)
+
+    def invalidate_player_pairing(self) -> None:
+        """L'historique des adversaires des joueurs sera reconstruit avant le prochain appariement"""
+        self.player_pairing_outdated = True
+
+    def prepare_pairing(self) -> None:
+        """
+        Construit les données lues par l'appariement du tour suivant : classement, état compact et historique des
+        adversaires s'il doit être reconstruit. Les relations chargées à la demande sont alors toutes chargées.
+        """
+        self.get_standings()
+        self.get_pairing_state()
+        if self.player_pairing_outdated:
+            self.rebuild_player_pairing()
+
+    def get_state(self) -> tournament_state.TournamentState:
+        """
+        Retourne l'état compact du tournoi (équilibres de couleur, nombres de parties et adversaires rencontrés par
+        index de joueur). Il est
+        construit à partir des matchs des tours à la première demande, puis mis à jour à chaque nouveau tour.
+        """
+        if self.state is None:
+            self.state = tournament_state.TournamentState([player.player_id for player in self.players])
+            for turn in self.turn_list:
+                self.state.watch_turn(turn)
+        return self.state
+
+    def get_pairing_state(self) -> tournament_state.TournamentState:
+        """Retourne l'état compact lu par les moteurs d'appariement, chaque joueur inscrit y a un index"""
+        state = self.get_state()
+        # Les joueurs inscrits après la construction de l'état n'y ont pas encore d'index
+        for player in self.players:
+            state.get_index(player.player_id)
+        return state
+
+    def get_colour_balance(self) -> Dict[int, int]:
+        """Retourne pour chaque joueur le nombre de parties jouées en premier joueur moins celles en second joueur"""
+        return self.get_pairing_state().get_colour_balance()
+
+    def get_scheduled_player_pair(self) -> List:
+        """
+        Retourne les paires (joueur, score) du tour suivant lues dans le calendrier du tournoi, en O(n). Le
+        calendrier est calculé au premier tour à partir du tirage au sort des joueurs, une liste vide est retournée
+        quand toutes ses rondes ont été jouées.
+        """
+        if not self.pairing_schedule and self.get_current_turn_nbr() == 0:
+            make_schedule = SCHEDULED_ENGINES[self.pairing_engine]
+            self.pairing_schedule = make_schedule([player.player_id for player in _shuffle_player_list(self.players)])
+        if self.get_current_turn_nbr() >= len(self.pairing_schedule):
+            return list()
+
+        player_by_id = {player.player_id: player for player in self.players}
+        score_by_player_id = self.get_standings().score_by_player_id if self.turn_list else dict()
+        return [([player_by_id[player_1_id], score_by_player_id.get(player_1_id, 0)],
+                 [player_by_id[player_2_id], score_by_player_id.get(player_2_id, 0)])
+                for player_1_id, player_2_id in self.pairing_schedule[self.get_current_turn_nbr()]]
+
+    def get_pairing_key(self) -> Tuple:
+        """
+        Retourne la clé des données dont dépend l'appariement du tour suivant : tournoi, nombre de tours, joueurs et
+        résultats du dernier tour. Un appariement calculé d'avance n'est valable que pour une clé identique.
+        """
+        if not self.turn_list:
+            return self.tournament_id, 0, len(self.players), ()
+        return (self.tournament_id, len(self.turn_list), len(self.players),
+                tuple((match.player_1.player_id, match.player_2.player_id, match.winner,
+                       match.player_1_score, match.player_2_score)
+                      for match in self.turn_list[-1].match_list))
+
+    def compute_next_turn_pairing(self) -> Tuple[List, bool]:
+        """
+        Apparie les joueurs pour le tour suivant avec le moteur d'appariement du tournoi, sans modifier l'état du
+        tournoi ni ses joueurs : une fois prepare_pairing appelé, le calcul peut être fait dans un thread. Retourne
+        les paires et si l'historique des adversaires doit être réinitialisé (voir reset_opponent_history).
+        """
+        if self.player_pairing_outdated:
+            self.rebuild_player_pairing()
+        if self.pairing_engine in SCHEDULED_ENGINES:
+            return self.get_scheduled_player_pair(), False
+        make_player_pair = PAIRING_ENGINES[self.pairing_engine]
+        state = self.get_pairing_state()
+        pairing_state = state.copy() if self.pairing_engine in HISTORY_RESETTING_ENGINES else state
         if self.get_current_turn_nbr() > 0:
-            return _make_player_pair(_order_player_by_score(self.turn_list[-1].get_turn_data()))
-        player_list = _shuffle_player_list(self.players)
-        player_data = [[player, 0] for player in player_list]
-        return _make_player_pair(_order_player_by_score(player_data))
+            ordered_player_data = self.get_standings().get_ordered_player_data()
+        else:
+            player_list = _shuffle_player_list(self.players)
+            ordered_player_data = _order_player_by_score([[player, 0] for player in player_list])
+        player_pairs = make_player_pair(ordered_player_data, pairing_state)
+        return player_pairs, pairing_state.nbr_of_opponent_reset > state.nbr_of_opponent_reset
+
+    def reset_opponent_history(self) -> None:
+        """Efface les adversaires rencontrés de l'état et des joueurs, appelé avec un appariement qui l'a demandé"""
+        print("Cannot make more player pair without player playing each other again")
+        self.get_state().clear_opponents()
+        for player in self.players:
+            player.clear_player_pairing()
+
+    def get_next_turn_player_pair(self) -> List:
+        """Apparie les joueurs pour le tour suivant et applique la réinitialisation des adversaires demandée"""
+        player_pairs, history_reset = self.compute_next_turn_pairing()
+        if history_reset:
+            self.reset_opponent_history()
+        return player_pairs
+
+    def get_save_data(self) -> Dict:
+        return self.from_obj_to_dict()
 
     def from_obj_to_dict(self) -> Dict:
         return {'name': self.name,
@@ -132,9 +323,11 @@ class TournamentM:
                 'turn_nbr': int(self.turn_nbr),
                 'description': self.description,
                 'player_nbr': int(self.player_nbr),
-                'players': [player.player_id for player in self.players],
-                'turn_list': [turn.turn_id for turn in self.turn_list],
+                'players': lazy_relation.get_id_list(self.players, 'player_id'),
+                'turn_list': lazy_relation.get_id_list(self.turn_list, 'turn_id'),
                 'start_date': self.start_date,
                 'end_date': self.end_date,
+                'pairing_engine': self.pairing_engine,
+                'pairing_schedule': self.pairing_schedule,
                 'tournament_id': self.tournament_id,
                 }
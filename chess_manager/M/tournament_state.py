@@ -0,0 +1,112 @@
+"""
+État courant compact d'un tournoi, tenu à jour à côté de ses objets joueurs, tours et matchs.
+
+Chaque joueur reçoit un index : l'équilibre des couleurs et le nombre de parties jouées sont des tableaux array('i'),
+les adversaires déjà rencontrés un ensemble de bits par joueur (bytearray, le bit d'index j signale une partie contre
+le joueur d'index j) dans lequel les moteurs d'appariement testent les revanches en temps constant. Ils sont mis à
+jour à l'enregistrement de chaque tour au lieu d'être recalculés depuis tous les matchs.
+Une ligne de bits ne s'étend que jusqu'à l'index de l'adversaire le plus élevé du joueur : au pire n²/8 octets pour
+n joueurs (125 Ko pour 1 000 joueurs, 12,5 Mo pour 10 000).
+Les scores restent tenus par le classement (voir standings.py).
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List
+
+from chess_manager.M import match_model, turn_model
+
+
+class TournamentState:
+    def __init__(self, player_id_list: List[int]) -> None:
+        nbr_of_player = len(player_id_list)
+        self.player_id_list = array('q', player_id_list)
+        self.index_by_player_id: Dict[int, int] = {player_id: index for index, player_id in enumerate(player_id_list)}
+        self.colour_balance = array('i', bytes(4 * nbr_of_player))
+        self.nbr_of_game = array('i', bytes(4 * nbr_of_player))
+        self.opponent_bits: List[bytearray] = [bytearray() for _ in range(nbr_of_player)]
+        # Nombre d'effacements des adversaires rencontrés (appariement glouton bloqué)
+        self.nbr_of_opponent_reset = 0
+        self._watched_matches = match_model.RecordedMatchSet()
+
+    def __len__(self) -> int:
+        return len(self.player_id_list)
+
+    def get_index(self, player_id: int) -> int:
+        """Retourne l'index d'un joueur, un joueur inconnu est ajouté à l'état"""
+        index = self.index_by_player_id.get(player_id)
+        if index is not None:
+            return index
+
+        index = len(self.player_id_list)
+        self.player_id_list.append(player_id)
+        self.index_by_player_id[player_id] = index
+        self.colour_balance.append(0)
+        self.nbr_of_game.append(0)
+        self.opponent_bits.append(bytearray())
+        return index
+
+    def _add_opponent(self, index: int, other_index: int) -> None:
+        player_bits = self.opponent_bits[index]
+        byte_index = other_index >> 3
+        if byte_index >= len(player_bits):
+            player_bits.extend(bytes(byte_index + 1 - len(player_bits)))
+        player_bits[byte_index] |= 1 << (other_index & 7)
+
+    def add_game(self, player_1_id: int, player_2_id: int) -> None:
+        """Enregistre une partie : chaque joueur devient adversaire de l'autre, le premier joueur a les blancs"""
+        player_1_index, player_2_index = self.get_index(player_1_id), self.get_index(player_2_id)
+        self._add_opponent(player_1_index, player_2_index)
+        self._add_opponent(player_2_index, player_1_index)
+        self.nbr_of_game[player_1_index] += 1
+        self.nbr_of_game[player_2_index] += 1
+        self.colour_balance[player_1_index] += 1
+        self.colour_balance[player_2_index] -= 1
+
+    def has_played(self, player_id: int, other_player_id: int) -> bool:
+        """Retourne si deux joueurs se sont déjà rencontrés, un joueur sans index n'a rencontré personne"""
+        index = self.index_by_player_id.get(player_id)
+        other_index = self.index_by_player_id.get(other_player_id)
+        if index is None or other_index is None:
+            return False
+        player_bits = self.opponent_bits[index]
+        byte_index = other_index >> 3
+        return byte_index < len(player_bits) and bool(player_bits[byte_index] >> (other_index & 7) & 1)
+
+    def clear_opponents(self) -> None:
+        """Efface les adversaires rencontrés de tous les joueurs, les revanches redeviennent possibles"""
+        for player_bits in self.opponent_bits:
+            player_bits.clear()
+        self.nbr_of_opponent_reset += 1
+
+    def copy(self) -> TournamentState:
+        """Retourne une copie de l'état, un appariement peut la modifier sans effet sur le tournoi"""
+        state_copy = TournamentState(list())
+        state_copy.player_id_list = array('q', self.player_id_list)
+        state_copy.index_by_player_id = dict(self.index_by_player_id)
+        state_copy.colour_balance = array('i', self.colour_balance)
+        state_copy.nbr_of_game = array('i', self.nbr_of_game)
+        state_copy.opponent_bits = [bytearray(player_bits) for player_bits in self.opponent_bits]
+        state_copy.nbr_of_opponent_reset = self.nbr_of_opponent_reset
+        state_copy._watched_matches = self._watched_matches.copy()
+        return state_copy
+
+    def watch_turn(self, turn: turn_model.TurnM) -> None:
+        """Enregistre les parties des matchs d'un tour, un match déjà enregistré est ignoré"""
+        for match in turn.match_list:
+            if self._watched_matches.add(match):
+                self.add_game(match.player_1.player_id, match.player_2.player_id)
+
+    def get_colour_balance(self) -> Dict[int, int]:
+        """Retourne pour chaque joueur le nombre de parties jouées en premier joueur moins celles en second joueur"""
+        return dict(zip(self.player_id_list, self.colour_balance))
+
+    def get_nbr_of_game(self) -> Dict[int, int]:
+        """Retourne pour chaque joueur le nombre de parties jouées"""
+        return dict(zip(self.player_id_list, self.nbr_of_game))
+
+    def get_nbr_of_bytes(self) -> int:
+        """Taille des données des tableaux et des bits d'adversaires de l'état (hors dictionnaire des index)"""
+        return sum(len(state_array) * state_array.itemsize
+                   for state_array in (self.player_id_list, self.colour_balance, self.nbr_of_game)) + \
+            sum(len(player_bits) for player_bits in self.opponent_bits)
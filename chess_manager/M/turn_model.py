@@ -4,11 +4,11 @@ from dataclasses import dataclass, field
 import datetime
 from typing import Dict, List
 
-from chess_manager.M import match_model
+from chess_manager.M import match_model, save_tracking, lazy_relation
 
 
 @dataclass
-class TurnM:
+class TurnM(save_tracking.SaveTrackedM):
     """Représentation d'un tour de tournois d'échec."""
     name: str
     start_time: str | None = None
@@ -24,7 +24,7 @@ class TurnM:
         return {'name': self.name,
                 'start_time': self.start_time,
                 'end_time': self.end_time,
-                'match_list': [match.match_id for match in self.match_list],
+                'match_list': lazy_relation.get_id_list(self.match_list, 'match_id'),
                 'turn_id': self.turn_id,
                 }
 
@@ -0,0 +1,53 @@
+from typing import Dict, List
+
+
+def _histogram_header(histogram_bounds_ms: List) -> str:
+    return " ".join([*[f"<{bound}ms" for bound in histogram_bounds_ms], f">={histogram_bounds_ms[-1]}ms"])
+
+
+def _event_stats_line(event_key: str, event_stats: Dict, indent: int = 0) -> str:
+    name = f"{'  ' * indent}{event_key}"
+    return f"{name:<45} {event_stats['nbr_of_call']:>7} {event_stats['mean_ms']:>10.3f} " \
+           f"{event_stats['max_ms']:>10.3f} {event_stats['total_ms']:>11.3f} " \
+           f"{event_stats['nbr_of_read']:>7} {event_stats['nbr_of_write']:>6}"
+
+
+def _table_header(first_column: str) -> str:
+    return f"{first_column:<45} {'calls':>7} {'mean (ms)':>10} {'max (ms)':>10} {'total (ms)':>11} " \
+           f"{'reads':>7} {'writes':>6}"
+
+
+def profiling_report_view(profiling_report: Dict) -> str:
+    """
+    Reçoit le rapport du profiler des événements et en retourne la représentation : une ligne par événement, les plus
+    coûteux en premier, suivie de son histogramme des durées
+    """
+    events = sorted(profiling_report['events'].items(), key=lambda event_item: event_item[1]['total_ms'],
+                    reverse=True)
+    if not events:
+        return "No event recorded"
+
+    lines = [_table_header("Event")]
+    for event_key, event_stats in events:
+        lines.append(_event_stats_line(event_key, event_stats))
+    lines.append("")
+    lines.append(f"{'Duration histogram':<45} {_histogram_header(profiling_report['histogram_bounds_ms'])}")
+    for event_key, event_stats in events:
+        lines.append(f"{event_key:<45} {' '.join(str(count) for count in event_stats['histogram'])}")
+    return "\n".join(lines)
+
+
+def profiling_call_tree_view(profiling_report: Dict) -> str:
+    """Reçoit le rapport du profiler des événements et en retourne l'arbre des appels imbriqués"""
+    if not profiling_report['call_tree']:
+        return "No event recorded"
+
+    lines = [_table_header("Event (nested calls)")]
+
+    def add_children(children: Dict, indent: int) -> None:
+        for event_key, event_stats in sorted(children.items(), key=lambda event_item: event_item[1]['total_ms'],
+                                             reverse=True):
+            lines.append(_event_stats_line(event_key, event_stats, indent))
+            add_children(event_stats['children'], indent + 1)
+    add_children(profiling_report['call_tree'], 0)
+    return "\n".join(lines)
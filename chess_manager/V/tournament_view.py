@@ -9,7 +9,8 @@ def tournament_creation_form() -> Dict:
                 place="Where is your tournament taking place ?",
                 description="Enter tournament description",
                 turn_nbr="How many turn in this tournament (Press 'A' for Auto)",
-                player_nbr="How many players are signed to this tournament ?")
+                player_nbr="How many players are signed to this tournament ?",
+                pairing_engine="Pairing engine (greedy, blossom, dutch or round_robin, leave empty for greedy)")
 
 
 def on_going_tournament_view(tournament_obj: tournament_model.TournamentM) -> str:
@@ -40,26 +41,26 @@ def tournament_obj_view(tournament_obj: tournament_model.TournamentM) -> str:
     return on_going_tournament_view(tournament_obj)
 
 
-def flat_on_going_tournament_view(tournament_obj: tournament_model.TournamentM) -> str:
-    return f"ON GOING : {tournament_obj.name} at {tournament_obj.place} : " \
-           f"{len(tournament_obj.turn_list)}/{tournament_obj.turn_nbr} turn, " \
-           f"Started {tournament_obj.start_date}"
+def flat_on_going_tournament_view(tournament_summary: Dict) -> str:
+    return f"ON GOING : {tournament_summary['name']} at {tournament_summary['place']} : " \
+           f"{tournament_summary['current_turn_nbr']}/{tournament_summary['turn_nbr']} turn, " \
+           f"Started {tournament_summary['start_date']}"
 
 
-def flat_finished_tournament_view(tournament_obj: tournament_model.TournamentM) -> str:
-    return f"FINISHED : {tournament_obj.name} at {tournament_obj.place} : " \
-           f"{len(tournament_obj.turn_list)}/{tournament_obj.turn_nbr} turn, " \
-           f"Started {tournament_obj.start_date} - finished : {tournament_obj.end_date}"
+def flat_finished_tournament_view(tournament_summary: Dict) -> str:
+    return f"FINISHED : {tournament_summary['name']} at {tournament_summary['place']} : " \
+           f"{tournament_summary['current_turn_nbr']}/{tournament_summary['turn_nbr']} turn, " \
+           f"Started {tournament_summary['start_date']} - finished : {tournament_summary['end_date']}"
 
 
-def tournament_object_flat_view(tournament_obj: tournament_model.TournamentM) -> str:
+def tournament_summary_flat_view(tournament_summary: Dict) -> str:
     """
-    Reçoit un objet tournoi et en retourne une représentation en ligne suffisante pour l'identification du tournoi
-    dans une liste
+    Reçoit le résumé d'un tournoi et en retourne une représentation en ligne suffisante pour l'identification du
+    tournoi dans une liste
     """
-    if tournament_obj.end_date is not None:
-        return flat_finished_tournament_view(tournament_obj)
-    return flat_on_going_tournament_view(tournament_obj)
+    if tournament_summary['end_date'] is not None:
+        return flat_finished_tournament_view(tournament_summary)
+    return flat_on_going_tournament_view(tournament_summary)
 
 
 def tournament_object_full_view(tournament_full_data, max_match_name_len, max_match_detail_len):
@@ -0,0 +1,57 @@
+"""
+Exécution sans terminal de l'application à partir d'un script (voir core/headless_view.py pour le format des étapes) :
+les actions passent par le messenger comme dans chessmanager_main.py, l'affichage est capturé au lieu d'être imprimé.
+
+Exécution : python chessmanager_headless.py script.jsonl [fichier_de_sortie]
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import sys
+import time
+from typing import Dict, Iterable
+
+import chessmanager_main
+from core import headless_view
+
+
+def run_script(script: Iterable[Dict]) -> Dict:
+    """
+    Exécute le script jusqu'à sa fin et retourne le nombre d'étapes jouées, la durée totale, le nombre d'écritures en
+    base de donnée et l'affichage capturé (y compris les messages imprimés par les contrôleurs)
+    """
+    main_view = headless_view.HeadlessView(script)
+    printed = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(printed):
+        app = chessmanager_main.ChessManager(main_view=main_view)
+        app.run()
+    elapsed = time.perf_counter() - start
+    if printed.getvalue():
+        main_view.output.append(printed.getvalue())
+    return {'nbr_of_step': main_view.nbr_of_step,
+            'time': elapsed,
+            'nbr_of_write': app.loader.get_nbr_of_write(),
+            'output': main_view.output}
+
+
+def main(script_path: str, output_path: str | None = None) -> int:
+    try:
+        result = run_script(headless_view.load_script(script_path))
+    except headless_view.HeadlessScriptError as error:
+        print(f"Script failed : {error}", file=sys.stderr)
+        return 1
+
+    if output_path is not None:
+        with open(output_path, 'w', encoding='utf-8') as output_file:
+            output_file.write("\n".join(str(block) for block in result['output']))
+    print(f"{result['nbr_of_step']} step(s) in {result['time']:.3f}s, {result['nbr_of_write']} write(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+    sys.exit(main(*sys.argv[1:3]))
@@ -1,23 +1,44 @@
-from core import messenger, tinydb_loader, mainview
-from chess_manager.C import turn_controller, player_controller, tournament_controller, match_controller
+from __future__ import annotations
 
+from core import messenger, tinydb_loader, sqlite_loader, journal_loader, mainview, event_profiler
+from chess_manager.C import turn_controller, player_controller, tournament_controller, match_controller, \
+    debug_controller
+
+from data import config
 from data.config import AppInput
 
+LOADER_BY_BACKEND = {
+    'tinydb': tinydb_loader.TinyDBLoader,
+    'sqlite': sqlite_loader.SQLiteLoader,
+    'journal': journal_loader.JournalLoader,
+}
+
 
 class ChessManager:
-    def __init__(self):
+    def __init__(self, main_view: mainview.MainView | None = None):
         """
         Classe principale de l'application, initialise le core de l'application et les différents contrôleurs,
         Est également responsable de la boucle principale de l'application, voir run().
+        Une autre vue principale peut être fournie, ex : core/headless_view.py pour une exécution sans terminal.
         """
         self.messenger = messenger.Messenger()
-        self.main_v = mainview.MainView()
-        self.loader = tinydb_loader.TinyDBLoader()
+        self.main_v = mainview.MainView() if main_view is None else main_view
+        self.loader = LOADER_BY_BACKEND[config.DB_BACKEND]()
+        # Nombre d'écritures en base de donnée provoquées par la dernière action utilisateur
+        self.last_input_nbr_of_write = 0
+        # Mesure des événements du messenger, uniquement si activée dans data/config.py
+        self.profiler = None
+        if config.EVENT_PROFILING:
+            self.profiler = event_profiler.EventProfiler(self.loader)
+            self.messenger.profiler = self.profiler
 
         player_controller.PlayerC(loader=self.loader, main_view=self.main_v, app_messenger=self.messenger)
         tournament_controller.TournamentC(loader=self.loader, main_view=self.main_v, app_messenger=self.messenger)
         turn_controller.TurnC(loader=self.loader, main_view=self.main_v, app_messenger=self.messenger)
         match_controller.MatchC(loader=self.loader, main_view=self.main_v, app_messenger=self.messenger)
+        if self.profiler is not None:
+            debug_controller.DebugC(loader=self.loader, main_view=self.main_v, app_messenger=self.messenger,
+                                    profiler=self.profiler)
 
         self.main_v.title = "## ChessManager ##"
 
@@ -39,6 +60,8 @@ class ChessManager:
             (AppInput.VIEW_TOURNAMENT_LIST, None),
             (AppInput.QUIT, None)
         ])
+        if self.profiler is not None:
+            self.messenger.accept_event(AppInput.DEBUG_MENU)
 
     def register_user_input(self):
         """
@@ -60,6 +83,15 @@ class ChessManager:
         user_input = self.main_v.get_user_select("What do you want to do ?", allowed_as_dict)
         return user_input
 
+    def handle_user_input(self, user_input) -> int:
+        """
+        Exécute l'action utilisateur et retourne le nombre d'écritures en base de donnée qu'elle a provoquées.
+        """
+        nbr_of_write_before = self.loader.get_nbr_of_write()
+        self.messenger.handle_event(user_input)
+        self.last_input_nbr_of_write = self.loader.get_nbr_of_write() - nbr_of_write_before
+        return self.last_input_nbr_of_write
+
     def run(self):
         """
         Boucle principale de l'application.
@@ -77,7 +109,7 @@ class ChessManager:
 
             if user_input == AppInput.QUIT:
                 break
-            self.messenger.handle_event(user_input)
+            self.handle_user_input(user_input)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+"""
+Instrumentation optionnelle des événements du messenger : nombre d'appels, histogramme des durées, arbre des appels
+imbriqués (un événement exécuté pendant un autre, ex : LOAD_PLAYER pendant TURN_FULL_VIEW) et nombre de lectures et
+d'écritures en base de donnée provoquées par chaque événement.
+
+Activée par EVENT_PROFILING dans data/config.py, sans effet sur le messenger sinon.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+from data import config
+
+# Méthodes de lecture des loaders comptées par le profiler, chacune retourne une entrée, une liste d'entrées ou False
+LOADER_READS = ('load_player', 'load_players', 'load_player_page', 'load_tournament_data',
+                'load_tournament_summaries', 'load_turn', 'load_turns', 'load_match', 'load_matches')
+# Bornes supérieures (en millisecondes) des classes de l'histogramme des durées, la dernière classe est illimitée
+HISTOGRAM_BOUNDS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+
+def get_event_key(event: config.AppInput | str, func: Callable | None) -> str:
+    """
+    Retourne le nom sous lequel un événement est mesuré : le nom de l'AppInput, ou pour un événement anonyme (nom
+    généré pour un joueur, un match...) le nom de la fonction appelée, pour que les mesures ne dépendent pas des noms
+    générés
+    """
+    if isinstance(event, config.AppInput):
+        return event.name
+    while isinstance(func, partial):
+        func = func.func
+    return getattr(func, '__qualname__', None) or str(event)
+
+
+def _get_nbr_of_entry(loaded_data: Any) -> int:
+    if isinstance(loaded_data, list):
+        return len(loaded_data)
+    return 1 if loaded_data else 0
+
+
+class EventStats:
+    """Mesures d'un événement à une position de l'arbre des appels, et des événements appelés pendant son exécution"""
+
+    def __init__(self) -> None:
+        self.nbr_of_call = 0
+        self.total_time = 0.
+        self.max_time = 0.
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.nbr_of_read = 0
+        self.nbr_of_write = 0
+        self.children: Dict[str, EventStats] = dict()
+
+    def get_child(self, event_key: str) -> EventStats:
+        child = self.children.get(event_key)
+        if child is None:
+            child = self.children[event_key] = EventStats()
+        return child
+
+    def add_call(self, elapsed: float, nbr_of_read: int, nbr_of_write: int) -> None:
+        self.nbr_of_call += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        elapsed_ms = elapsed * 1000
+        histogram_index = len(HISTOGRAM_BOUNDS_MS)
+        for bound_index, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if elapsed_ms < bound:
+                histogram_index = bound_index
+                break
+        self.histogram[histogram_index] += 1
+        self.nbr_of_read += nbr_of_read
+        self.nbr_of_write += nbr_of_write
+
+    def merge(self, other: EventStats) -> None:
+        """Ajoute les mesures d'un autre nœud, sans ses enfants"""
+        self.nbr_of_call += other.nbr_of_call
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+        self.histogram = [count + other_count for count, other_count in zip(self.histogram, other.histogram)]
+        self.nbr_of_read += other.nbr_of_read
+        self.nbr_of_write += other.nbr_of_write
+
+    def to_dict(self, with_children: bool = True) -> Dict:
+        stats_dict = {
+            'nbr_of_call': self.nbr_of_call,
+            'total_ms': round(self.total_time * 1000, 3),
+            'mean_ms': round(self.total_time * 1000 / self.nbr_of_call, 3) if self.nbr_of_call else 0.,
+            'max_ms': round(self.max_time * 1000, 3),
+            'histogram': self.histogram[:],
+            'nbr_of_read': self.nbr_of_read,
+            'nbr_of_write': self.nbr_of_write,
+        }
+        if with_children:
+            # Les événements en cours d'exécution, pas encore mesurés, sont omis
+            stats_dict['children'] = {event_key: child.to_dict() for event_key, child in self.children.items()
+                                      if child.nbr_of_call}
+        return stats_dict
+
+
+class EventProfiler:
+    """
+    Mesure les événements exécutés par le messenger (voir Messenger.profiler). Les durées, lectures et écritures d'un
+    événement incluent celles des événements qu'il appelle.
+    Seuls les événements et lectures du thread qui a créé le profiler sont mesurés, les appariements calculés en
+    arrière-plan n'étant pas des événements.
+    """
+
+    def __init__(self, loader) -> None:
+        self.loader = loader
+        self.thread_id = threading.get_ident()
+        self.call_tree = EventStats()
+        self.call_stack: List[EventStats] = [self.call_tree]
+        self.event_key_stack: List[str] = list()
+        self.nbr_of_read = 0
+        self.is_reading = False
+        self._count_loader_reads()
+
+    def _count_loader_reads(self) -> None:
+        """Remplace les méthodes de lecture du loader par des lectures comptant les entrées lues"""
+        for read_name in LOADER_READS:
+            loader_read = getattr(self.loader, read_name, None)
+            if loader_read is None:
+                continue
+
+            def counted_read(*args, loader_read=loader_read, **kwargs):
+                if threading.get_ident() != self.thread_id or self.is_reading:
+                    return loader_read(*args, **kwargs)
+                # Une lecture appelant une autre lecture du loader (ex : page de joueurs) n'est comptée qu'une fois
+                self.is_reading = True
+                try:
+                    loaded_data = loader_read(*args, **kwargs)
+                finally:
+                    self.is_reading = False
+                self.nbr_of_read += _get_nbr_of_entry(loaded_data)
+                return loaded_data
+            setattr(self.loader, read_name, counted_read)
+
+    def profile_call(self, event_key: str, event_call: Callable, *args) -> Any:
+        """Exécute l'appel d'un événement et l'ajoute à l'arbre des appels sous l'événement en cours"""
+        if threading.get_ident() != self.thread_id:
+            return event_call(*args)
+
+        self.call_stack.append(self.call_stack[-1].get_child(event_key))
+        self.event_key_stack.append(event_key)
+        nbr_of_read_before = self.nbr_of_read
+        nbr_of_write_before = self.loader.get_nbr_of_write()
+        start = time.perf_counter()
+        try:
+            return event_call(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.event_key_stack.pop()
+            # Le nœud est repris de la pile, qui a pu être reconstruite par reset() pendant l'appel
+            event_stats = self.call_stack.pop()
+            event_stats.add_call(elapsed, self.nbr_of_read - nbr_of_read_before,
+                                 self.loader.get_nbr_of_write() - nbr_of_write_before)
+
+    def get_stats_by_event(self) -> Dict[str, EventStats]:
+        """
+        Retourne les mesures de chaque événement, toutes positions de l'arbre confondues. Un événement appelé pendant
+        lui-même (récursion) n'est compté qu'à son niveau le plus haut
+        """
+        stats_by_event = dict()
+
+        def add_node(event_stats: EventStats, running_event: frozenset) -> None:
+            for event_key, child in event_stats.children.items():
+                if event_key not in running_event and child.nbr_of_call:
+                    stats_by_event.setdefault(event_key, EventStats()).merge(child)
+                add_node(child, running_event | {event_key})
+        add_node(self.call_tree, frozenset())
+        return stats_by_event
+
+    def reset(self) -> None:
+        """Efface les mesures, les événements en cours d'exécution restent mesurés dans le nouvel arbre"""
+        self.call_tree = EventStats()
+        self.call_stack = [self.call_tree]
+        for event_key in self.event_key_stack:
+            self.call_stack.append(self.call_stack[-1].get_child(event_key))
+
+    def to_dict(self) -> Dict:
+        return {
+            'histogram_bounds_ms': list(HISTOGRAM_BOUNDS_MS),
+            'events': {event_key: event_stats.to_dict(with_children=False)
+                       for event_key, event_stats in self.get_stats_by_event().items()},
+            'call_tree': self.call_tree.to_dict()['children'],
+        }
+
+    def dump_json(self, file_path: str) -> None:
+        with open(file_path, 'w', encoding='utf-8') as report_file:
+            json.dump(self.to_dict(), report_file, indent=4)
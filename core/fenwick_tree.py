@@ -0,0 +1,50 @@
+"""
+Arbre de Fenwick (arbre indexé binaire) : sommes préfixes et mises à jour ponctuelles en O(log n) sur un tableau
+d'entiers indexé à partir de 0. Le tableau s'agrandit à la demande.
+"""
+from __future__ import annotations
+
+from typing import List
+
+
+class FenwickTree:
+    def __init__(self, size: int = 1) -> None:
+        self._values: List[int] = max(1, size) * [0]
+        self._tree: List[int] = (max(1, size) + 1) * [0]
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _grow(self, min_size: int) -> None:
+        """Agrandit le tableau (au moins au double de sa taille) et reconstruit l'arbre en O(n)"""
+        size = max(min_size, 2 * len(self._values))
+        self._values.extend((size - len(self._values)) * [0])
+        self._tree = [0, *self._values]
+        for tree_index in range(1, size + 1):
+            parent_index = tree_index + (tree_index & -tree_index)
+            if parent_index <= size:
+                self._tree[parent_index] += self._tree[tree_index]
+
+    def add(self, index: int, delta: int) -> None:
+        """Ajoute 'delta' à la valeur d'index 'index'"""
+        if index >= len(self._values):
+            self._grow(index + 1)
+        self._values[index] += delta
+        self.total += delta
+        tree_index = index + 1
+        while tree_index < len(self._tree):
+            self._tree[tree_index] += delta
+            tree_index += tree_index & -tree_index
+
+    def prefix_sum(self, index: int) -> int:
+        """Retourne la somme des valeurs d'index 0 à 'index' inclus"""
+        tree_index = min(index + 1, len(self._values))
+        prefix_sum = 0
+        while tree_index > 0:
+            prefix_sum += self._tree[tree_index]
+            tree_index -= tree_index & -tree_index
+        return prefix_sum
+
+    def get(self, index: int) -> int:
+        return self._values[index] if index < len(self._values) else 0
@@ -0,0 +1,114 @@
+"""
+Vue sans terminal de l'application : les actions utilisateur et les réponses aux formulaires sont lues dans un script
+(liste de dicts, ou fichier jsonl d'un dict par ligne), l'affichage est conservé dans HeadlessView.output.
+
+Étapes d'un script, consommées dans l'ordre :
+    {"select": "NEXT_TURN"} : sélectionne un événement par le nom de son AppInput ou par son nom exact dans le menu
+    {"start": "GOING", "end": "Winner", "contains": "..."} : sélectionne le premier nom du menu respectant chaque
+        critère présent
+    {"form": {"name": "...", ...}} : réponses au prochain formulaire, vérifiées par ses validateurs
+    {"expect": "Round9"} : vérifie que le texte a été affiché depuis la sélection précédente ou figure dans le menu
+Une fois le script terminé, l'application est quittée.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, List
+
+from core import mainview
+from data.config import AppInput
+
+SELECTION_CRITERIA = ('start', 'end', 'contains')
+
+
+class HeadlessScriptError(Exception):
+    """Étape du script impossible : événement absent du menu, formulaire attendu ou réponse refusée"""
+
+
+def load_script(file_path: str) -> List[Dict]:
+    """Lit un script jsonl, les lignes vides sont ignorées"""
+    with open(file_path, encoding='utf-8') as script_file:
+        return [json.loads(line) for line in script_file if line.strip()]
+
+
+def _match_criteria(event_str: str, step: Dict) -> bool:
+    return event_str.startswith(step.get('start', '')) and event_str.endswith(step.get('end', '')) and \
+        step.get('contains', '') in event_str
+
+
+class HeadlessView(mainview.MainView):
+    def __init__(self, script: Iterable[Dict]) -> None:
+        super().__init__()
+        self.script = iter(script)
+        self.output: List[str] = list()
+        # Index dans output du premier affichage depuis la sélection précédente, voir les étapes 'expect'
+        self.step_output_start = 0
+        self.nbr_of_step = 0
+
+    def display_title(self) -> None:
+        self.output.append(self.title)
+
+    def display_menu_title(self) -> None:
+        self.output.append(self.menu_title)
+
+    def display_display_bloc(self) -> None:
+        self.output.extend(self.display_blocks)
+
+    def _next_step(self) -> Dict | None:
+        step = next(self.script, None)
+        if step is not None:
+            self.nbr_of_step += 1
+        return step
+
+    def _check_expected(self, expected: str, allowed_input: dict) -> None:
+        displayed = [*self.output[self.step_output_start:], *allowed_input]
+        if not any(expected in block for block in displayed):
+            raise HeadlessScriptError(f"Step {self.nbr_of_step} : '{expected}' was not displayed")
+
+    def get_form_answer(self, form_question: dict, validator: Dict | None = None) -> Dict:
+        """Retourne les réponses de l'étape 'form' suivante du script après vérification par les validateurs"""
+        step = self._next_step()
+        if step is None or 'form' not in step:
+            raise HeadlessScriptError(f"Step {self.nbr_of_step} : form answer expected for {list(form_question)}, "
+                                      f"got {step}")
+        if validator is None:
+            validator = dict()
+
+        answer = dict()
+        for var in form_question:
+            if var not in step['form']:
+                raise HeadlessScriptError(f"Step {self.nbr_of_step} : no answer for '{var}'")
+            answer[var] = str(step['form'][var])
+            is_valid = validator[var](answer[var]) if var in validator else True
+            if is_valid is not True:
+                raise HeadlessScriptError(f"Step {self.nbr_of_step} : invalid answer '{answer[var]}' for '{var}' "
+                                          f"({is_valid})")
+        return answer
+
+    def get_user_select(self, message, allowed_input: dict) -> Any:
+        """
+        Retourne l'événement choisi par l'étape de sélection suivante du script, les étapes 'expect' la précédant
+        sont vérifiées. À la fin du script, retourne AppInput.QUIT
+        """
+        step = self._next_step()
+        while step is not None and 'expect' in step:
+            self._check_expected(step['expect'], allowed_input)
+            step = self._next_step()
+        self.step_output_start = len(self.output)
+        if step is None:
+            return AppInput.QUIT
+
+        if 'select' in step:
+            selected = step['select']
+            if selected in allowed_input:
+                return allowed_input[selected]
+            for event in allowed_input.values():
+                if isinstance(event, AppInput) and event.name == selected:
+                    return event
+        elif any(criteria in step for criteria in SELECTION_CRITERIA):
+            for event_str, event in allowed_input.items():
+                if _match_criteria(event_str, step):
+                    return event
+        else:
+            raise HeadlessScriptError(f"Step {self.nbr_of_step} : selection expected, got {step}")
+        raise HeadlessScriptError(f"Step {self.nbr_of_step} : {step} not available in {list(allowed_input)}")
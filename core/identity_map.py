@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict
+
+from data import config
+
+
+class IdentityMap:
+    """
+    Cache des objets chargés par l'application : un seul objet vivant par id et par base de donnée.
+    Chaque base conserve au plus 'max_size' objets, les moins récemment utilisés sont retirés en premier.
+    Le loader invalide l'entrée correspondante à chaque sauvegarde, le contrôleur ayant sauvegardé l'objet l'inscrit
+    de nouveau.
+    """
+
+    def __init__(self, max_size: int = config.IDENTITY_MAP_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.objects_by_db: Dict[str, OrderedDict] = dict()
+
+    def _get_db_objects(self, db_name: str) -> OrderedDict:
+        if db_name not in self.objects_by_db:
+            self.objects_by_db[db_name] = OrderedDict()
+        return self.objects_by_db[db_name]
+
+    def get(self, db_name: str, entry_id: int) -> Any | None:
+        """Retourne l'objet en cache pour cet id, None s'il n'est pas chargé"""
+        db_objects = self._get_db_objects(db_name)
+        if entry_id not in db_objects:
+            return None
+        db_objects.move_to_end(entry_id)
+        return db_objects[entry_id]
+
+    def put(self, db_name: str, entry_id: int, entry_obj: Any) -> Any:
+        """Inscrit un objet dans le cache et retourne l'objet"""
+        db_objects = self._get_db_objects(db_name)
+        db_objects[entry_id] = entry_obj
+        db_objects.move_to_end(entry_id)
+        while len(db_objects) > self.max_size:
+            db_objects.popitem(last=False)
+        return entry_obj
+
+    def invalidate(self, db_name: str, entry_id: int) -> None:
+        self._get_db_objects(db_name).pop(entry_id, None)
+
+    def clear(self) -> None:
+        self.objects_by_db.clear()
+
+    def __len__(self) -> int:
+        return sum(len(db_objects) for db_objects in self.objects_by_db.values())
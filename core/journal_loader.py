@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from data import config
+from core import identity_map, player_index, tournament_index
+from core.tinydb_loader import FILES_NAME
+
+ID_KEY_BY_DB = {
+    config.PLAYER_DB_NAME: 'player_id',
+    config.TOURNAMENT_DB_NAME: 'tournament_id',
+    config.TURN_DB_NAME: 'turn_id',
+    config.MATCH_DB_NAME: 'match_id',
+}
+
+
+def get_file_path_from_name(file_name: str) -> str:
+    """
+    Construit le path complet d'un journal à partir du nom de fichier fournit
+    """
+    return os.path.join(os.getcwd(), config.SAVE_DIRECTORY, f"{file_name}.journal.jsonl")
+
+
+class JournalTable:
+    """
+    Base de donnée en journal : chaque sauvegarde ajoute une ligne json {"id": ..., "data": ...} à la fin du fichier,
+    le chargement rejoue le journal pour construire un index en mémoire (la dernière ligne d'un id l'emporte).
+    Pendant une unité de travail, les lignes sont conservées à part de l'index jusqu'au flush.
+    Lorsque les lignes obsolètes dépassent le seuil défini dans config, le fichier est réécrit dans un thread dédié.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        # Lignes présentes dans le journal, seules lignes réécrites par la compaction
+        self.index: Dict[int, str] = dict()
+        self.nbr_of_line = 0
+        self.next_id = 1
+
+        self.buffering = False
+        # Lignes de l'unité de travail en cours, pas encore ajoutées au journal
+        self.pending_index: Dict[int, str] = dict()
+        self.nbr_of_write = 0
+
+        self.lock = threading.Lock()
+        self.compaction_thread: threading.Thread | None = None
+
+        self._replay()
+        self.compact_if_needed()
+
+    def _replay(self) -> None:
+        """
+        Rejoue le journal. Une dernière ligne incomplète (sauvegarde interrompue) est retirée du fichier, une ligne
+        illisible au milieu du journal lève une erreur.
+        """
+        if not os.path.exists(self.file_path):
+            return
+        with open(self.file_path, 'rb') as journal:
+            lines = journal.readlines()
+
+        valid_size = 0
+        for line_nbr, raw_line in enumerate(lines):
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            if line:
+                try:
+                    entry_id = json.loads(line)['id']
+                except (json.JSONDecodeError, KeyError, TypeError) as error:
+                    if line_nbr < len(lines) - 1:
+                        raise ValueError(f"Corrupted journal {self.file_path} at line {line_nbr + 1}") from error
+                    self._truncate(valid_size)
+                    break
+                self.index[entry_id] = line
+                self.nbr_of_line += 1
+            valid_size += len(raw_line)
+        else:
+            if lines and not lines[-1].endswith(b'\n'):
+                # Dernière ligne complète mais sans fin de ligne : le prochain ajout doit commencer sur une ligne neuve
+                with open(self.file_path, 'ab') as journal:
+                    journal.write(b'\n')
+        if self.index:
+            self.next_id = max(self.index) + 1
+
+    def _truncate(self, valid_size: int) -> None:
+        with open(self.file_path, 'r+b') as journal:
+            journal.truncate(valid_size)
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    @property
+    def garbage(self) -> int:
+        """Nombre de lignes du journal remplacées par une ligne plus récente"""
+        return self.nbr_of_line - len(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index) + len([entry_id for entry_id in self.pending_index if entry_id not in self.index])
+
+    def __contains__(self, entry_id: int) -> bool:
+        return entry_id in self.pending_index or entry_id in self.index
+
+    def get_id_list(self) -> List[int]:
+        """Retourne les ids des entrées du journal et de l'unité de travail en cours"""
+        return sorted({*self.index, *self.pending_index})
+
+    def reserve_id(self) -> int:
+        entry_id = self.next_id
+        self.next_id += 1
+        return entry_id
+
+    def get(self, entry_id: int) -> Dict | None:
+        line = self.pending_index.get(entry_id)
+        if line is None:
+            line = self.index.get(entry_id)
+        if line is None:
+            return None
+        return json.loads(line)['data']
+
+    def write(self, entry_id: int, entry_data: Dict) -> None:
+        """Ajoute l'entrée au journal et à l'index, ou la conserve en attente pendant une unité de travail"""
+        line = json.dumps({'id': entry_id, 'data': entry_data}, sort_keys=True)
+        if self.buffering:
+            self.pending_index[entry_id] = line
+            return
+        self._append({entry_id: line})
+
+    def flush(self) -> None:
+        """Ajoute les lignes en attente au journal et repasse en écriture immédiate"""
+        self.buffering = False
+        if not self.pending_index:
+            return
+        pending_index, self.pending_index = self.pending_index, dict()
+        self._append(pending_index)
+
+    def discard_pending(self) -> None:
+        """
+        Abandonne les lignes en attente et repasse en écriture immédiate, l'index n'en contient aucune. Les ids
+        réservés pendant l'unité de travail sont de nouveau disponibles.
+        """
+        self.buffering = False
+        self.pending_index = dict()
+        self.next_id = max(self.index) + 1 if self.index else 1
+
+    def _append(self, lines_by_id: Dict[int, str]) -> None:
+        """Ajoute les lignes au journal, synchronisé sur le disque, puis à l'index"""
+        with self.lock:
+            with open(self.file_path, 'a', encoding='utf-8') as journal:
+                journal.write(''.join(f"{line}\n" for line in lines_by_id.values()))
+                journal.flush()
+                os.fsync(journal.fileno())
+            self.index.update(lines_by_id)
+            self.nbr_of_line += len(lines_by_id)
+            self.nbr_of_write += 1
+        self.compact_if_needed()
+
+    def compact_if_needed(self) -> None:
+        """Lance la compaction du journal en arrière-plan si les lignes obsolètes dépassent le seuil"""
+        if self.garbage < config.JOURNAL_COMPACTION_MIN_GARBAGE:
+            return
+        if self.garbage < self.nbr_of_line * config.JOURNAL_COMPACTION_RATIO:
+            return
+        if self.compaction_thread is not None and self.compaction_thread.is_alive():
+            return
+        self.compaction_thread = threading.Thread(target=self.compact, daemon=True)
+        self.compaction_thread.start()
+
+    def compact(self) -> None:
+        """
+        Réécrit le journal avec une seule ligne par entrée, à partir de l'index (lignes déjà ajoutées au journal,
+        jamais celles d'une unité de travail en cours). Le verrou bloque les ajouts pendant la réécriture, le fichier
+        est remplacé de manière atomique.
+        """
+        with self.lock:
+            temp_file_path = f"{self.file_path}.tmp"
+            with open(temp_file_path, 'w', encoding='utf-8') as journal:
+                journal.write(''.join(f"{self.index[entry_id]}\n" for entry_id in sorted(self.index)))
+                journal.flush()
+                os.fsync(journal.fileno())
+            os.replace(temp_file_path, self.file_path)
+            self.nbr_of_line = len(self.index)
+            self.nbr_of_write += 1
+
+    def wait_for_compaction(self) -> None:
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+
+
+class JournalLoader:
+    def __init__(self):
+        """
+        Loader alternatif de l'application, reprend les noms de méthode de TinyDBLoader en s'appuyant sur un journal
+        en ajout seul par base de donnée : une sauvegarde coûte l'ajout d'une ligne au lieu de la réécriture du
+        fichier. Sélectionné via config.DB_BACKEND.
+        Les journaux ne sont rejoués qu'à leur première utilisation, voir get_db_handle().
+        """
+        self.db_dict: Dict[str, JournalTable] = dict()
+        self.unit_of_work_depth = 0
+        self.identity_map = identity_map.IdentityMap()
+        self.player_name_index: player_index.PlayerNameIndex | None = None
+        self.tournament_summary_index: tournament_index.TournamentSummaryIndex | None = None
+
+    def get_db_handle(self, db_name: str) -> JournalTable:
+        """
+        Reçoit le nom d'une base de donnée et retourne le journal correspondant, rejoué lors du premier appel (le
+        répertoire de sauvegarde est créé si nécessaire)
+        """
+        working_database = self.db_dict.get(db_name, None)
+        if working_database is not None:
+            return working_database
+        if db_name not in FILES_NAME:
+            print(f"Something went wrong while loading db {db_name}")
+            return working_database
+
+        file_path = get_file_path_from_name(db_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        working_database = JournalTable(file_path)
+        # Un journal ouvert pendant une unité de travail en fait partie
+        working_database.buffering = self.unit_of_work_depth > 0
+        self.db_dict[db_name] = working_database
+        return working_database
+
+    def begin(self) -> None:
+        """
+        Ouvre une unité de travail : jusqu'au commit correspondant, les lignes sont conservées en mémoire.
+        """
+        self.unit_of_work_depth += 1
+        for working_database in self.db_dict.values():
+            working_database.buffering = True
+
+    def commit(self) -> None:
+        """
+        Ferme une unité de travail, si c'est la plus externe les lignes en attente sont ajoutées aux journaux.
+        """
+        if self.unit_of_work_depth == 0:
+            return
+        self.unit_of_work_depth -= 1
+        if self.unit_of_work_depth > 0:
+            return
+        for working_database in self.db_dict.values():
+            working_database.flush()
+
+    def rollback(self) -> None:
+        """
+        Abandonne l'unité de travail en cours et celles qui l'englobent : les lignes en attente ne sont pas ajoutées
+        aux journaux, les index des joueurs et tournois sont relus au prochain accès. Les objets en cache peuvent
+        provenir de l'unité de travail annulée : le cache est vidé.
+        """
+        self.unit_of_work_depth = 0
+        for working_database in self.db_dict.values():
+            working_database.discard_pending()
+        self.player_name_index = None
+        self.tournament_summary_index = None
+        self.identity_map.clear()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[JournalLoader]:
+        """
+        Helper context manager autour de begin() / commit(), si le bloc lève une exception rien n'est ajouté aux
+        journaux (voir rollback()) et l'exception est propagée.
+        """
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+
+    def get_nbr_db_entry(self, db_name: str) -> int:
+        """
+        Reçoit le nom d'une base de donnée et retourne le nombre d'entrées qu'elle contient
+        """
+        return len(self.get_db_handle(db_name))
+
+    def get_nbr_of_write(self, db_name: str | None = None) -> int:
+        """
+        Retourne le nombre d'écritures de fichier réalisées pour une base de donnée ou pour l'ensemble des bases si
+        aucun nom n'est précisé
+        """
+        if db_name is not None:
+            working_database = self.db_dict.get(db_name)
+            return 0 if working_database is None else working_database.nbr_of_write
+        return sum(working_database.nbr_of_write for working_database in self.db_dict.values())
+
+    def upsert_entry(self, db_name: str, entry_data: Dict) -> int:
+        """
+        Reçoit le nom d'une base et les données d'une entrée, réserve un id si l'entrée n'existe pas encore, inscrit
+        l'id dans les données et ajoute l'entrée au journal. L'objet en cache pour cet id (reçu ou réservé) est
+        invalidé.
+        """
+        working_database = self.get_db_handle(db_name)
+        id_key = ID_KEY_BY_DB[db_name]
+        doc_id = entry_data.get(id_key, -1)
+        self.identity_map.invalidate(db_name, doc_id)
+        if doc_id not in working_database:
+            doc_id = working_database.reserve_id()
+            self.identity_map.invalidate(db_name, doc_id)
+        entry_data[id_key] = doc_id
+        working_database.write(doc_id, entry_data)
+        return doc_id
+
+    def load_entry(self, db_name: str, entry_id: int) -> Dict | bool:
+        """
+        Reçoit le nom d'une base et l'id d'une entrée, retourne les données de l'entrée ou False si elle n'existe pas
+        """
+        entry_data = self.get_db_handle(db_name).get(entry_id)
+        if entry_data is None:
+            return False
+        entry_data[ID_KEY_BY_DB[db_name]] = entry_id
+        return entry_data
+
+    def load_entries(self, db_name: str, entry_id_list: List) -> List[Dict]:
+        """
+        Reçoit le nom d'une base et une liste d'id, retourne la liste des données correspondantes dans l'ordre des ids
+        reçus. Les ids inexistants sont ignorés.
+        """
+        entries = list()
+        for entry_id in entry_id_list:
+            entry_data = self.load_entry(db_name, entry_id)
+            if not entry_data:
+                continue
+            entries.append(entry_data)
+        return entries
+
+    def save_player(self, player_data_dict: Dict) -> int:
+        # Comme avec TinyDB, un joueur est toujours enregistré comme une nouvelle entrée
+        player_data = {**player_data_dict, 'player_id': -1}
+        player_id = self.upsert_entry(config.PLAYER_DB_NAME, player_data)
+        if self.player_name_index is not None:
+            self.player_name_index.add(player_data)
+        return player_id
+
+    def get_player_name_index(self) -> player_index.PlayerNameIndex:
+        """
+        Retourne l'index alphabétique des joueurs. Le journal étant rejoué à chaque ouverture, l'index est construit
+        en mémoire lors du premier appel puis tenu à jour à chaque nouveau joueur.
+        """
+        if self.player_name_index is None:
+            working_database = self.get_db_handle(config.PLAYER_DB_NAME)
+            self.player_name_index = player_index.PlayerNameIndex.from_player_data_list(
+                self.load_players(working_database.get_id_list()))
+        return self.player_name_index
+
+    def load_player_page(self, cursor: List | None, nbr_of_player: int, backward: bool = False) -> List[Dict]:
+        """
+        Retourne les données des 'nbr_of_player' joueurs suivant le curseur dans l'ordre alphabétique (ou le précédant
+        si 'backward').
+        """
+        return self.load_players(self.get_player_name_index().get_page(cursor, nbr_of_player, backward))
+
+    def load_player(self, player_id: int) -> bool | Dict:
+        return self.load_entry(config.PLAYER_DB_NAME, player_id)
+
+    def load_players(self, player_id_list: List) -> List[Dict]:
+        return self.load_entries(config.PLAYER_DB_NAME, player_id_list)
+
+    def player_exist(self, player_id: int) -> bool:
+        return player_id in self.get_db_handle(config.PLAYER_DB_NAME)
+
+    def save_tournament(self, tournament_data_dict: Dict) -> int:
+        tournament_id = self.upsert_entry(config.TOURNAMENT_DB_NAME, tournament_data_dict)
+        if self.tournament_summary_index is not None:
+            self.tournament_summary_index.update(tournament_index.get_tournament_summary(tournament_data_dict))
+        return tournament_id
+
+    def get_tournament_summary_index(self) -> tournament_index.TournamentSummaryIndex:
+        """
+        Retourne l'index des résumés de tournois, construit en mémoire lors du premier appel puis tenu à jour à chaque
+        sauvegarde de tournoi.
+        """
+        if self.tournament_summary_index is None:
+            working_database = self.get_db_handle(config.TOURNAMENT_DB_NAME)
+            self.tournament_summary_index = tournament_index.TournamentSummaryIndex(
+                [tournament_index.get_tournament_summary(tournament_data)
+                 for tournament_data in self.load_entries(config.TOURNAMENT_DB_NAME, working_database.get_id_list())])
+        return self.tournament_summary_index
+
+    def load_tournament_summaries(self, cursor: List | None, nbr_of_tournament: int,
+                                  backward: bool = False) -> List[Dict]:
+        """
+        Retourne les résumés des 'nbr_of_tournament' tournois suivant le curseur dans la liste des tournois (ou le
+        précédant si 'backward').
+        """
+        return self.get_tournament_summary_index().get_page(cursor, nbr_of_tournament, backward)
+
+    def load_tournament_data(self, tournament_id: int) -> Dict | bool:
+        return self.load_entry(config.TOURNAMENT_DB_NAME, tournament_id)
+
+    def tournament_exist(self, tournament_id: int) -> bool:
+        return tournament_id in self.get_db_handle(config.TOURNAMENT_DB_NAME)
+
+    def save_match(self, match_data: Dict) -> int:
+        return self.upsert_entry(config.MATCH_DB_NAME, match_data)
+
+    def load_match(self, match_id: int) -> Dict | bool:
+        return self.load_entry(config.MATCH_DB_NAME, match_id)
+
+    def load_matches(self, match_id_list: List) -> List[Dict]:
+        return self.load_entries(config.MATCH_DB_NAME, match_id_list)
+
+    def save_turn(self, turn_data: Dict) -> int:
+        return self.upsert_entry(config.TURN_DB_NAME, turn_data)
+
+    def load_turn(self, turn_id: int) -> Dict | bool:
+        return self.load_entry(config.TURN_DB_NAME, turn_id)
+
+    def load_turns(self, turn_id_list: List) -> List[Dict]:
+        return self.load_entries(config.TURN_DB_NAME, turn_id_list)
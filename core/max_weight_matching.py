@@ -0,0 +1,398 @@
+"""
+Couplage de poids maximum dans un graphe général (algorithme des fleurs d'Edmonds, version primale-duale en O(n³)).
+
+Implémentation en python pur, adaptée de l'implémentation de référence de Joris van Rantwijk (domaine public) qui
+suit "An O(EV log V) algorithm for finding a maximum weighted matching in general graphs" (Galil, Micali, Gabow)
+dans sa variante simple en O(n³).
+
+Les sommets sont des entiers de 0 à n-1, chaque arête est un tuple (i, j, poids). Les poids entiers donnent un
+résultat exact.
+"""
+from __future__ import annotations
+
+from typing import Iterator, List, Tuple
+
+
+def max_weight_matching(edges: List[Tuple[int, int, int]], max_cardinality: bool = False) -> List[int]:
+    """
+    Reçoit une liste d'arêtes (i, j, poids) et retourne la liste 'mate' : mate[i] est le sommet couplé au sommet i,
+    -1 si le sommet n'est pas couplé.
+    Si 'max_cardinality', seul un couplage de cardinalité maximum est retenu (le plus lourd parmi ceux-ci).
+    """
+    if not edges:
+        return list()
+
+    nbr_of_edge = len(edges)
+    nbr_of_vertex = 1 + max(max(i, j) for i, j, _ in edges)
+    max_weight = max(0, max(weight for _, _, weight in edges))
+
+    # Les extrémités d'arêtes sont numérotées : l'arête k a pour extrémités 2k (sommet i) et 2k+1 (sommet j)
+    endpoint = [edges[p // 2][p % 2] for p in range(2 * nbr_of_edge)]
+    # neighbend[v] : extrémités distantes des arêtes incidentes au sommet v
+    neighbend: List[List[int]] = [list() for _ in range(nbr_of_vertex)]
+    for k, (i, j, _) in enumerate(edges):
+        neighbend[i].append(2 * k + 1)
+        neighbend[j].append(2 * k)
+
+    # mate[v] : extrémité distante de l'arête de couplage de v, -1 si v est libre
+    mate = nbr_of_vertex * [-1]
+    # label[b] : 0 sans étiquette, 1 étiquette S, 2 étiquette T (5 : marque temporaire de scan_blossom)
+    label = (2 * nbr_of_vertex) * [0]
+    labelend = (2 * nbr_of_vertex) * [-1]
+    inblossom = list(range(nbr_of_vertex))
+    blossomparent = (2 * nbr_of_vertex) * [-1]
+    blossomchilds: List[List[int] | None] = (2 * nbr_of_vertex) * [None]
+    blossombase = list(range(nbr_of_vertex)) + nbr_of_vertex * [-1]
+    blossomendps: List[List[int] | None] = (2 * nbr_of_vertex) * [None]
+    bestedge = (2 * nbr_of_vertex) * [-1]
+    blossombestedges: List[List[int] | None] = (2 * nbr_of_vertex) * [None]
+    unusedblossoms = list(range(nbr_of_vertex, 2 * nbr_of_vertex))
+    dualvar = nbr_of_vertex * [max_weight] + nbr_of_vertex * [0]
+    allowedge = nbr_of_edge * [False]
+    queue: List[int] = list()
+
+    def slack(k: int) -> int:
+        i, j, weight = edges[k]
+        return dualvar[i] + dualvar[j] - 2 * weight
+
+    def blossom_leaves(b: int) -> Iterator[int]:
+        if b < nbr_of_vertex:
+            yield b
+            return
+        for t in blossomchilds[b]:
+            if t < nbr_of_vertex:
+                yield t
+            else:
+                yield from blossom_leaves(t)
+
+    def assign_label(w: int, t: int, p: int) -> None:
+        """Étiquette le sommet w (et sa fleur) avec t, atteint par l'extrémité p"""
+        b = inblossom[w]
+        label[w] = label[b] = t
+        labelend[w] = labelend[b] = p
+        bestedge[w] = bestedge[b] = -1
+        if t == 1:
+            queue.extend(blossom_leaves(b))
+        elif t == 2:
+            base = blossombase[b]
+            assign_label(endpoint[mate[base]], 1, mate[base] ^ 1)
+
+    def scan_blossom(v: int, w: int) -> int:
+        """
+        Remonte les chemins alternés depuis v et w, retourne la base de la nouvelle fleur ou -1 si un chemin
+        augmentant a été trouvé
+        """
+        path = list()
+        base = -1
+        while v != -1 or w != -1:
+            b = inblossom[v]
+            if label[b] & 4:
+                base = blossombase[b]
+                break
+            path.append(b)
+            label[b] = 5
+            if labelend[b] == -1:
+                v = -1
+            else:
+                v = endpoint[labelend[b]]
+                b = inblossom[v]
+                v = endpoint[labelend[b]]
+            if w != -1:
+                v, w = w, v
+        for b in path:
+            label[b] = 1
+        return base
+
+    def add_blossom(base: int, k: int) -> None:
+        """Construit une nouvelle fleur de base 'base' à partir de l'arête k qui relie deux sommets S"""
+        v, w, _ = edges[k]
+        bb = inblossom[base]
+        bv = inblossom[v]
+        bw = inblossom[w]
+        b = unusedblossoms.pop()
+        blossombase[b] = base
+        blossomparent[b] = -1
+        blossomparent[bb] = b
+        blossomchilds[b] = path = list()
+        blossomendps[b] = endps = list()
+        while bv != bb:
+            blossomparent[bv] = b
+            path.append(bv)
+            endps.append(labelend[bv])
+            v = endpoint[labelend[bv]]
+            bv = inblossom[v]
+        path.append(bb)
+        path.reverse()
+        endps.reverse()
+        endps.append(2 * k)
+        while bw != bb:
+            blossomparent[bw] = b
+            path.append(bw)
+            endps.append(labelend[bw] ^ 1)
+            w = endpoint[labelend[bw]]
+            bw = inblossom[w]
+        label[b] = 1
+        labelend[b] = labelend[bb]
+        dualvar[b] = 0
+        for v in blossom_leaves(b):
+            if label[inblossom[v]] == 2:
+                queue.append(v)
+            inblossom[v] = b
+
+        # Meilleures arêtes de la nouvelle fleur vers chaque fleur S voisine
+        bestedgeto = (2 * nbr_of_vertex) * [-1]
+        for bv in path:
+            if blossombestedges[bv] is None:
+                neighbour_lists = [[p // 2 for p in neighbend[v]] for v in blossom_leaves(bv)]
+            else:
+                neighbour_lists = [blossombestedges[bv]]
+            for neighbour_list in neighbour_lists:
+                for k in neighbour_list:
+                    i, j, _ = edges[k]
+                    if inblossom[j] == b:
+                        i, j = j, i
+                    bj = inblossom[j]
+                    if bj != b and label[bj] == 1 and (bestedgeto[bj] == -1 or slack(k) < slack(bestedgeto[bj])):
+                        bestedgeto[bj] = k
+            blossombestedges[bv] = None
+            bestedge[bv] = -1
+        blossombestedges[b] = [k for k in bestedgeto if k != -1]
+        bestedge[b] = -1
+        for k in blossombestedges[b]:
+            if bestedge[b] == -1 or slack(k) < slack(bestedge[b]):
+                bestedge[b] = k
+
+    def expand_blossom(b: int, endstage: bool) -> None:
+        """Défait la fleur b, ses sous-fleurs redeviennent des fleurs de premier niveau"""
+        for s in blossomchilds[b]:
+            blossomparent[s] = -1
+            if s < nbr_of_vertex:
+                inblossom[s] = s
+            elif endstage and dualvar[s] == 0:
+                expand_blossom(s, endstage)
+            else:
+                for v in blossom_leaves(s):
+                    inblossom[v] = s
+
+        if not endstage and label[b] == 2:
+            # Réétiquette les sous-fleurs sur le chemin pair qui relie l'entrée de la fleur à sa base
+            entrychild = inblossom[endpoint[labelend[b] ^ 1]]
+            j = blossomchilds[b].index(entrychild)
+            if j & 1:
+                j -= len(blossomchilds[b])
+                jstep = 1
+                endptrick = 0
+            else:
+                jstep = -1
+                endptrick = 1
+            p = labelend[b]
+            while j != 0:
+                label[endpoint[p ^ 1]] = 0
+                label[endpoint[blossomendps[b][j - endptrick] ^ endptrick ^ 1]] = 0
+                assign_label(endpoint[p ^ 1], 2, p)
+                allowedge[blossomendps[b][j - endptrick] // 2] = True
+                j += jstep
+                p = blossomendps[b][j - endptrick] ^ endptrick
+                allowedge[p // 2] = True
+                j += jstep
+            bv = blossomchilds[b][j]
+            label[endpoint[p ^ 1]] = label[bv] = 2
+            labelend[endpoint[p ^ 1]] = labelend[bv] = p
+            bestedge[bv] = -1
+            j += jstep
+            while blossomchilds[b][j] != entrychild:
+                bv = blossomchilds[b][j]
+                if label[bv] == 1:
+                    j += jstep
+                    continue
+                labeled_vertex = -1
+                for v in blossom_leaves(bv):
+                    if label[v] != 0:
+                        labeled_vertex = v
+                        break
+                if labeled_vertex != -1:
+                    label[labeled_vertex] = 0
+                    label[endpoint[mate[blossombase[bv]]]] = 0
+                    assign_label(labeled_vertex, 2, labelend[labeled_vertex])
+                j += jstep
+
+        label[b] = labelend[b] = -1
+        blossomchilds[b] = blossomendps[b] = None
+        blossombase[b] = -1
+        blossombestedges[b] = None
+        bestedge[b] = -1
+        unusedblossoms.append(b)
+
+    def augment_blossom(b: int, v: int) -> None:
+        """Inverse le couplage le long du chemin pair de la fleur b entre le sommet v et la base de la fleur"""
+        t = v
+        while blossomparent[t] != b:
+            t = blossomparent[t]
+        if t >= nbr_of_vertex:
+            augment_blossom(t, v)
+        i = j = blossomchilds[b].index(t)
+        if i & 1:
+            j -= len(blossomchilds[b])
+            jstep = 1
+            endptrick = 0
+        else:
+            jstep = -1
+            endptrick = 1
+        while j != 0:
+            j += jstep
+            t = blossomchilds[b][j]
+            p = blossomendps[b][j - endptrick] ^ endptrick
+            if t >= nbr_of_vertex:
+                augment_blossom(t, endpoint[p])
+            j += jstep
+            t = blossomchilds[b][j]
+            if t >= nbr_of_vertex:
+                augment_blossom(t, endpoint[p ^ 1])
+            mate[endpoint[p]] = p ^ 1
+            mate[endpoint[p ^ 1]] = p
+        blossomchilds[b] = blossomchilds[b][i:] + blossomchilds[b][:i]
+        blossomendps[b] = blossomendps[b][i:] + blossomendps[b][:i]
+        blossombase[b] = blossombase[blossomchilds[b][0]]
+
+    def augment_matching(k: int) -> None:
+        """Inverse le couplage le long du chemin augmentant passant par l'arête k"""
+        v, w, _ = edges[k]
+        for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+            while True:
+                bs = inblossom[s]
+                if bs >= nbr_of_vertex:
+                    augment_blossom(bs, s)
+                mate[s] = p
+                if labelend[bs] == -1:
+                    break
+                t = endpoint[labelend[bs]]
+                bt = inblossom[t]
+                s = endpoint[labelend[bt]]
+                j = endpoint[labelend[bt] ^ 1]
+                if bt >= nbr_of_vertex:
+                    augment_blossom(bt, j)
+                mate[j] = labelend[bt]
+                p = labelend[bt] ^ 1
+
+    # Chaque étape cherche un chemin augmentant, au plus n étapes
+    for _ in range(nbr_of_vertex):
+        label[:] = (2 * nbr_of_vertex) * [0]
+        bestedge[:] = (2 * nbr_of_vertex) * [-1]
+        blossombestedges[nbr_of_vertex:] = nbr_of_vertex * [None]
+        allowedge[:] = nbr_of_edge * [False]
+        queue[:] = list()
+
+        for v in range(nbr_of_vertex):
+            if mate[v] == -1 and label[inblossom[v]] == 0:
+                assign_label(v, 1, -1)
+
+        augmented = False
+        while True:
+            while queue and not augmented:
+                v = queue.pop()
+                for p in neighbend[v]:
+                    k = p // 2
+                    w = endpoint[p]
+                    if inblossom[v] == inblossom[w]:
+                        continue
+                    kslack = 0
+                    if not allowedge[k]:
+                        kslack = slack(k)
+                        if kslack <= 0:
+                            allowedge[k] = True
+                    if allowedge[k]:
+                        if label[inblossom[w]] == 0:
+                            assign_label(w, 2, p ^ 1)
+                        elif label[inblossom[w]] == 1:
+                            base = scan_blossom(v, w)
+                            if base >= 0:
+                                add_blossom(base, k)
+                            else:
+                                augment_matching(k)
+                                augmented = True
+                                break
+                        elif label[w] == 0:
+                            label[w] = 2
+                            labelend[w] = p ^ 1
+                    elif label[inblossom[w]] == 1:
+                        b = inblossom[v]
+                        if bestedge[b] == -1 or kslack < slack(bestedge[b]):
+                            bestedge[b] = k
+                    elif label[w] == 0:
+                        if bestedge[w] == -1 or kslack < slack(bestedge[w]):
+                            bestedge[w] = k
+
+            if augmented:
+                break
+
+            # Aucun chemin augmentant avec les arêtes admissibles : mise à jour des variables duales
+            delta_type = -1
+            delta = delta_edge = delta_blossom = None
+            if not max_cardinality:
+                delta_type = 1
+                delta = min(dualvar[:nbr_of_vertex])
+
+            for v in range(nbr_of_vertex):
+                if label[inblossom[v]] == 0 and bestedge[v] != -1:
+                    d = slack(bestedge[v])
+                    if delta_type == -1 or d < delta:
+                        delta = d
+                        delta_type = 2
+                        delta_edge = bestedge[v]
+
+            for b in range(2 * nbr_of_vertex):
+                if blossomparent[b] == -1 and label[b] == 1 and bestedge[b] != -1:
+                    d = slack(bestedge[b]) // 2
+                    if delta_type == -1 or d < delta:
+                        delta = d
+                        delta_type = 3
+                        delta_edge = bestedge[b]
+
+            for b in range(nbr_of_vertex, 2 * nbr_of_vertex):
+                if (blossombase[b] >= 0 and blossomparent[b] == -1 and label[b] == 2
+                        and (delta_type == -1 or dualvar[b] < delta)):
+                    delta = dualvar[b]
+                    delta_type = 4
+                    delta_blossom = b
+
+            if delta_type == -1:
+                # Plus aucune amélioration possible en cardinalité maximum
+                delta_type = 1
+                delta = max(0, min(dualvar[:nbr_of_vertex]))
+
+            for v in range(nbr_of_vertex):
+                if label[inblossom[v]] == 1:
+                    dualvar[v] -= delta
+                elif label[inblossom[v]] == 2:
+                    dualvar[v] += delta
+            for b in range(nbr_of_vertex, 2 * nbr_of_vertex):
+                if blossombase[b] >= 0 and blossomparent[b] == -1:
+                    if label[b] == 1:
+                        dualvar[b] += delta
+                    elif label[b] == 2:
+                        dualvar[b] -= delta
+
+            if delta_type == 1:
+                break
+            elif delta_type == 2:
+                allowedge[delta_edge] = True
+                i, j, _ = edges[delta_edge]
+                if label[inblossom[i]] == 0:
+                    i, j = j, i
+                queue.append(i)
+            elif delta_type == 3:
+                allowedge[delta_edge] = True
+                i, j, _ = edges[delta_edge]
+                queue.append(i)
+            else:
+                expand_blossom(delta_blossom, False)
+
+        if not augmented:
+            break
+
+        # Fin d'étape : les fleurs S de variable duale nulle sont défaites
+        for b in range(nbr_of_vertex, 2 * nbr_of_vertex):
+            if blossomparent[b] == -1 and blossombase[b] >= 0 and label[b] == 1 and dualvar[b] == 0:
+                expand_blossom(b, True)
+
+    return [endpoint[mate[v]] if mate[v] >= 0 else -1 for v in range(nbr_of_vertex)]
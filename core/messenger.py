@@ -3,6 +3,7 @@ from __future__ import annotations
 from functools import partial
 from typing import Callable, List, Dict, Any
 
+from core import event_profiler
 from data import config
 
 
@@ -15,12 +16,19 @@ class Messenger:
     n'est plus disponible à l'utilisation).
     Certains événements peuvent être acceptés sans enregistrement, mais ne seront alors plus disponible après le
     prochain appel à Messenger.ignore_all().
+    Les noms générés pour l'écran en cours (joueurs, tournois, tours, matchs) sont temporaires : ils sont retirés avec
+    les événements disponibles par Messenger.ignore_all(), le registre des noms ne grandit pas d'un écran à l'autre.
+    Si un profiler est attribué au messenger (voir core/event_profiler.py), chaque événement exécuté est mesuré.
     """
     def __init__(self) -> None:
         self.ori_event_dict = dict()
+        # Noms des événements enregistrés, conservés pendant toute la durée de l'application
         self.event_str_dict = dict()
+        # Noms temporaires de l'écran en cours, dans leur ordre de création
+        self.temp_event_str_dict = dict()
         self.in_use_event_dict = dict()
-        self.allowed_event = list()
+        self.allowed_event = set()
+        self.profiler: event_profiler.EventProfiler | None = None
 
     def register_call_event(self,
                             event: config.AppInput | str,
@@ -38,7 +46,7 @@ class Messenger:
                      event_arg: List | None = None,
                      call_event: List | bool = False) -> None:
         """Accepte les événements et les rend disponibles à l'utilisation. """
-        self.allowed_event.append(event)
+        self.allowed_event.add(event)
 
         if not call_event:
             call_event = self.ori_event_dict.get(event)
@@ -60,24 +68,28 @@ class Messenger:
         Retire un événement de la liste des événements disponibles, sans distinction entre les événements enregistrés
         ou anonymes
         """
-        if event not in self.allowed_event:
-            return
-        self.allowed_event.remove(event)
+        self.allowed_event.discard(event)
 
     def ignore_all(self, keep: List | None = None) -> None:
         """
-        Reset la liste des événements disponibles, si une liste d'événements est précisée ceux-ci restent disponible
+        Reset la liste des événements disponibles et les noms temporaires, si une liste d'événements est précisée
+        ceux-ci restent disponible
         """
         if keep is None:
             self.allowed_event.clear()
             self.in_use_event_dict.clear()
+            self.temp_event_str_dict.clear()
             return
-        [self.ignore_event(to_ignore_event) for to_ignore_event in self.allowed_event if to_ignore_event not in keep]
+        self.allowed_event.intersection_update(keep)
+        self.temp_event_str_dict = {event_str: event for event_str, event in self.temp_event_str_dict.items()
+                                    if event_str in self.allowed_event}
 
     def get_allowed_event_and_str(self) -> Dict:
         """ Retourne un dict de type {nom_de_levenement : evenement, ...} pour tout événement disponible étant nommé"""
-        return {event_str: event for event_str, event in self.event_str_dict.items() if
-                (event in self.allowed_event or event_str in self.allowed_event)}
+        return {event_str: event
+                for event_str_dict in (self.event_str_dict, self.temp_event_str_dict)
+                for event_str, event in event_str_dict.items()
+                if event in self.allowed_event or event_str in self.allowed_event}
 
     def update_event(self,
                      event: config.AppInput | str,
@@ -98,7 +110,7 @@ class Messenger:
             to_update_event[1] = new_func_arg
 
         if new_str is not None:
-            self.event_str_dict[new_str] = new_str
+            self.temp_event_str_dict[new_str] = new_str
 
         if not make_copy:
             # Si l'utilisateur met à jour un événement sans demander une copie, on met à jour
@@ -133,7 +145,7 @@ class Messenger:
         event_call = self.generate_event_call(event)
         if not event_call:
             return
-        event_call()
+        self._call_event(event, event_call)
 
     def send_event(self,
                    event: config.AppInput,
@@ -145,4 +157,14 @@ class Messenger:
         to_return_event = self.generate_event_call(event)
         if not to_return_event:
             return
-        return to_return_event(*event_args)
+        return self._call_event(event, to_return_event, *event_args)
+
+    def _call_event(self,
+                    event: config.AppInput | str,
+                    event_call: Callable,
+                    *event_args) -> Any:
+        """Exécute la fonction générée d'un événement, mesurée par le profiler s'il y en a un"""
+        if self.profiler is None:
+            return event_call(*event_args)
+        event_key = event_profiler.get_event_key(event, self.in_use_event_dict[event][0])
+        return self.profiler.profile_call(event_key, event_call, *event_args)
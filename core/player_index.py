@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Tuple
+
+# Caractère de séparation des champs de la clé de tri, inférieur à tout caractère d'un nom ou d'un INE : la
+# comparaison des clés donne le même ordre qu'une comparaison (nom, prénom, INE).
+KEY_SEPARATOR = '\x01'
+
+
+def get_player_index_key(player_data: Dict) -> str:
+    """
+    Reçoit les données d'un joueur et retourne sa clé de tri alphabétique (nom, prénom, INE)
+    """
+    return KEY_SEPARATOR.join([player_data['last_name'].upper(),
+                               player_data['first_name'].upper(),
+                               player_data['ine'].upper()])
+
+
+def get_player_cursor(player_data: Dict) -> Tuple[str, int]:
+    """
+    Reçoit les données d'un joueur et retourne sa position dans l'index alphabétique, utilisée comme curseur de page
+    """
+    return get_player_index_key(player_data), player_data['player_id']
+
+
+class PlayerNameIndex:
+    """
+    Index trié des joueurs sur (nom, prénom, INE, id), permet de récupérer une page de joueurs à partir d'un curseur
+    sans charger ni trier l'intégralité de la base de donnée.
+    """
+
+    def __init__(self, entries: List | None = None) -> None:
+        if entries is None:
+            entries = list()
+        self.entries: List[Tuple[str, int]] = [(index_key, player_id) for index_key, player_id in entries]
+
+    @classmethod
+    def from_player_data_list(cls, player_data_list: List[Dict]) -> PlayerNameIndex:
+        return cls(sorted(get_player_cursor(player_data) for player_data in player_data_list))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, player_data: Dict) -> None:
+        insort(self.entries, get_player_cursor(player_data))
+
+    def get_page(self, cursor: Tuple | None, nbr_of_entry: int, backward: bool = False) -> List[int]:
+        """
+        Retourne les ids des 'nbr_of_entry' joueurs suivant le curseur (ou le précédant si 'backward'), dans l'ordre
+        alphabétique. Sans curseur, la page commence au premier joueur (ou finit au dernier).
+        """
+        if backward:
+            page_end = len(self.entries) if cursor is None else bisect_left(self.entries, tuple(cursor))
+            page_start = max(0, page_end - nbr_of_entry)
+        else:
+            page_start = 0 if cursor is None else bisect_right(self.entries, tuple(cursor))
+            page_end = page_start + nbr_of_entry
+        return [player_id for _, player_id in self.entries[page_start:page_end]]
+
+    def to_save_data(self) -> List:
+        return [list(entry) for entry in self.entries]
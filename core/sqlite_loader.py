@@ -0,0 +1,443 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+from data import config
+from core import identity_map, player_index, tournament_index
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS "player" (
+    "player_id" INTEGER PRIMARY KEY,
+    "first_name" TEXT NOT NULL,
+    "last_name" TEXT NOT NULL,
+    "birthday" TEXT,
+    "ine" TEXT,
+    "alphab_key" TEXT NOT NULL,
+    "extra_data" TEXT
+);
+CREATE INDEX IF NOT EXISTS "player_by_alphab_key" ON "player" ("alphab_key", "player_id");
+
+CREATE TABLE IF NOT EXISTS "tournament" (
+    "tournament_id" INTEGER PRIMARY KEY,
+    "name" TEXT NOT NULL,
+    "place" TEXT,
+    "turn_nbr" INTEGER,
+    "description" TEXT,
+    "player_nbr" INTEGER,
+    "start_date" TEXT,
+    "end_date" TEXT,
+    "extra_data" TEXT
+);
+CREATE TABLE IF NOT EXISTS "tournament_summary" (
+    "tournament_id" INTEGER PRIMARY KEY REFERENCES "tournament" ("tournament_id") ON DELETE CASCADE,
+    "name" TEXT NOT NULL,
+    "place" TEXT,
+    "start_date" TEXT,
+    "end_date" TEXT,
+    "turn_nbr" INTEGER,
+    "current_turn_nbr" INTEGER,
+    "is_finished" INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "tournament_summary_by_status" ON "tournament_summary" ("is_finished", "tournament_id");
+CREATE TABLE IF NOT EXISTS "tournament_player" (
+    "owner_id" INTEGER NOT NULL REFERENCES "tournament" ("tournament_id") ON DELETE CASCADE,
+    "position" INTEGER NOT NULL,
+    "item_id" INTEGER NOT NULL,
+    PRIMARY KEY ("owner_id", "position")
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS "tournament_by_player" ON "tournament_player" ("item_id");
+CREATE TABLE IF NOT EXISTS "tournament_turn" (
+    "owner_id" INTEGER NOT NULL REFERENCES "tournament" ("tournament_id") ON DELETE CASCADE,
+    "position" INTEGER NOT NULL,
+    "item_id" INTEGER NOT NULL,
+    PRIMARY KEY ("owner_id", "position")
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS "turn" (
+    "turn_id" INTEGER PRIMARY KEY,
+    "name" TEXT NOT NULL,
+    "start_time" TEXT,
+    "end_time" TEXT,
+    "extra_data" TEXT
+);
+CREATE TABLE IF NOT EXISTS "turn_match" (
+    "owner_id" INTEGER NOT NULL REFERENCES "turn" ("turn_id") ON DELETE CASCADE,
+    "position" INTEGER NOT NULL,
+    "item_id" INTEGER NOT NULL,
+    PRIMARY KEY ("owner_id", "position")
+) WITHOUT ROWID;
+
+-- Les scores n'ont volontairement pas de type : sqlite conserve alors 1 et 1.0 tels quels, comme le fait le json.
+CREATE TABLE IF NOT EXISTS "match" (
+    "match_id" INTEGER PRIMARY KEY,
+    "player_1" INTEGER NOT NULL,
+    "player_1_score",
+    "player_2" INTEGER NOT NULL,
+    "player_2_score",
+    "winner" INTEGER,
+    "extra_data" TEXT
+);
+CREATE INDEX IF NOT EXISTS "match_by_player_1" ON "match" ("player_1");
+CREATE INDEX IF NOT EXISTS "match_by_player_2" ON "match" ("player_2");
+"""
+
+# Pour chaque base : (clé de l'id, colonnes de la table, {clé contenant une liste d'id : table de liaison})
+# Les clés des données reçues qui ne sont pas décrites ici sont conservées en json dans la colonne 'extra_data'.
+TABLE_DESCRIPTION: Dict = {
+    config.PLAYER_DB_NAME: ('player_id', ['first_name', 'last_name', 'birthday', 'ine', 'alphab_key'], {}),
+    config.TOURNAMENT_DB_NAME: ('tournament_id',
+                                ['name', 'place', 'turn_nbr', 'description', 'player_nbr', 'start_date', 'end_date'],
+                                {'players': 'tournament_player', 'turn_list': 'tournament_turn'}),
+    config.TURN_DB_NAME: ('turn_id', ['name', 'start_time', 'end_time'], {'match_list': 'turn_match'}),
+    config.MATCH_DB_NAME: ('match_id', ['player_1', 'player_1_score', 'player_2', 'player_2_score', 'winner'], {}),
+}
+
+SUMMARY_COLUMNS = ['tournament_id', 'name', 'place', 'start_date', 'end_date', 'turn_nbr', 'current_turn_nbr']
+
+# Colonnes calculées par le loader lors de la sauvegarde, elles ne sont pas retournées au chargement
+COMPUTED_COLUMNS = {'alphab_key'}
+
+# sqlite limite le nombre de paramètres d'une requête, les listes d'id sont donc découpées en paquets
+SQL_ID_CHUNK_SIZE = 500
+
+
+def _get_chunks(id_list: List) -> Iterator[List]:
+    for chunk_start in range(0, len(id_list), SQL_ID_CHUNK_SIZE):
+        yield id_list[chunk_start:chunk_start + SQL_ID_CHUNK_SIZE]
+
+
+def get_file_path() -> str:
+    """
+    Construit le path complet du fichier de base de donnée sqlite
+    """
+    return os.path.join(os.getcwd(), config.SAVE_DIRECTORY, f"{config.SQLITE_FILE_NAME}.sqlite3")
+
+
+class SQLiteLoader:
+    def __init__(self):
+        """
+        Loader alternatif de l'application, reprend les noms de méthode de TinyDBLoader en s'appuyant sur sqlite3.
+        Chaque sauvegarde ne modifie que les lignes concernées au lieu de réécrire l'intégralité d'un fichier json.
+        Sélectionné via config.DB_BACKEND.
+        La base n'est ouverte qu'à sa première utilisation, voir connection.
+        """
+        self._connection: sqlite3.Connection | None = None
+        self.unit_of_work_depth = 0
+        self.identity_map = identity_map.IdentityMap()
+        self.modified_db = set()
+        self.nbr_of_write = {db_name: 0 for db_name in TABLE_DESCRIPTION}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Connexion à la base sqlite, ouverte lors de la première utilisation : le répertoire de sauvegarde et le schéma
+        sont créés si nécessaire.
+        """
+        if self._connection is not None:
+            return self._connection
+
+        file_path = get_file_path()
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # isolation_level=None : les transactions sont gérées explicitement par begin() / commit()
+        self._connection = sqlite3.connect(file_path, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('PRAGMA foreign_keys=ON')
+        self._connection.executescript(SCHEMA)
+        self._rebuild_missing_tournament_summary()
+        return self._connection
+
+    def begin(self) -> None:
+        """
+        Ouvre une unité de travail (transaction sqlite). Les unités de travail peuvent être imbriquées, seule la plus
+        externe ouvre et valide la transaction.
+        """
+        if self.unit_of_work_depth == 0:
+            self.connection.execute('BEGIN')
+        self.unit_of_work_depth += 1
+
+    def commit(self) -> None:
+        """
+        Ferme une unité de travail, si c'est la plus externe la transaction est validée.
+        """
+        if self.unit_of_work_depth == 0:
+            return
+        self.unit_of_work_depth -= 1
+        if self.unit_of_work_depth > 0:
+            return
+        self.connection.execute('COMMIT')
+        for db_name in self.modified_db:
+            self.nbr_of_write[db_name] += 1
+        self.modified_db.clear()
+
+    def rollback(self) -> None:
+        """
+        Abandonne l'unité de travail en cours et celles qui l'englobent : la transaction est annulée. Les objets en
+        cache peuvent provenir de l'unité de travail annulée, dont sqlite réattribue les ids : le cache est vidé.
+        """
+        if self.unit_of_work_depth == 0:
+            return
+        self.unit_of_work_depth = 0
+        self.connection.execute('ROLLBACK')
+        self.modified_db.clear()
+        self.identity_map.clear()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[SQLiteLoader]:
+        """
+        Helper context manager autour de begin() / commit(), si le bloc lève une exception la transaction est annulée
+        (voir rollback()) et l'exception est propagée.
+        """
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+
+    def get_nbr_db_entry(self, db_name: str) -> int:
+        """
+        Reçoit le nom d'une base de donnée et retourne le nombre d'entrées qu'elle contient
+        """
+        id_key = TABLE_DESCRIPTION[db_name][0]
+        return self.connection.execute(f'SELECT COUNT("{id_key}") FROM "{db_name}"').fetchone()[0]
+
+    def get_nbr_of_write(self, db_name: str | None = None) -> int:
+        """
+        Retourne le nombre de transactions d'écriture validées pour une base de donnée ou pour l'ensemble des bases
+        si aucun nom n'est précisé
+        """
+        if db_name is not None:
+            return self.nbr_of_write[db_name]
+        return sum(self.nbr_of_write.values())
+
+    def id_exist_in_db(self, db_name: str, entry_id: int) -> bool:
+        """
+        Reçoit le nom d'une base de donnée et l'id d'une entrée, retourne si l'entrée existe ou non en base
+        """
+        id_key = TABLE_DESCRIPTION[db_name][0]
+        cursor = self.connection.execute(f'SELECT 1 FROM "{db_name}" WHERE "{id_key}" = ?', (entry_id,))
+        return cursor.fetchone() is not None
+
+    def _save_linked_id(self, link_table: str, owner_id: int, item_id_list: List) -> None:
+        self.connection.execute(f'DELETE FROM "{link_table}" WHERE "owner_id" = ?', (owner_id,))
+        self.connection.executemany(f'INSERT INTO "{link_table}" ("owner_id", "position", "item_id") VALUES (?, ?, ?)',
+                                    [(owner_id, position, item_id) for position, item_id in enumerate(item_id_list)])
+
+    def _load_linked_id(self, link_table: str, owner_id: int) -> List:
+        cursor = self.connection.execute(f'SELECT "item_id" FROM "{link_table}" WHERE "owner_id" = ? '
+                                         f'ORDER BY "position"', (owner_id,))
+        return [row[0] for row in cursor]
+
+    def upsert_entry(self, db_name: str, entry_data: Dict) -> int:
+        """
+        Reçoit le nom d'une base et les données d'une entrée, met à jour l'entrée si elle existe, sinon l'insère.
+        L'id de l'entrée est inscrit dans les données reçues et retourné, l'objet en cache pour cet id (reçu ou
+        attribué) est invalidé.
+        """
+        id_key, columns, links = TABLE_DESCRIPTION[db_name]
+        self.identity_map.invalidate(db_name, entry_data.get(id_key, -1))
+        extra_data = {key: value for key, value in entry_data.items()
+                      if key != id_key and key not in columns and key not in links}
+        values = [entry_data.get(column) for column in columns]
+        values.append(json.dumps(extra_data) if extra_data else None)
+        all_columns = [*columns, 'extra_data']
+
+        with self.unit_of_work():
+            doc_id = entry_data.get(id_key, -1)
+            if self.id_exist_in_db(db_name, doc_id):
+                assignment = ', '.join(f'"{column}" = ?' for column in all_columns)
+                self.connection.execute(f'UPDATE "{db_name}" SET {assignment} WHERE "{id_key}" = ?', (*values, doc_id))
+            else:
+                column_names = ', '.join(f'"{column}"' for column in all_columns)
+                placeholders = ', '.join('?' for _ in all_columns)
+                cursor = self.connection.execute(f'INSERT INTO "{db_name}" ({column_names}) VALUES ({placeholders})',
+                                                 values)
+                doc_id = cursor.lastrowid
+                self.identity_map.invalidate(db_name, doc_id)
+
+            for list_key, link_table in links.items():
+                self._save_linked_id(link_table, doc_id, entry_data.get(list_key, []))
+            self.modified_db.add(db_name)
+
+        entry_data[id_key] = doc_id
+        return doc_id
+
+    def load_entry(self, db_name: str, entry_id: int) -> Dict | bool:
+        """
+        Reçoit le nom d'une base et l'id d'une entrée, retourne les données de l'entrée ou False si elle n'existe pas
+        """
+        id_key, columns, links = TABLE_DESCRIPTION[db_name]
+        row = self.connection.execute(f'SELECT * FROM "{db_name}" WHERE "{id_key}" = ?', (entry_id,)).fetchone()
+        if row is None:
+            return False
+
+        entry_data = {column: row[column] for column in columns if column not in COMPUTED_COLUMNS}
+        if row['extra_data'] is not None:
+            entry_data.update(json.loads(row['extra_data']))
+        for list_key, link_table in links.items():
+            entry_data[list_key] = self._load_linked_id(link_table, entry_id)
+        entry_data[id_key] = entry_id
+        return entry_data
+
+    def _load_linked_id_by_owner(self, link_table: str, owner_id_list: List) -> Dict[int, List]:
+        linked_id_by_owner = {owner_id: list() for owner_id in owner_id_list}
+        for id_chunk in _get_chunks(owner_id_list):
+            placeholders = ', '.join('?' for _ in id_chunk)
+            cursor = self.connection.execute(f'SELECT "owner_id", "item_id" FROM "{link_table}" '
+                                             f'WHERE "owner_id" IN ({placeholders}) ORDER BY "owner_id", "position"',
+                                             id_chunk)
+            for owner_id, item_id in cursor:
+                linked_id_by_owner[owner_id].append(item_id)
+        return linked_id_by_owner
+
+    def load_entries(self, db_name: str, entry_id_list: List) -> List[Dict]:
+        """
+        Reçoit le nom d'une base et une liste d'id, retourne en une requête par paquet d'ids la liste des données
+        correspondantes dans l'ordre des ids reçus. Les ids inexistants sont ignorés.
+        """
+        id_key, columns, links = TABLE_DESCRIPTION[db_name]
+        entry_by_id = dict()
+        for id_chunk in _get_chunks(entry_id_list):
+            placeholders = ', '.join('?' for _ in id_chunk)
+            cursor = self.connection.execute(f'SELECT * FROM "{db_name}" WHERE "{id_key}" IN ({placeholders})',
+                                             id_chunk)
+            for row in cursor:
+                entry_data = {column: row[column] for column in columns if column not in COMPUTED_COLUMNS}
+                if row['extra_data'] is not None:
+                    entry_data.update(json.loads(row['extra_data']))
+                entry_data[id_key] = row[id_key]
+                entry_by_id[row[id_key]] = entry_data
+
+        for list_key, link_table in links.items():
+            linked_id_by_owner = self._load_linked_id_by_owner(link_table, list(entry_by_id))
+            for entry_id, entry_data in entry_by_id.items():
+                entry_data[list_key] = linked_id_by_owner[entry_id]
+
+        return [dict(entry_by_id[entry_id]) for entry_id in entry_id_list if entry_id in entry_by_id]
+
+    def save_player(self, player_data_dict: Dict) -> int:
+        # Comme avec TinyDB, un joueur est toujours enregistré comme une nouvelle entrée.
+        # La clé de tri alphabétique est calculée ici, upper() de sqlite ne gérant pas les caractères accentués.
+        return self.upsert_entry(config.PLAYER_DB_NAME,
+                                 {**player_data_dict, 'player_id': -1,
+                                  'alphab_key': player_index.get_player_index_key(player_data_dict)})
+
+    def load_player_page(self, cursor: List | None, nbr_of_player: int, backward: bool = False) -> List[Dict]:
+        """
+        Retourne les données des 'nbr_of_player' joueurs suivant le curseur dans l'ordre alphabétique (ou le précédant
+        si 'backward'), par un parcours de l'index "player_by_alphab_key".
+        """
+        condition = ''
+        parameters = list()
+        if cursor is not None:
+            condition = f'WHERE ("alphab_key", "player_id") {"<" if backward else ">"} (?, ?)'
+            parameters.extend(cursor)
+        order = 'DESC' if backward else 'ASC'
+        cursor = self.connection.execute(f'SELECT "player_id" FROM "player" {condition} '
+                                         f'ORDER BY "alphab_key" {order}, "player_id" {order} LIMIT ?',
+                                         (*parameters, nbr_of_player))
+        player_id_list = [row[0] for row in cursor]
+        if backward:
+            player_id_list.reverse()
+        return self.load_players(player_id_list)
+
+    def load_player(self, player_id: int) -> bool | Dict:
+        return self.load_entry(config.PLAYER_DB_NAME, player_id)
+
+    def load_players(self, player_id_list: List) -> List[Dict]:
+        return self.load_entries(config.PLAYER_DB_NAME, player_id_list)
+
+    def player_exist(self, player_id: int) -> bool:
+        return self.id_exist_in_db(config.PLAYER_DB_NAME, player_id)
+
+    def save_tournament(self, tournament_data_dict: Dict) -> int:
+        """
+        Enregistre un tournoi et met à jour son résumé dans la même transaction.
+        """
+        with self.unit_of_work():
+            tournament_id = self.upsert_entry(config.TOURNAMENT_DB_NAME, tournament_data_dict)
+            self._save_tournament_summary(tournament_index.get_tournament_summary(tournament_data_dict))
+        return tournament_id
+
+    def _save_tournament_summary(self, tournament_summary: Dict) -> None:
+        column_names = ', '.join(f'"{column}"' for column in [*SUMMARY_COLUMNS, 'is_finished'])
+        placeholders = ', '.join('?' for _ in range(len(SUMMARY_COLUMNS) + 1))
+        self.connection.execute(f'INSERT OR REPLACE INTO "tournament_summary" ({column_names}) '
+                                f'VALUES ({placeholders})',
+                                [*[tournament_summary[column] for column in SUMMARY_COLUMNS],
+                                 tournament_summary['end_date'] is not None])
+
+    def _rebuild_missing_tournament_summary(self) -> None:
+        """Reconstruit les résumés des tournois enregistrés avant l'ajout de la table des résumés"""
+        cursor = self.connection.execute('SELECT "tournament_id" FROM "tournament" WHERE "tournament_id" NOT IN '
+                                         '(SELECT "tournament_id" FROM "tournament_summary")')
+        missing_id_list = [row[0] for row in cursor]
+        if not missing_id_list:
+            return
+        with self.unit_of_work():
+            for tournament_data in self.load_entries(config.TOURNAMENT_DB_NAME, missing_id_list):
+                self._save_tournament_summary(tournament_index.get_tournament_summary(tournament_data))
+            self.modified_db.add(config.TOURNAMENT_DB_NAME)
+
+    def load_tournament_summaries(self, cursor: List | None, nbr_of_tournament: int,
+                                  backward: bool = False) -> List[Dict]:
+        """
+        Retourne les résumés des 'nbr_of_tournament' tournois suivant le curseur dans la liste des tournois (tournois
+        en cours puis terminés, du plus récent au plus ancien) ou le précédant si 'backward'.
+        """
+        condition = ''
+        parameters = list()
+        if cursor is not None:
+            is_finished, tournament_id = cursor[0], -cursor[1]
+            if backward:
+                condition = 'WHERE "is_finished" < ? OR ("is_finished" = ? AND "tournament_id" > ?)'
+            else:
+                condition = 'WHERE "is_finished" > ? OR ("is_finished" = ? AND "tournament_id" < ?)'
+            parameters.extend([is_finished, is_finished, tournament_id])
+        order = '"is_finished" DESC, "tournament_id" ASC' if backward else '"is_finished" ASC, "tournament_id" DESC'
+        column_names = ', '.join(f'"{column}"' for column in SUMMARY_COLUMNS)
+        rows = self.connection.execute(f'SELECT {column_names} FROM "tournament_summary" {condition} '
+                                       f'ORDER BY {order} LIMIT ?', (*parameters, nbr_of_tournament)).fetchall()
+        if backward:
+            rows.reverse()
+        return [{column: row[column] for column in SUMMARY_COLUMNS} for row in rows]
+
+    def load_tournament_data(self, tournament_id: int) -> Dict | bool:
+        return self.load_entry(config.TOURNAMENT_DB_NAME, tournament_id)
+
+    def tournament_exist(self, tournament_id: int) -> bool:
+        return self.id_exist_in_db(config.TOURNAMENT_DB_NAME, tournament_id)
+
+    def save_match(self, match_data: Dict) -> int:
+        return self.upsert_entry(config.MATCH_DB_NAME, match_data)
+
+    def load_match(self, match_id: int) -> Dict | bool:
+        match_data = self.load_entry(config.MATCH_DB_NAME, match_id)
+        # sqlite enregistre le booléen d'un match nul (winner = False) comme 0
+        if match_data and match_data['winner'] == 0:
+            match_data['winner'] = False
+        return match_data
+
+    def load_matches(self, match_id_list: List) -> List[Dict]:
+        match_data_list = self.load_entries(config.MATCH_DB_NAME, match_id_list)
+        for match_data in match_data_list:
+            if match_data['winner'] == 0:
+                match_data['winner'] = False
+        return match_data_list
+
+    def save_turn(self, turn_data: Dict) -> int:
+        return self.upsert_entry(config.TURN_DB_NAME, turn_data)
+
+    def load_turn(self, turn_id: int) -> Dict | bool:
+        return self.load_entry(config.TURN_DB_NAME, turn_id)
+
+    def load_turns(self, turn_id_list: List) -> List[Dict]:
+        return self.load_entries(config.TURN_DB_NAME, turn_id_list)
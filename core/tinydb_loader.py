@@ -1,27 +1,79 @@
 from __future__ import annotations
 
 import os
-from typing import Dict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
 
 from tinydb import TinyDB
+from tinydb.table import Document, Table
+from tinydb.middlewares import Middleware
+from tinydb.storages import JSONStorage
 from data import config
+from core import identity_map, player_index, tournament_index
 
 FILES_NAME = [config.PLAYER_DB_NAME, config.TOURNAMENT_DB_NAME, config.TURN_DB_NAME, config.MATCH_DB_NAME]
 
-save_directory = config.SAVE_DIRECTORY
-full_save_path = os.path.join(os.getcwd(), save_directory)
+# Table de la base des joueurs contenant l'index alphabétique des joueurs (un unique document)
+PLAYER_INDEX_TABLE_NAME = 'alphab_index'
+PLAYER_INDEX_DOC_ID = 1
+# Table de la base des tournois contenant le résumé de chaque tournoi (id du document = id du tournoi)
+TOURNAMENT_SUMMARY_TABLE_NAME = 'summary'
 
 
 def get_file_path_from_name(file_name: str) -> str:
     """
-    Construit un path complet à partir du nom de fichier fournit
+    Construit un path complet à partir du nom de fichier fournit, relatif au répertoire courant lors de l'appel
     """
-    return os.path.join(full_save_path, f"{file_name}.json")
+    return os.path.join(os.getcwd(), config.SAVE_DIRECTORY, f"{file_name}.json")
 
 
-# Si le répertoire de sauvegarde n'existe pas, on le crée directement
-if not os.path.exists(full_save_path):
-    os.mkdir(full_save_path)
+class UnitOfWorkMiddleware(Middleware):
+    """
+    Middleware TinyDB conservant en mémoire l'état de la base de donnée.
+    Hors unité de travail, chaque écriture est immédiatement répercutée sur le fichier. Pendant une unité de travail,
+    les écritures sont conservées en mémoire et le fichier n'est réécrit qu'une seule fois, lors du flush.
+    """
+
+    def __init__(self, storage_cls=JSONStorage) -> None:
+        super().__init__(storage_cls)
+        self.cache = None
+        self.buffering = False
+        self.pending_write = False
+        self.nbr_of_write = 0
+
+    def read(self):
+        if self.cache is None:
+            self.cache = self.storage.read()
+        return self.cache
+
+    def write(self, data) -> None:
+        self.cache = data
+        if self.buffering:
+            self.pending_write = True
+            return
+        self._write_storage(data)
+
+    def _write_storage(self, data) -> None:
+        self.nbr_of_write += 1
+        self.storage.write(data)
+
+    def flush(self) -> None:
+        """Écrit les données en attente sur le fichier et repasse en écriture immédiate"""
+        self.buffering = False
+        if not self.pending_write:
+            return
+        self._write_storage(self.cache)
+        self.pending_write = False
+
+    def rollback(self) -> None:
+        """Abandonne les écritures en attente, les données seront relues depuis le fichier à la prochaine lecture"""
+        self.cache = None
+        self.pending_write = False
+        self.buffering = False
+
+    def close(self) -> None:
+        self.flush()
+        self.storage.close()
 
 
 class TinyDBLoader:
@@ -31,20 +83,108 @@ class TinyDBLoader:
         des objets dans les bases.
         Repose sur TinyDB,peut être remplacer par un autre module reprenant les mêmes noms de méthode sans modifier
         d'autres fichiers de l'application.
+        Les bases de données ne sont ouvertes qu'à leur première utilisation, voir get_db_handle().
+        """
+        self.db_dict: Dict[str, TinyDB] = dict()
+        # Tables ouvertes de chaque base, par (nom de la base, nom de la table), voir get_table()
+        self.table_dict: Dict[Tuple[str, str], Table] = dict()
+        # Prochain id de la table par défaut de chaque base, voir _reserve_doc_id()
+        self.next_id_by_db: Dict[str, int] = dict()
+        self.unit_of_work_depth = 0
+        self.identity_map = identity_map.IdentityMap()
+        self.player_name_index: player_index.PlayerNameIndex | None = None
+        self.tournament_summary_index: tournament_index.TournamentSummaryIndex | None = None
+
+    def begin(self) -> None:
+        """
+        Ouvre une unité de travail : jusqu'au commit correspondant, les insertions et mises à jour sont conservées en
+        mémoire. Les unités de travail peuvent être imbriquées, seul le commit de la plus externe écrit les fichiers.
+        """
+        self.unit_of_work_depth += 1
+        for working_database in self.db_dict.values():
+            working_database.storage.buffering = True
+
+    def commit(self) -> None:
+        """
+        Ferme une unité de travail, si c'est la plus externe chaque fichier modifié est réécrit une seule fois.
+        """
+        if self.unit_of_work_depth == 0:
+            return
+        self.unit_of_work_depth -= 1
+        if self.unit_of_work_depth > 0:
+            return
+        for working_database in self.db_dict.values():
+            working_database.storage.flush()
+
+    def rollback(self) -> None:
+        """
+        Abandonne l'unité de travail en cours et celles qui l'englobent : les écritures en attente ne sont pas écrites,
+        les bases et les index sont relus depuis les fichiers au prochain accès. Les objets en cache peuvent provenir
+        de l'unité de travail annulée : le cache est vidé.
         """
-        db_dict = {db_name: TinyDB(get_file_path_from_name(db_name), sort_keys=True, indent=4, separators=(',', ': '))
-                   for db_name in FILES_NAME}
-        self.db_dict = db_dict
+        self.unit_of_work_depth = 0
+        for working_database in self.db_dict.values():
+            working_database.storage.rollback()
+        for working_table in self.table_dict.values():
+            working_table.clear_cache()
+        # Les ids réservés pendant l'unité de travail sont de nouveau disponibles
+        self.next_id_by_db.clear()
+        self.player_name_index = None
+        self.tournament_summary_index = None
+        self.identity_map.clear()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[TinyDBLoader]:
+        """
+        Helper context manager autour de begin() / commit() :
+            with loader.unit_of_work():
+                loader.save_match(...)
+                loader.save_turn(...)
+        Si le bloc lève une exception, rien n'est écrit (voir rollback()) et l'exception est propagée.
+        """
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
 
     def get_db_handle(self, db_file: str) -> TinyDB:
         """
-        Reçoit le nom d'un fichier de base de donnée et retourne un objet TinyDB chargé
+        Reçoit le nom d'un fichier de base de donnée et retourne un objet TinyDB chargé.
+        La base est ouverte lors du premier appel (le répertoire de sauvegarde est créé si nécessaire), son contenu
+        n'est lu qu'à la première lecture.
         """
         working_database = self.db_dict.get(db_file, None)
-        if working_database is None:
+        if working_database is not None:
+            return working_database
+        if db_file not in FILES_NAME:
             print(f"Something went wrong while loading db {db_file}")
+            return working_database
+
+        working_database = TinyDB(get_file_path_from_name(db_file), create_dirs=True,
+                                  storage=UnitOfWorkMiddleware(JSONStorage),
+                                  sort_keys=True, indent=4, separators=(',', ': '))
+        # Une base ouverte pendant une unité de travail en fait partie
+        working_database.storage.buffering = self.unit_of_work_depth > 0
+        self.db_dict[db_file] = working_database
+        self.get_table(db_file)
         return working_database
 
+    def get_table(self, db_name: str, table_name: str | None = None) -> Table:
+        """
+        Reçoit le nom d'une base de donnée et retourne l'une de ses tables, la table par défaut si aucun nom n'est
+        précisé. Les tables ouvertes sont conservées par le loader pour vider leur cache lors d'un rollback().
+        """
+        working_database = self.get_db_handle(db_name)
+        if table_name is None:
+            table_name = working_database.default_table_name
+        working_table = self.table_dict.get((db_name, table_name))
+        if working_table is None:
+            working_table = self.table_dict[(db_name, table_name)] = working_database.table(table_name)
+        return working_table
+
     def get_nbr_db_entry(self, db_name: str) -> int:
         """
         Reçoit le nom d'un fichier de base de donnée et retourne le nombre d'entrées qu'il contient
@@ -52,6 +192,16 @@ class TinyDBLoader:
         working_database = self.get_db_handle(db_name)
         return len(working_database)
 
+    def get_nbr_of_write(self, db_name: str | None = None) -> int:
+        """
+        Retourne le nombre d'écritures de fichier réalisées depuis l'ouverture du loader, pour une base de donnée
+        ou pour l'ensemble des bases si aucun nom n'est précisé
+        """
+        if db_name is not None:
+            working_database = self.db_dict.get(db_name)
+            return 0 if working_database is None else working_database.storage.nbr_of_write
+        return sum(working_database.storage.nbr_of_write for working_database in self.db_dict.values())
+
     def id_exist_in_db(self, working_db: TinyDB, entry_id: int) -> bool:
         """
         Reçoit un objet de base de donnée et l'id d'une entrée, retourne si l'entrée existe ou non en base
@@ -59,11 +209,103 @@ class TinyDBLoader:
         working_database = working_db
         return working_database.contains(doc_id=entry_id)
 
+    def _read_raw_table(self, working_db: TinyDB) -> Dict:
+        """
+        Reçoit un objet de base de donnée et retourne la table brute {id (str) : données, ...} lue depuis le cache
+        """
+        tables = working_db.storage.read() or dict()
+        return tables.get(working_db.default_table_name, dict())
+
+    def load_entries(self, db_name: str, entry_id_list: List, id_key: str) -> List[Dict]:
+        """
+        Reçoit le nom d'une base, une liste d'id et le nom de la clé d'id, retourne en une seule lecture de la table
+        la liste des données correspondantes dans l'ordre des ids reçus. Les ids inexistants sont ignorés.
+        """
+        raw_table = self._read_raw_table(self.get_db_handle(db_name))
+        entries = list()
+        for entry_id in entry_id_list:
+            raw_entry = raw_table.get(str(entry_id))
+            if raw_entry is None:
+                continue
+            entries.append({**raw_entry, id_key: entry_id})
+        return entries
+
+    def _reserve_doc_id(self, db_name: str) -> int:
+        """
+        Réserve l'id de la prochaine entrée de la table par défaut d'une base sans écrire dans le fichier. Le prochain
+        id est calculé depuis le cache lors de la première réservation, puis tenu à jour par le loader.
+        """
+        doc_id = self.next_id_by_db.get(db_name)
+        if doc_id is None:
+            raw_table = self._read_raw_table(self.get_db_handle(db_name))
+            doc_id = max((int(entry_id) for entry_id in raw_table), default=0) + 1
+        self.next_id_by_db[db_name] = doc_id + 1
+        return doc_id
+
+    def upsert_entry(self, db_name: str, entry_data: Dict, id_key: str) -> int:
+        """
+        Reçoit le nom d'une base, les données d'une entrée et le nom de la clé contenant son id.
+        Met à jour l'entrée si elle existe, sinon réserve un id, l'inscrit dans les données et insère l'entrée.
+        Dans les deux cas, une seule écriture est réalisée et l'objet en cache pour cet id (reçu ou réservé) est
+        invalidé.
+        """
+        working_database = self.get_db_handle(db_name)
+        doc_id = entry_data.get(id_key, -1)
+        self.identity_map.invalidate(db_name, doc_id)
+        if self.id_exist_in_db(working_database, doc_id):
+            working_database.update(entry_data, doc_ids=[doc_id])
+            return doc_id
+
+        doc_id = self._reserve_doc_id(db_name)
+        self.identity_map.invalidate(db_name, doc_id)
+        entry_data[id_key] = doc_id
+        self.get_table(db_name).insert(Document(entry_data, doc_id=doc_id))
+        return doc_id
+
     def save_player(self, player_data_dict: Dict) -> int:
-        working_database = self.get_db_handle(config.PLAYER_DB_NAME)
-        doc_id = working_database.insert(player_data_dict)
+        """
+        Enregistre un nouveau joueur et l'ajoute à l'index alphabétique, le tout en une seule écriture du fichier.
+        """
+        with self.unit_of_work():
+            name_index = self.get_player_name_index()
+            doc_id = self._reserve_doc_id(config.PLAYER_DB_NAME)
+            self.get_table(config.PLAYER_DB_NAME).insert(Document(player_data_dict, doc_id=doc_id))
+            name_index.add({**player_data_dict, 'player_id': doc_id})
+            self._save_player_name_index(name_index)
         return doc_id
 
+    def _save_player_name_index(self, name_index: player_index.PlayerNameIndex) -> None:
+        index_table = self.get_table(config.PLAYER_DB_NAME, PLAYER_INDEX_TABLE_NAME)
+        index_table.upsert(Document({'entries': name_index.to_save_data()}, doc_id=PLAYER_INDEX_DOC_ID))
+
+    def get_player_name_index(self) -> player_index.PlayerNameIndex:
+        """
+        Retourne l'index alphabétique des joueurs, chargé depuis la base des joueurs lors du premier appel.
+        Si l'index enregistré ne correspond pas au nombre de joueurs (base antérieure à l'index), il est reconstruit.
+        """
+        if self.player_name_index is not None:
+            return self.player_name_index
+
+        working_database = self.get_db_handle(config.PLAYER_DB_NAME)
+        index_doc = self.get_table(config.PLAYER_DB_NAME, PLAYER_INDEX_TABLE_NAME).get(doc_id=PLAYER_INDEX_DOC_ID)
+        name_index = player_index.PlayerNameIndex(index_doc['entries'] if index_doc is not None else None)
+
+        if len(name_index) != len(working_database):
+            raw_table = self._read_raw_table(working_database)
+            name_index = player_index.PlayerNameIndex.from_player_data_list(
+                [{**player_data, 'player_id': int(player_id)} for player_id, player_data in raw_table.items()])
+            self._save_player_name_index(name_index)
+
+        self.player_name_index = name_index
+        return name_index
+
+    def load_player_page(self, cursor: List | None, nbr_of_player: int, backward: bool = False) -> List[Dict]:
+        """
+        Retourne les données des 'nbr_of_player' joueurs suivant le curseur dans l'ordre alphabétique (ou le précédant
+        si 'backward'), sans parcourir ni trier l'intégralité de la base de donnée.
+        """
+        return self.load_players(self.get_player_name_index().get_page(cursor, nbr_of_player, backward))
+
     def load_player(self, player_id: int) -> bool | Dict:
         working_database = self.get_db_handle(config.PLAYER_DB_NAME)
         if not self.player_exist(player_id):
@@ -72,31 +314,64 @@ class TinyDBLoader:
         player_data["player_id"] = player_id
         return player_data
 
+    def load_players(self, player_id_list: List) -> List[Dict]:
+        return self.load_entries(config.PLAYER_DB_NAME, player_id_list, 'player_id')
+
     def player_exist(self, player_id: int) -> bool:
         working_database = self.get_db_handle(config.PLAYER_DB_NAME)
         return self.id_exist_in_db(working_database, player_id)
 
     def save_tournament(self, tournament_data_dict: Dict) -> int:
-        tournament_index = tournament_data_dict.get('tournament_id', -1)
-
-        if tournament_index == -1:
-            doc_id = self._insert_tournament(tournament_data_dict)
-            tournament_data_dict['tournament_id'] = doc_id
-
-        doc_id = self._update_tournament(tournament_data_dict)
+        """
+        Enregistre un tournoi et met à jour son résumé, le tout en une seule écriture du fichier.
+        """
+        with self.unit_of_work():
+            summary_index = self.get_tournament_summary_index()
+            doc_id = self.upsert_entry(config.TOURNAMENT_DB_NAME, tournament_data_dict, 'tournament_id')
+            tournament_summary = tournament_index.get_tournament_summary(tournament_data_dict)
+            summary_index.update(tournament_summary)
+            self._save_tournament_summary(tournament_summary)
         return doc_id
 
-    def _insert_tournament(self, tournament_dict: Dict) -> int:
-        working_database = self.get_db_handle(config.TOURNAMENT_DB_NAME)
-        doc_id = working_database.insert(tournament_dict)
-        return doc_id
+    def _save_tournament_summary(self, tournament_summary: Dict) -> None:
+        summary_table = self.get_table(config.TOURNAMENT_DB_NAME, TOURNAMENT_SUMMARY_TABLE_NAME)
+        summary_table.upsert(Document(tournament_summary, doc_id=tournament_summary['tournament_id']))
 
-    def _update_tournament(self, tournament_dict: Dict) -> int:
-        working_database = self.get_db_handle(config.TOURNAMENT_DB_NAME)
-        doc_id = tournament_dict.get('tournament_id')
+    def get_tournament_summary_index(self) -> tournament_index.TournamentSummaryIndex:
+        """
+        Retourne l'index des résumés de tournois, chargé depuis la base des tournois lors du premier appel.
+        Si des résumés manquent (base antérieure aux résumés), ils sont reconstruits.
+        """
+        if self.tournament_summary_index is not None:
+            return self.tournament_summary_index
 
-        working_database.update(tournament_dict, doc_ids=[doc_id])  # , tournament.doc_id == doc_id)
-        return doc_id
+        working_database = self.get_db_handle(config.TOURNAMENT_DB_NAME)
+        summary_table = self.get_table(config.TOURNAMENT_DB_NAME, TOURNAMENT_SUMMARY_TABLE_NAME)
+        summary_index = tournament_index.TournamentSummaryIndex(summary_table.all())
+
+        if len(summary_index) != len(working_database):
+            missing_summary_list = list()
+            for tournament_id, tournament_data in self._read_raw_table(working_database).items():
+                if int(tournament_id) in summary_index.summary_by_id:
+                    continue
+                tournament_summary = tournament_index.get_tournament_summary(
+                    {**tournament_data, 'tournament_id': int(tournament_id)})
+                summary_index.update(tournament_summary)
+                missing_summary_list.append(Document(tournament_summary, doc_id=int(tournament_id)))
+            # Les résumés manquants sont insérés en une seule écriture
+            if missing_summary_list:
+                summary_table.insert_multiple(missing_summary_list)
+
+        self.tournament_summary_index = summary_index
+        return summary_index
+
+    def load_tournament_summaries(self, cursor: List | None, nbr_of_tournament: int,
+                                  backward: bool = False) -> List[Dict]:
+        """
+        Retourne les résumés des 'nbr_of_tournament' tournois suivant le curseur dans la liste des tournois (ou le
+        précédant si 'backward'), sans charger les documents des tournois.
+        """
+        return self.get_tournament_summary_index().get_page(cursor, nbr_of_tournament, backward)
 
     def load_tournament_data(self, tournament_id: int) -> Dict | bool:
         working_database = self.get_db_handle(config.TOURNAMENT_DB_NAME)
@@ -110,26 +385,8 @@ class TinyDBLoader:
         working_database = self.get_db_handle(config.TOURNAMENT_DB_NAME)
         return self.id_exist_in_db(working_database, tournament_id)
 
-    def _insert_match(self, match_data: Dict) -> int:
-        working_database = self.get_db_handle(config.MATCH_DB_NAME)
-        doc_id = working_database.insert(match_data)
-        return doc_id
-
-    def _update_match(self, match_data: Dict) -> int:
-        working_database = self.get_db_handle(config.MATCH_DB_NAME)
-        doc_id = match_data.get('match_id')
-
-        working_database.update(match_data, doc_ids=[doc_id])
-        return doc_id
-
     def save_match(self, match_data: Dict) -> int:
-        working_database = self.get_db_handle(config.MATCH_DB_NAME)
-        if not self.id_exist_in_db(working_database, match_data.get('match_id', -1)):
-            doc_id = self._insert_match(match_data)
-            match_data['match_id'] = doc_id
-
-        doc_id = self._update_match(match_data)
-        return doc_id
+        return self.upsert_entry(config.MATCH_DB_NAME, match_data, 'match_id')
 
     def load_match(self, match_id: int) -> Dict | bool:
         working_database = self.get_db_handle(config.MATCH_DB_NAME)
@@ -139,17 +396,8 @@ class TinyDBLoader:
         match_data["match_id"] = match_id
         return match_data
 
-    def _insert_turn(self, turn_data: Dict) -> int:
-        working_database = self.get_db_handle(config.TURN_DB_NAME)
-        doc_id = working_database.insert(turn_data)
-        return doc_id
-
-    def _update_turn(self, turn_data: Dict) -> int:
-        working_database = self.get_db_handle(config.TURN_DB_NAME)
-        doc_id = turn_data.get('turn_id')
-
-        working_database.update(turn_data, doc_ids=[doc_id])  # , tournament.doc_id == doc_id)
-        return doc_id
+    def load_matches(self, match_id_list: List) -> List[Dict]:
+        return self.load_entries(config.MATCH_DB_NAME, match_id_list, 'match_id')
 
     def load_turn(self, turn_id: int) -> Dict | bool:
         working_database = self.get_db_handle(config.TURN_DB_NAME)
@@ -160,10 +408,7 @@ class TinyDBLoader:
         return turn_data
 
     def save_turn(self, turn_data: Dict) -> int:
-        working_database = self.get_db_handle(config.TURN_DB_NAME)
-        if not self.id_exist_in_db(working_database, turn_data.get('turn_id', -1)):
-            doc_id = self._insert_turn(turn_data)
-            turn_data['turn_id'] = doc_id
+        return self.upsert_entry(config.TURN_DB_NAME, turn_data, 'turn_id')
 
-        doc_id = self._update_turn(turn_data)
-        return doc_id
+    def load_turns(self, turn_id_list: List) -> List[Dict]:
+        return self.load_entries(config.TURN_DB_NAME, turn_id_list, 'turn_id')
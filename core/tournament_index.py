@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Tuple
+
+
+def get_tournament_summary(tournament_data: Dict) -> Dict:
+    """
+    Reçoit les données d'un tournoi et retourne son résumé : les seules informations nécessaires à la liste des
+    tournois.
+    """
+    return {'tournament_id': tournament_data['tournament_id'],
+            'name': tournament_data['name'],
+            'place': tournament_data['place'],
+            'start_date': tournament_data['start_date'],
+            'end_date': tournament_data['end_date'],
+            'turn_nbr': tournament_data['turn_nbr'],
+            'current_turn_nbr': len(tournament_data['turn_list'])}
+
+
+def get_summary_cursor(tournament_summary: Dict) -> Tuple[int, int]:
+    """
+    Retourne la position d'un résumé dans la liste des tournois : tournois en cours puis terminés, du plus récent au
+    plus ancien. Utilisée comme curseur de page.
+    """
+    is_finished = 0 if tournament_summary['end_date'] is None else 1
+    return is_finished, -tournament_summary['tournament_id']
+
+
+class TournamentSummaryIndex:
+    """
+    Index trié des résumés de tournois, permet de récupérer une page de la liste des tournois à partir d'un curseur
+    sans charger les tournois.
+    """
+
+    def __init__(self, summary_list: List[Dict] | None = None) -> None:
+        self.summary_by_id: Dict[int, Dict] = dict()
+        self.cursors: List[Tuple[int, int]] = list()
+        if summary_list is not None:
+            self.summary_by_id = {summary['tournament_id']: summary for summary in summary_list}
+            self.cursors = sorted(get_summary_cursor(summary) for summary in summary_list)
+
+    def __len__(self) -> int:
+        return len(self.summary_by_id)
+
+    def update(self, tournament_summary: Dict) -> None:
+        """Ajoute ou remplace le résumé d'un tournoi"""
+        previous_summary = self.summary_by_id.get(tournament_summary['tournament_id'])
+        if previous_summary is not None:
+            self.cursors.pop(bisect_left(self.cursors, get_summary_cursor(previous_summary)))
+        self.summary_by_id[tournament_summary['tournament_id']] = tournament_summary
+        insort(self.cursors, get_summary_cursor(tournament_summary))
+
+    def get_page(self, cursor: Tuple | None, nbr_of_entry: int, backward: bool = False) -> List[Dict]:
+        """
+        Retourne les 'nbr_of_entry' résumés suivant le curseur (ou le précédant si 'backward') dans l'ordre de la liste
+        des tournois.
+        """
+        if backward:
+            page_end = len(self.cursors) if cursor is None else bisect_left(self.cursors, tuple(cursor))
+            page_start = max(0, page_end - nbr_of_entry)
+        else:
+            page_start = 0 if cursor is None else bisect_right(self.cursors, tuple(cursor))
+            page_end = page_start + nbr_of_entry
+        return [dict(self.summary_by_id[-negative_id]) for _, negative_id in self.cursors[page_start:page_end]]
@@ -2,12 +2,32 @@ from enum import Enum, auto
 
 SAVE_DIRECTORY = 'data'
 
+# Module de sauvegarde utilisé par l'application : 'tinydb' (un fichier json par base), 'sqlite' ou 'journal'
+DB_BACKEND = 'tinydb'
+SQLITE_FILE_NAME = 'chessmanager'
+# Un journal est compacté lorsque ses lignes obsolètes dépassent ce nombre et cette proportion du fichier
+JOURNAL_COMPACTION_MIN_GARBAGE = 200
+JOURNAL_COMPACTION_RATIO = 0.5
+
 PLAYER_DB_NAME = 'player'
 TOURNAMENT_DB_NAME = 'tournament'
 TURN_DB_NAME = 'turn'
 MATCH_DB_NAME = 'match'
 
 NBR_OF_PLAYER_TO_DISPLAY_BY_PAGE = 10
+NBR_OF_TOURNAMENT_TO_DISPLAY_BY_PAGE = 10
+
+# Nombre maximum d'objets (joueurs, tournois, tours, matchs) conservés en cache par base de donnée
+IDENTITY_MAP_MAX_SIZE = 5000
+
+# Relations d'un tournoi chargées à la demande, à leur premier accès : 'players', 'turn_list' et 'match_list' (les
+# matchs de chaque tour). Les relations absentes sont chargées avec le tournoi.
+LAZY_TOURNAMENT_RELATIONS = ('players', 'turn_list', 'match_list')
+
+# Mesure des événements du messenger (appels, durées, lectures et écritures en base), consultable depuis l'entrée
+# "Debug" du menu principal, absente si la mesure est désactivée. Le rapport json est enregistré dans SAVE_DIRECTORY.
+EVENT_PROFILING = False
+PROFILING_REPORT_FILE_NAME = 'event_profiling'
 
 
 class AppInput(Enum):
@@ -27,6 +47,7 @@ class AppInput(Enum):
     # Turn input
     NEW_TURN = auto()
     LOAD_TURN = auto()
+    LOAD_TURN_LIST = auto()
     NEXT_TURN = auto()
     SAVE_TURN = auto()
     END_TURN = auto()
@@ -39,6 +60,7 @@ class AppInput(Enum):
     # PLayer input
     NEW_PLAYER = auto()
     LOAD_PLAYER = auto()
+    LOAD_PLAYER_LIST = auto()
     ADD_PLAYER = auto()
     PLAYER_FULL_VIEW = auto()
     PLAYER_FLAT_VIEW = auto()
@@ -57,6 +79,13 @@ class AppInput(Enum):
     VIEW_TOURNAMENT_LIST = auto()
     BACK_TO_TOURNAMENT_LIST = auto()
 
+    # Debug input
+    DEBUG_MENU = auto()
+    DEBUG_PROFILING_REPORT = auto()
+    DEBUG_PROFILING_CALL_TREE = auto()
+    DEBUG_SAVE_PROFILING = auto()
+    DEBUG_RESET_PROFILING = auto()
+
     # Main app input
     MAIN_MENU = auto()
     QUIT = auto()